@@ -11,6 +11,7 @@ bl_info = {
 }
 
 import importlib
+import os
 
 import bpy
 
@@ -68,10 +69,30 @@ def register():
     register_handler()
     activate_passive_agent()  # Passive seulement
 
+    try:
+        from ares.tools.operator_catalog import load_operator_catalog
+
+        load_operator_catalog()
+    except Exception as e:  # le catalogue n'est qu'une optimisation/validation
+        log.warning(f"⚠️ Catalogue opérateurs indisponible : {e}")
+
+    # Endpoint de métriques (Prometheus/JSON) sur localhost, si demandé
+    port = os.getenv("BLADE_METRICS_PORT")
+    if port:
+        try:
+            from ares.core.metrics import serve
+
+            serve(int(port))
+        except Exception as e:
+            log.warning(f"⚠️ Endpoint métriques indisponible : {e}")
+
 
 def unregister():
     from ares.agents.agent_passif import deactivate_passive_agent
     from ares.bots.editor_watcher import unregister_handler
+    from ares.core.intent_parser import stop_config_watcher
+    from ares.tools.intent_resolver import clear_exec_plans
+    from ares.tools.operator_catalog import set_operator_catalog
 
     from .ui import (
         ui_codex,
@@ -89,3 +110,17 @@ def unregister():
 
     unregister_handler()
     deactivate_passive_agent()
+    stop_config_watcher()
+    clear_exec_plans()
+    set_operator_catalog(None)
+
+    # Export des métriques de la session (fichier .json ou .prom) + arrêt de l'endpoint
+    from ares.core import metrics
+
+    path = os.getenv("BLADE_METRICS_FILE")
+    if path:
+        try:
+            metrics.write(path)
+        except Exception as e:
+            log.warning(f"⚠️ Export métriques impossible : {e}")
+    metrics.stop_server()
@@ -7,9 +7,8 @@ Charge voice_config.yaml, exÃ©cute les intents et logue les rÃ©sultats
 
 import os
 
-import yaml
-
-from ares.core.intent_parser import parse_intent
+from ares.core.intent_catalog import load_catalog
+from ares.core.intent_parser import parse_intents
 from ares.core.logger import get_logger
 from ares.tools.intent_executor import execute_intent
 
@@ -26,16 +25,14 @@ class IntentTester:
             log.error("âŒ voice_config.yaml introuvable.")
             return
 
-        with open(CONFIG_PATH, encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+        config = load_catalog(CONFIG_PATH).intents
 
-        for intent in config:
-            phrase = intent.get("phrase")
-            if not phrase:
-                continue
+        phrases = [intent.get("phrase") for intent in config if intent.get("phrase")]
+        # Un seul passage de parsing (snapshot config + matching en lot)
+        detected_all = parse_intents(phrases)
 
+        for phrase, detected in zip(phrases, detected_all, strict=True):
             log.info(f"ðŸ§ª Test de la phrase : {phrase}")
-            detected = parse_intent(phrase)
             if not detected:
                 log.warning("âš ï¸ Intent non dÃ©tectÃ©.")
                 self.results.append((phrase, "not_found"))
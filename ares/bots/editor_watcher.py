@@ -9,6 +9,7 @@ import bpy
 
 from ares.agents.agent_passif import PassiveAgent
 from ares.core.logger import get_logger
+from ares.tools import node_cache, object_index
 
 log = get_logger("EditorWatcher")
 handler_registered = False
@@ -23,6 +24,16 @@ def depsgraph_handler(scene, depsgraph):
         id_data = update.id
         if not id_data:
             continue
+        # copies évaluées → données originales (clés des caches)
+        if isinstance(id_data, bpy.types.Material):
+            node_cache.mark_dirty(getattr(id_data, "original", id_data).as_pointer())
+        elif isinstance(id_data, bpy.types.Object):
+            object_index.note_object(getattr(id_data, "original", id_data))
+        elif isinstance(id_data, bpy.types.Scene):
+            object_index.recheck_visibility()
+            object_index.note_membership(scene)
+        elif isinstance(id_data, bpy.types.Collection):
+            object_index.note_membership(scene)  # objets liés / déliés
 
         data_type = type(id_data).__name__
         try:
@@ -37,11 +48,41 @@ def depsgraph_handler(scene, depsgraph):
     log.info("ðŸ“¡ Analyse depsgraph terminÃ©e.")
 
 
+@bpy.app.handlers.persistent
+def reset_caches_handler(*_args):
+    """
+    Undo/redo et chargement de fichier: les structures RNA sont recréées, les nodes
+    (node_cache) et l'index d'objets (object_index) en cache ne sont plus valides.
+    """
+    node_cache.clear()
+    object_index.clear()
+
+
+_RESET_HANDLERS = ("undo_post", "redo_post", "load_post")
+
+
+def _add_reset_handlers():
+    for name in _RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if reset_caches_handler not in handlers:
+            handlers.append(reset_caches_handler)
+
+
+def _remove_reset_handlers():
+    for name in _RESET_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if reset_caches_handler in handlers:
+            handlers.remove(reset_caches_handler)
+
+
 def register():
     global handler_registered
     if not handler_registered:
         bpy.app.handlers.depsgraph_update_post.append(depsgraph_handler)
         handler_registered = True
+        node_cache.set_tracking(True)
+        object_index.set_tracking(True)
+        _add_reset_handlers()
         passive_agent.start()
         log.info("âœ… Handler depsgraph_update enregistrÃ©.")
 
@@ -51,6 +92,9 @@ def unregister():
     if handler_registered:
         bpy.app.handlers.depsgraph_update_post.remove(depsgraph_handler)
         handler_registered = False
+        node_cache.set_tracking(False)
+        object_index.set_tracking(False)
+        _remove_reset_handlers()
         passive_agent.stop()
         log.info("âŒ Handler depsgraph_update supprimÃ©.")
 
@@ -61,6 +105,9 @@ def register_handler():
     if not handler_registered:
         bpy.app.handlers.depsgraph_update_post.append(depsgraph_handler)
         handler_registered = True
+        node_cache.set_tracking(True)
+        object_index.set_tracking(True)
+        _add_reset_handlers()
 
 
 # ?? Optionnel : fonction de nettoyage
@@ -70,3 +117,6 @@ def unregister_handler():
         if depsgraph_handler in bpy.app.handlers.depsgraph_update_post:
             bpy.app.handlers.depsgraph_update_post.remove(depsgraph_handler)
         handler_registered = False
+        node_cache.set_tracking(False)
+        object_index.set_tracking(False)
+        _remove_reset_handlers()
@@ -3,8 +3,8 @@
 import importlib
 import os
 
+from ares.core.intent_catalog import load_catalog
 from ares.core.logger import get_logger
-from ares.tools.utils_yaml import load_yaml
 
 SUMMARY_PATH = os.path.join("summary", "health_check.txt")
 CONFIG_PATH = os.path.join("ares", "config", "voice_config.yaml")
@@ -19,7 +19,9 @@ log = get_logger("HealthCheck")
 
 def check_voice_config_format():
     try:
-        config = load_yaml(CONFIG_PATH)
+        config = load_catalog(CONFIG_PATH).data
+        if config is None:
+            config = []
         if not isinstance(config, list):
             return "âŒ voice_config.yaml n'est pas une liste"
         elif not config:
@@ -3,6 +3,7 @@
 import os
 from datetime import datetime
 
+from ares.core.intent_catalog import read_catalog_data
 from ares.core.logger import get_logger
 from ares.tools.utils_yaml import load_yaml, save_yaml
 
@@ -19,7 +20,7 @@ def inject_intents_into_pending(new_intents: list):
     """
     log.info(f"ðŸ“¥ Injection de {len(new_intents)} intents...")
 
-    existing = load_yaml(VOICE_CONFIG)
+    existing = read_catalog_data(VOICE_CONFIG)
     pending = load_yaml(PENDING_PATH)
 
     if not isinstance(existing, list):
@@ -0,0 +1,199 @@
+# ares/core/config_watcher.py
+"""
+config_watcher.py – Surveillance d'un fichier de config (voice_config.yaml) hors hot path.
+
+- Backend "inotify" (Linux, via ctypes/libc, sans dépendance) sur le dossier parent:
+  capte aussi les remplacements atomiques (écriture tmp + rename)
+- Backend "poll" ailleurs: stat throttlé dans un thread daemon
+- Dans les deux cas, le callback n'est appelé que si le HASH du contenu change
+  (pas de faux positifs sur un simple touch, pas de ratés sur mtime identique/plus ancien)
+
+Le callback est appelé depuis le thread du watcher: il doit rester léger (poser un flag).
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+from collections.abc import Callable
+
+from ares.core.logger import get_logger
+
+log = get_logger("ConfigWatcher")
+
+# Constantes inotify (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+
+def file_digest(path: str) -> str | None:
+    """SHA-1 du contenu, None si le fichier est absent/illisible."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha1(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _stat_signature(path: str) -> tuple[int, int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1  # noqa: B018 – vérifie la présence du symbole
+        return libc
+    except Exception:
+        return None
+
+
+class ConfigWatcher:
+    """
+    Surveille `path` et appelle `on_change(path, digest)` quand son contenu change.
+    backend: "auto" (inotify si dispo, sinon poll) | "inotify" | "poll"
+    """
+
+    def __init__(
+        self,
+        path: str,
+        on_change: Callable[[str, str | None], None],
+        *,
+        interval: float = 0.5,
+        backend: str = "auto",
+    ):
+        self.path = os.path.abspath(path)
+        self.on_change = on_change
+        self.interval = max(0.05, float(interval))
+        self.backend = backend
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._digest = file_digest(self.path)
+        self._sig = _stat_signature(self.path)
+        self._inotify_fd: int | None = None
+
+    # ------------------------------------------------------------------ #
+    # API publique
+    # ------------------------------------------------------------------ #
+    @property
+    def alive(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> ConfigWatcher:
+        if self.alive:
+            return self
+        if self.backend in ("auto", "inotify") and self._init_inotify():
+            self.backend = "inotify"
+            target = self._inotify_loop
+        else:
+            if self.backend == "inotify":
+                log.warning("⚠️ inotify indisponible → fallback poll.")
+            self.backend = "poll"
+            target = self._poll_loop
+        self._stop.clear()
+        self._thread = threading.Thread(target=target, name="BladeConfigWatcher", daemon=True)
+        self._thread.start()
+        log.debug(f"👀 Watcher {self.backend} démarré sur {self.path}")
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=2 * self.interval + 0.5)
+        self._thread = None
+        if self._inotify_fd is not None:
+            try:
+                os.close(self._inotify_fd)
+            except OSError:
+                pass
+            self._inotify_fd = None
+
+    def check_now(self) -> bool:
+        """Compare le hash courant au dernier vu; notifie et retourne True s'il a changé."""
+        digest = file_digest(self.path)
+        if digest == self._digest:
+            return False
+        self._digest = digest
+        try:
+            self.on_change(self.path, digest)
+        except Exception:
+            log.error("❌ Callback de changement de config en erreur.", exc_info=True)
+        return True
+
+    # ------------------------------------------------------------------ #
+    # Backends
+    # ------------------------------------------------------------------ #
+    def _poll_loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            sig = _stat_signature(self.path)
+            if sig != self._sig:
+                self._sig = sig
+                self.check_now()
+
+    def _init_inotify(self) -> bool:
+        libc = _load_libc()
+        if libc is None:
+            return False
+        fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            return False
+        directory = os.path.dirname(self.path).encode(sys.getfilesystemencoding())
+        if libc.inotify_add_watch(fd, directory, _WATCH_MASK) < 0:
+            os.close(fd)
+            return False
+        self._inotify_fd = fd
+        return True
+
+    def _inotify_loop(self) -> None:
+        fd = self._inotify_fd
+        name = os.path.basename(self.path).encode(sys.getfilesystemencoding())
+        while not self._stop.is_set():
+            try:
+                ready, _, _ = select.select([fd], [], [], self.interval)
+            except (OSError, ValueError):
+                break
+            if not ready:
+                continue
+            try:
+                buf = os.read(fd, 64 * 1024)
+            except BlockingIOError:
+                continue
+            except OSError:
+                break
+            if self._touches(buf, name):
+                # Laisse l'écrivain terminer (rafales d'événements) avant de hasher
+                self._stop.wait(0.05)
+                self.check_now()
+
+    @staticmethod
+    def _touches(buf: bytes, name: bytes) -> bool:
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            _wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            ev_name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if ev_name == name:
+                return True
+        return False
@@ -0,0 +1,152 @@
+# ares/core/incremental_matcher.py
+"""
+incremental_matcher.py – Reconnaissance d'intent sur transcriptions partielles (streaming).
+
+- Trie de préfixes par MOTS sur toutes les variantes normalisées du catalogue
+- Chaque nœud connaît les intents encore atteignables sous lui
+- feed(partiel) avance depuis l'état précédent si le partiel prolonge le précédent
+  (sinon repart de la racine) et émet un intent dès que le préfixe est non ambigu:
+    * variante complète reconnue et aucune autre intention ne la prolonge, ou
+    * au moins `min_tokens` mots et un seul intent atteignable
+- Les intents à templates ("passe en {color}") participent à l'ambiguïté via leur
+  préfixe littéral mais ne sont jamais émis tôt (il faut la valeur du slot)
+
+Un seul intent émis par énoncé; reset() à chaque nouvel énoncé.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from ares.core import intent_parser
+from ares.core.logger import get_logger
+
+log = get_logger("IncrementalMatcher")
+
+_TOKEN_SPLIT = re.compile(r"[\s'’\-]+")
+_PLACEHOLDER = re.compile(r"\{\w+\}")
+
+
+def _tokens(text: str) -> list[str]:
+    return [t for t in _TOKEN_SPLIT.split(intent_parser._norm_txt(text)) if t]
+
+
+class _Node:
+    __slots__ = ("children", "terminal", "names")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.terminal: dict[str, Any] | None = None  # intent si une variante finit ici
+        self.names: set[str] = set()  # intents atteignables depuis ce nœud
+
+
+class PrefixTrie:
+    """Trie mot à mot des variantes d'intents (construit une fois par version de config)."""
+
+    def __init__(self, std: list[dict[str, Any]]):
+        self.root = _Node()
+        for s_it in std:
+            name = s_it.get("name")
+            for variant in intent_parser._iter_all_phrases(s_it):
+                self._insert(_tokens(variant), name, s_it)
+            for template in s_it.get("templates") or []:
+                if isinstance(template, str):
+                    literal = _PLACEHOLDER.split(template, maxsplit=1)[0]
+                    self._insert(_tokens(literal), name, None)
+
+    def _insert(self, tokens: list[str], name: str, intent: dict[str, Any] | None) -> None:
+        node = self.root
+        node.names.add(name)
+        for tok in tokens:
+            node = node.children.setdefault(tok, _Node())
+            node.names.add(name)
+        if intent is not None and node.terminal is None:
+            node.terminal = intent  # 1er intent du YAML gagnant (comme l'index exact)
+
+
+class IncrementalMatcher:
+    """
+    État de reconnaissance d'UN énoncé en cours.
+        m = IncrementalMatcher()
+        for partial in stream: intent = m.feed(partial); if intent: ...
+    """
+
+    def __init__(self, trie: PrefixTrie | None = None, *, min_tokens: int = 2):
+        self._shared = trie is None  # trie partagé: rafraîchi à chaque reset (reload config)
+        self.trie = trie or get_prefix_trie()
+        self.min_tokens = max(1, int(min_tokens))
+        self.reset()
+
+    def reset(self) -> None:
+        if self._shared:
+            self.trie = get_prefix_trie()
+        self._tokens: list[str] = []
+        self._node: _Node | None = self.trie.root
+        self.emitted: dict[str, Any] | None = None
+
+    def feed(self, partial: str) -> dict[str, Any] | None:
+        """
+        Avance sur un partiel (texte complet reconnu jusqu'ici).
+        Retourne une copie de l'intent la première fois que le préfixe devient non ambigu.
+        """
+        if self.emitted is not None:
+            return None
+        tokens = _tokens(partial or "")
+        # partiel qui ne prolonge pas le précédent (le SR a corrigé un mot): on repart de zéro
+        if tokens[: len(self._tokens)] != self._tokens:
+            self._tokens, self._node = [], self.trie.root
+        node = self._node
+        for i in range(len(self._tokens), len(tokens)):
+            if node is None:
+                break  # énoncé hors catalogue: plus rien à émettre
+            nxt = node.children.get(tokens[i])
+            if nxt is None and i == len(tokens) - 1:
+                break  # mot en cours de diction: on attend le partiel suivant
+            node = nxt
+            self._tokens.append(tokens[i])
+        self._node = node
+
+        if node is None or len(node.names) != 1:
+            return None
+        if node.terminal is not None and not node.children:
+            hit = node.terminal
+        elif len(self._tokens) >= self.min_tokens:
+            hit = node.terminal or self._unique_terminal(node)
+        else:
+            return None
+        if hit is None:
+            return None
+
+        self.emitted = intent_parser._copy_intent(hit)
+        log.info(f"⚡ Intent émis sur partiel '{partial}': {hit.get('name')}")
+        return self.emitted
+
+    @staticmethod
+    def _unique_terminal(node: _Node) -> dict[str, Any] | None:
+        """Intent d'une variante du sous-arbre (un seul intent atteignable, hors templates)."""
+        stack = [node]
+        while stack:
+            cur = stack.pop()
+            if cur.terminal is not None:
+                return cur.terminal
+            stack.extend(cur.children.values())
+        return None
+
+
+# ---------------------------
+# Trie partagé (par version de config)
+# ---------------------------
+
+_trie: PrefixTrie | None = None
+_trie_version: int = -1
+
+
+def get_prefix_trie() -> PrefixTrie:
+    """Trie du catalogue courant, reconstruit seulement si la config a changé."""
+    global _trie, _trie_version
+    intent_parser.load_intents()
+    if _trie is None or _trie_version != intent_parser._config_version:
+        _trie = PrefixTrie(intent_parser._intent_std)
+        _trie_version = intent_parser._config_version
+    return _trie
@@ -0,0 +1,261 @@
+# ares/core/intent_catalog.py
+"""
+intent_catalog.py – Catalogue d'intents compilé (snapshot binaire du YAML).
+
+- Un seul loader pour voice_config.yaml (parser, voice_config_manager, bots, tester…)
+- Clé = hash SHA-1 du contenu YAML (pas le mtime)
+- Snapshot pickle versionné dans ares/cache/ : intents bruts, intents standardisés
+  (params validés et convertis une fois: param_schema), index phrase normalisée → intent,
+  index phonétique, noms d'intents, intents rejetés
+- Si le catalogue bpy.ops est construit (Blender), les params des intents bpy.ops sont
+  vérifiés contre le schéma RNA; le snapshot retient la version de Blender utilisée
+  (un fichier par schéma: "nobpy" hors Blender, version de Blender sinon)
+- Au démarrage / hot reload: si le snapshot existe pour ce hash → pas de yaml.safe_load
+- Cache mémoire par chemin: un fichier inchangé (mtime_ns + taille) n'est même pas relu
+
+Les objets retournés sont partagés: les appelants doivent les traiter en lecture seule.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+import pickle
+import re
+import sys
+import threading
+from typing import Any
+
+import yaml
+
+from ares.core.logger import get_logger
+
+log = get_logger("IntentCatalog")
+
+# ⚠️ À incrémenter si la structure compilée change (invalide les snapshots existants)
+CATALOG_FORMAT_VERSION = 3
+
+CACHE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "cache"))
+
+# CLoader si libyaml est dispo (beaucoup plus rapide que le loader pur Python)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_memory: dict[str, tuple[tuple[int, int], IntentCatalog]] = {}
+_lock = threading.Lock()
+
+
+class IntentCatalog:
+    """Catalogue compilé d'un fichier voice_config*.yaml."""
+
+    def __init__(
+        self,
+        path: str,
+        digest: str,
+        data: Any,
+        intents: list[dict[str, Any]],
+        std: list[dict[str, Any]],
+        phrase_index: dict[str, dict[str, Any]],
+        phonetic_index: dict[str, dict[str, Any] | None],
+        schema_source: str | None = None,
+    ):
+        self.version = CATALOG_FORMAT_VERSION
+        self.path = path
+        self.digest = digest
+        self.data = data  # contenu YAML brut (tel quel)
+        self.intents = intents  # entrées dict uniquement
+        self.std = std  # intents standardisés (même ordre)
+        self.phrase_index = phrase_index  # phrase normalisée → intent standardisé
+        self.phonetic_index = phonetic_index  # clé phonétique → intent (None si ambiguë)
+        self.names = {it.get("name") for it in intents if it.get("name")}
+        # version de Blender du schéma RNA utilisé pour valider les params (None: sans bpy)
+        self.schema_source = schema_source
+        valid = {it.get("name") for it in std}
+        self.rejected = sorted(n for n in self.names if n not in valid)
+
+    def __len__(self) -> int:
+        return len(self.intents)
+
+
+# ---------------------------
+# Compilation
+# ---------------------------
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _operator_catalog() -> Any:
+    """Catalogue bpy.ops s'il est déjà construit (jamais importé d'ici: core reste sans bpy)."""
+    module = sys.modules.get("ares.tools.operator_catalog")
+    return module.get_operator_catalog() if module is not None else None
+
+
+def _schema_source() -> str | None:
+    op_catalog = _operator_catalog()
+    return op_catalog.version if op_catalog is not None else None
+
+
+def _compile(path: str, digest: str, raw: bytes) -> IntentCatalog:
+    # import local: intent_parser importe ce module
+    from ares.core.intent_parser import _build_phonetic_index, _build_phrase_index
+
+    data = yaml.load(raw.decode("utf-8-sig"), Loader=_YamlLoader)
+    if isinstance(data, list):
+        intents = [d for d in data if isinstance(d, dict)]
+    else:
+        log.warning(f"⚠️ {os.path.basename(path)} ne contient pas une liste d'intents.")
+        intents = []
+    op_catalog = _operator_catalog()
+    std, phrase_index = _build_phrase_index(intents, op_catalog)
+    cat = IntentCatalog(
+        path,
+        digest,
+        data,
+        intents,
+        std,
+        phrase_index,
+        _build_phonetic_index(std),
+        op_catalog.version if op_catalog is not None else None,
+    )
+    if cat.rejected:
+        log.error(f"❌ {len(cat.rejected)} intent(s) rejeté(s) (params invalides): {cat.rejected}")
+    return cat
+
+
+# ---------------------------
+# Snapshot disque
+# ---------------------------
+
+
+def _schema_tag(source: str | None) -> str:
+    """Étiquette de fichier du schéma: "nobpy" (CLI, tests) ou version de Blender assainie."""
+    return "nobpy" if source is None else re.sub(r"[^\w\-]+", "_", source)
+
+
+def _snapshot_path(path: str, digest: str, source: str | None) -> str:
+    base = os.path.splitext(os.path.basename(path))[0]
+    name = f"{base}.{digest[:16]}.{_schema_tag(source)}.v{CATALOG_FORMAT_VERSION}.pickle"
+    return os.path.join(CACHE_DIR, name)
+
+
+def _read_snapshot(path: str, digest: str) -> IntentCatalog | None:
+    snap = _snapshot_path(path, digest, _schema_source())
+    if not os.path.exists(snap):
+        return None
+    try:
+        with open(snap, "rb") as f:
+            cat = pickle.load(f)
+        if (
+            isinstance(cat, IntentCatalog)
+            and cat.version == CATALOG_FORMAT_VERSION
+            and cat.digest == digest
+            and cat.schema_source == _schema_source()
+        ):
+            cat.path = path
+            return cat
+        log.debug(f"Snapshot ignoré (version/hash différents): {snap}")
+    except Exception as e:
+        log.warning(f"⚠️ Snapshot catalogue illisible ({snap}): {e}")
+    return None
+
+
+def _write_snapshot(cat: IntentCatalog) -> None:
+    snap = _snapshot_path(cat.path, cat.digest, cat.schema_source)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{snap}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(cat, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snap)
+    except Exception as e:
+        log.warning(f"⚠️ Écriture du snapshot catalogue impossible: {e}")
+        return
+
+    # Nettoyage des anciens snapshots du même fichier ET du même schéma
+    # (Blender et outils sans bpy gardent chacun le leur)
+    base = os.path.splitext(os.path.basename(cat.path))[0]
+    tag = _schema_tag(cat.schema_source)
+    for old in glob.glob(os.path.join(CACHE_DIR, f"{base}.*.pickle")):
+        parts = os.path.basename(old)[len(base) + 1 :].split(".")
+        if old != snap and (len(parts) != 4 or parts[1] == tag):  # != 4: ancien format
+            try:
+                os.remove(old)
+            except OSError:
+                pass
+
+
+# ---------------------------
+# Public API
+# ---------------------------
+
+
+def load_catalog(path: str, *, force: bool = False, rehash: bool = False) -> IntentCatalog:
+    """
+    Retourne le catalogue compilé de `path`.
+    Ordre: cache mémoire (stat inchangé) → snapshot disque (même hash) → parse YAML + snapshot.
+    rehash=True ignore le raccourci stat (changement signalé par le watcher: même taille
+    et même mtime possibles, ex: cp -p, git checkout) et relit le fichier pour le hash.
+    Lève OSError / yaml.YAMLError comme une lecture YAML classique.
+    """
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    sig = (st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        entry = _memory.get(key)
+        source = _schema_source()
+        if entry and entry[0] == sig and entry[1].schema_source == source and not (force or rehash):
+            return entry[1]
+
+    with open(key, "rb") as f:
+        raw = f.read()
+    digest = _digest(raw)
+
+    with _lock:
+        entry = _memory.get(key)
+        if entry and entry[1].digest == digest and entry[1].schema_source == source and not force:
+            _memory[key] = (sig, entry[1])  # contenu identique: on garde le même objet
+            return entry[1]
+
+    cat = None if force else _read_snapshot(key, digest)
+    if cat is None:
+        cat = _compile(key, digest, raw)
+        _write_snapshot(cat)
+        log.info(f"🧱 Catalogue compilé ({len(cat)} intents) depuis {key}")
+    else:
+        log.debug(f"Catalogue chargé depuis le snapshot ({len(cat)} intents)")
+
+    with _lock:
+        _memory[key] = (sig, cat)
+    return cat
+
+
+def read_catalog_data(path: str, default: Any = None) -> Any:
+    """
+    Contenu YAML brut via le catalogue compilé.
+    Remplace load_yaml()/yaml.safe_load() pour voice_config: `default` si absent/illisible.
+    """
+    if default is None:
+        default = []
+    try:
+        data = load_catalog(path).data
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        log.error(f"❌ Erreur de chargement du catalogue '{path}': {e}")
+        return default
+    return data if data is not None else default
+
+
+def forget_catalog(path: str) -> None:
+    """Retire un catalogue du cache mémoire (ex: shard d'une langue qui n'est plus active)."""
+    with _lock:
+        _memory.pop(os.path.abspath(path), None)
+
+
+def clear_memory_cache() -> None:
+    """Oublie les catalogues en mémoire (les snapshots disque restent valides)."""
+    with _lock:
+        _memory.clear()
@@ -8,13 +8,23 @@ Avec fallback NLP si aucun match exact trouvé.
 from __future__ import annotations
 
 import difflib
+import heapq
 import os
+import sys
+import threading
+import time
 import unicodedata
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 
-import yaml
-
+from ares.core import metrics
+from ares.core.intent_catalog import forget_catalog, load_catalog
 from ares.core.logger import get_logger
+from ares.core.param_schema import ParamSchemaError, coerce_params
+from ares.core.phonetic import phonetic_key
+from ares.core.segmenter import split_utterance
+from ares.core.slots import SlotMatcher, compile_slots
 
 # ⚙️ Respect de la structure validée: ares/config/voice_config.yaml
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "voice_config.yaml")
@@ -22,9 +32,52 @@ CONFIG_PATH = os.path.normpath(CONFIG_PATH)
 
 log = get_logger("IntentParser")
 
-# Cache en mémoire + mtime pour reload auto
+# Catalogues par langue (générés par scripts/generate_voice_config.py):
+#   voice_config_<lang>.yaml si présent pour la langue active, sinon voice_config.yaml.
+#   Seul le shard actif reste en mémoire (index, moteur NLP, catalogue compilé).
+_language: str | None = None
+_active_path: str | None = None  # shard résolu (None = à résoudre au prochain reload)
+_loaded_path: str | None = None  # fichier du catalogue actuellement en mémoire
+
+# Cache en mémoire (rechargé sur notification du ConfigWatcher, pas de stat par appel)
 _intent_cache: list[dict[str, Any]] | None = None
-_intent_cache_mtime: float | None = None
+_catalog_digest: str | None = None
+
+# Surveillance du YAML hors hot path (inotify / poll dans un thread daemon)
+#   - le watcher ne fait que poser _config_dirty; le reload a lieu au prochain load_intents()
+#   - sans watcher actif: stat throttlé à STAT_POLL_INTERVAL secondes
+USE_CONFIG_WATCHER = True
+STAT_POLL_INTERVAL = 1.0
+_watcher: Any = None
+_watcher_config: str | None = None
+_config_dirty = False
+_last_stat_check = 0.0
+
+# Index précompilé (reconstruit à chaque reload du YAML)
+#   - _intent_std   : intents déjà standardisés (même ordre que _intent_cache)
+#   - _phrase_index : phrase normalisée → intent standardisé (1er intent gagnant)
+#   - _phonetic_index : clé phonétique → intent standardisé (None si clé ambiguë)
+#   - _slot_matcher : regex compilée des intents à templates ("mets en {color}")
+#   - _nlp_intents  : intents sans templates (le fuzzy ne sait pas remplir les slots)
+_intent_std: list[dict[str, Any]] = []
+_phrase_index: dict[str, dict[str, Any]] = {}
+_phonetic_index: dict[str, dict[str, Any] | None] = {}
+_slot_matcher: SlotMatcher | None = None
+_nlp_intents: list[dict[str, Any]] = []
+
+# Clés phonétiques trop courtes = trop de collisions (ex: "ok", "oui")
+PHONETIC_MIN_KEY = 3
+
+# Version de config: incrémentée à chaque reload/invalidation (clé du cache de résultats)
+_config_version: int = 0
+
+# Cache LRU des résultats de parse: (phrase normalisée, version config) → intent | None
+PARSE_CACHE_SIZE = 256
+_MISS = object()
+_parse_cache: OrderedDict[tuple[str, int], dict[str, Any] | None] = OrderedDict()
+_parse_cache_lock = threading.Lock()
+_parse_cache_hits = 0
+_parse_cache_misses = 0
 
 
 # ---------------------------
@@ -53,51 +106,235 @@ def _norm_txt(s: str) -> str:
 # ---------------------------
 
 
-def _read_yaml(path: str) -> list[dict[str, Any]]:
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not isinstance(data, list):
-        log.warning("⚠️ Le fichier voice_config.yaml ne contient pas une liste d'intents.")
+def load_intents(force_reload: bool = False) -> list[dict[str, Any]]:
+    """
+    Charge ou retourne en cache les intents YAML.
+    Reload automatique quand le contenu du fichier change (hash), signalé par le
+    ConfigWatcher: le chemin chaud ne fait aucun appel système.
+    Lecture via le catalogue compilé (snapshot binaire clé sur le hash du YAML):
+    un contenu identique ne provoque ni parse YAML ni invalidation des caches.
+    """
+    global _intent_cache, _intent_std, _phrase_index, _phonetic_index, _catalog_digest
+    global _slot_matcher, _nlp_intents, _config_dirty, _last_stat_check, _loaded_path
+
+    if not force_reload and _intent_cache is not None and not _config_dirty:
+        watcher = _ensure_watcher()
+        if watcher is not None and watcher.alive:
+            return _intent_cache
+        now = time.monotonic()
+        if now - _last_stat_check < STAT_POLL_INTERVAL:
+            return _intent_cache
+        _last_stat_check = now
+
+    dirty, _config_dirty = _config_dirty, False
+    path = _resolve_config_path()
+    try:
+        # changement signalé (watcher / langue): relecture du hash, pas de raccourci stat
+        catalog = load_catalog(path, force=force_reload, rehash=dirty)
+    except Exception as e:
+        log.error(f"❌ Erreur de lecture YAML '{path}': {e}")
         return []
-    return [d for d in data if isinstance(d, dict)]
+    if _loaded_path is not None and _loaded_path != path:
+        forget_catalog(_loaded_path)  # un seul shard en mémoire
+    _loaded_path = path
+
+    if force_reload or _intent_cache is None or catalog.digest != _catalog_digest:
+        _intent_cache = catalog.intents
+        _intent_std, _phrase_index = catalog.std, catalog.phrase_index
+        _phonetic_index = catalog.phonetic_index
+        # NLP sur les intents compilés (params déjà convertis, intents rejetés exclus)
+        _slot_matcher, _nlp_intents = _build_slot_stage(catalog.std, catalog.std)
+        _catalog_digest = catalog.digest
+        _bump_config_version()
+        log.info(f"🔄 Intents rechargés ({len(catalog)}) depuis {path}")
+    _ensure_watcher()
 
+    return _intent_cache or []
 
-def load_intents(force_reload: bool = False) -> list[dict[str, Any]]:
+
+# ---------------------------
+# Langue / shard actif
+# ---------------------------
+
+
+def normalize_language(lang: str | None) -> str | None:
+    """Code langue court: 'fr-FR' / 'fr_FR' / 'FR' → 'fr' (None si vide)."""
+    if not lang or not str(lang).strip():
+        return None
+    return str(lang).strip().replace("_", "-").split("-", 1)[0].lower()
+
+
+def _shard_path(lang: str) -> str:
+    base, ext = os.path.splitext(CONFIG_PATH)
+    return f"{base}_{lang}{ext}"
+
+
+def _resolve_config_path() -> str:
+    """Shard de la langue active s'il existe, sinon le voice_config.yaml fusionné."""
+    global _active_path
+    path = CONFIG_PATH
+    if _language:
+        shard = _shard_path(_language)
+        if os.path.exists(shard):
+            path = shard
+        else:
+            log.debug(f"Pas de shard '{_language}' ({shard}) → {CONFIG_PATH}")
+    _active_path = path
+    return path
+
+
+def set_language(lang: str | None) -> None:
     """
-    Charge ou retourne en cache les intents YAML.
-    Reload automatique si le fichier a changé sur disque.
+    Route le parsing vers le catalogue de la langue `lang` (ex: langue du SR 'fr-FR').
+    Chargement paresseux: le shard est lu au prochain load_intents().
     """
-    global _intent_cache, _intent_cache_mtime
+    global _language, _active_path, _config_dirty
+    code = normalize_language(lang)
+    if code == _language:
+        return
+    _language = code
+    _active_path = None
+    _config_dirty = True
+    log.info(f"🌐 Langue des intents: {code or 'défaut'}")
+
+
+def get_language() -> str | None:
+    return _language
+
 
+# ---------------------------
+# Surveillance du fichier de config
+# ---------------------------
+
+
+def _on_config_changed(path: str, digest: str | None) -> None:
+    """Callback du watcher (thread daemon): marque la config à recharger."""
+    global _config_dirty
+    if digest != _catalog_digest:
+        _config_dirty = True
+        log.debug(f"✏️ Config modifiée sur disque: {path}")
+
+
+def _ensure_watcher() -> Any:
+    """Démarre (ou redémarre si le shard actif a changé) le watcher; None si désactivé."""
+    global _watcher, _watcher_config
+    if not USE_CONFIG_WATCHER:
+        return None
+    path = _active_path or CONFIG_PATH
+    if _watcher is not None and _watcher_config == path:
+        return _watcher
+    stop_config_watcher()
     try:
-        mtime = os.path.getmtime(CONFIG_PATH)
+        from ares.core.config_watcher import ConfigWatcher
+
+        _watcher = ConfigWatcher(path, _on_config_changed).start()
+        _watcher_config = path
     except Exception as e:
-        log.error(f"❌ Impossible d'accéder à '{CONFIG_PATH}': {e}")
-        return []
+        log.warning(f"⚠️ Watcher de config indisponible ({e}) → stat throttlé.")
+        _watcher = None
+    return _watcher
 
-    if (
-        force_reload
-        or _intent_cache is None
-        or _intent_cache_mtime is None
-        or mtime > _intent_cache_mtime
-    ):
-        try:
-            intents = _read_yaml(CONFIG_PATH)
-            _intent_cache = intents
-            _intent_cache_mtime = mtime
-            log.info(f"🔄 Intents rechargés ({len(intents)}) depuis {CONFIG_PATH}")
-        except Exception as e:
-            log.error(f"❌ Erreur de lecture YAML: {e}")
-            return []
 
-    return _intent_cache or []
+def stop_config_watcher() -> None:
+    """Arrête le thread de surveillance (unregister de l'addon / tests)."""
+    global _watcher
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
+
+
+def _bump_config_version() -> None:
+    """Nouvelle version de config: vide le cache de résultats et le moteur NLP."""
+    global _config_version
+    _config_version += 1
+    clear_parse_cache()
+    _invalidate_nlp_engine()
+    _invalidate_exec_plans()
+
+
+def _invalidate_exec_plans() -> None:
+    """Plans d'exécution du resolver (opérateur résolu, chemin pré-découpé) liés au catalogue.
+    Seulement s'il est déjà chargé: l'importer ici tirerait bpy."""
+    resolver = sys.modules.get("ares.tools.intent_resolver")
+    if resolver is not None:
+        resolver.clear_exec_plans()
+
+
+def _invalidate_nlp_engine() -> None:
+    """Le moteur NLP (n-grammes / vecteurs spaCy) est lié au catalogue: on le jette au reload."""
+    try:
+        from ares.tools import nlp_intent_matcher as nlp
+
+        nlp.invalidate_engine()
+    except Exception:
+        pass
 
 
 def invalidate_cache() -> None:
     """Force un rechargement au prochain appel de load_intents()."""
-    global _intent_cache, _intent_cache_mtime
+    global _intent_cache, _intent_std, _phrase_index, _phonetic_index, _catalog_digest
+    global _slot_matcher, _nlp_intents, _config_dirty, _active_path
     _intent_cache = None
-    _intent_cache_mtime = None
+    _active_path = None
+    _config_dirty = False
+    _catalog_digest = None
+    _intent_std = []
+    _phrase_index = {}
+    _phonetic_index = {}
+    _slot_matcher = None
+    _nlp_intents = []
+    _bump_config_version()
+
+
+# ---------------------------
+# Cache LRU des résultats
+# ---------------------------
+
+
+def _parse_cache_get(key: tuple[str, int]) -> Any:
+    global _parse_cache_hits, _parse_cache_misses
+    with _parse_cache_lock:
+        value = _parse_cache.get(key, _MISS)
+        if value is _MISS:
+            _parse_cache_misses += 1
+        else:
+            _parse_cache_hits += 1
+            _parse_cache.move_to_end(key)
+        return value
+
+
+def _parse_cache_put(key: tuple[str, int], value: dict[str, Any] | None) -> None:
+    if key[1] != _config_version:
+        return  # résultat calculé sur une config périmée
+    with _parse_cache_lock:
+        _parse_cache[key] = value
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_SIZE:
+            _parse_cache.popitem(last=False)
+
+
+def clear_parse_cache() -> None:
+    """Vide le cache de résultats (les compteurs hit/miss sont conservés)."""
+    with _parse_cache_lock:
+        _parse_cache.clear()
+
+
+def cache_stats() -> dict[str, Any]:
+    """Statistiques du cache de résultats de parse_intent()."""
+    with _parse_cache_lock:
+        total = _parse_cache_hits + _parse_cache_misses
+        return {
+            "hits": _parse_cache_hits,
+            "misses": _parse_cache_misses,
+            "hit_rate": (_parse_cache_hits / total) if total else 0.0,
+            "size": len(_parse_cache),
+            "maxsize": PARSE_CACHE_SIZE,
+            "config_version": _config_version,
+            "language": _language,
+        }
+
+
+metrics.register_cache("parse", cache_stats)
 
 
 # ---------------------------
@@ -147,12 +384,141 @@ def _standardize_intent(raw: dict[str, Any]) -> dict[str, Any]:
     return result
 
 
-def _exact_match(phrase_norm: str, intents: list[dict[str, Any]]) -> dict[str, Any] | None:
+def _build_phrase_index(
+    intents: list[dict[str, Any]], op_catalog: Any = None
+) -> tuple[list[dict[str, Any]], dict[str, dict[str, Any]]]:
+    """
+    Précompile les intents une seule fois par reload:
+    - liste des intents standardisés (même ordre que le YAML), params validés/convertis
+      (param_schema; schéma RNA de l'opérateur si `op_catalog` est fourni)
+    - index phrase normalisée → intent standardisé
+    En cas de doublon, le premier intent du YAML gagne (même règle que l'ancien scan linéaire).
+    Un intent aux params invalides est rejeté (absent de la liste et de l'index).
+    """
+    std: list[dict[str, Any]] = []
+    index: dict[str, dict[str, Any]] = {}
     for it in intents:
+        s_it = _standardize_intent(it)
+        try:
+            s_it["params"] = coerce_params(s_it, _op_props(op_catalog, s_it.get("operator")))
+        except ParamSchemaError as e:
+            log.error(f"❌ Intent '{s_it['name']}' rejeté au chargement: {e}")
+            continue
+        std.append(s_it)
         for variant in _iter_all_phrases(it):
-            if _norm_txt(variant) == phrase_norm:
-                return _standardize_intent(it)
-    return None
+            index.setdefault(_norm_txt(variant), s_it)
+    return std, index
+
+
+def _op_props(op_catalog: Any, operator: Any) -> dict[str, dict[str, Any]] | None:
+    """Schéma RNA des params d'un intent bpy.ops (None: context/data ou catalogue absent)."""
+    if op_catalog is None or not isinstance(operator, str):
+        return None
+    op = operator[len("bpy.ops.") :] if operator.startswith("bpy.ops.") else operator
+    if op.startswith(("context.", "data.", "bpy.")) or op.count(".") != 1:
+        return None
+    return op_catalog.schema(op)
+
+
+def _build_phonetic_index(
+    std: list[dict[str, Any]],
+) -> dict[str, dict[str, Any] | None]:
+    """
+    Index clé phonétique → intent standardisé, sur toutes les variantes.
+    Une clé partagée par deux intents différents est marquée ambiguë (None):
+    le lookup la saute et laisse la main au fuzzy.
+    """
+    index: dict[str, dict[str, Any] | None] = {}
+    for s_it in std:
+        for variant in _iter_all_phrases(s_it):
+            key = phonetic_key(variant)
+            if len(key) < PHONETIC_MIN_KEY:
+                continue
+            prev = index.get(key, s_it)
+            if prev is not None and prev.get("name") != s_it.get("name"):
+                index[key] = None
+            elif key not in index:
+                index[key] = s_it
+    return index
+
+
+def _build_slot_stage(
+    intents: list[dict[str, Any]], std: list[dict[str, Any]]
+) -> tuple[SlotMatcher | None, list[dict[str, Any]]]:
+    """
+    Compile les intents à templates en un SlotMatcher et renvoie la liste des intents
+    restants pour le NLP (même objet que `intents` s'il n'y a aucun template).
+    """
+    try:
+        matcher = compile_slots(std)
+    except Exception as e:
+        log.error(f"❌ Templates de slots invalides: {e}")
+        matcher = None
+    if not any("templates" in it for it in intents):
+        return matcher, intents
+    return matcher, [it for it in intents if "templates" not in it]
+
+
+def _copy_intent(intent: dict[str, Any]) -> dict[str, Any]:
+    """Copie défensive: l'appelant peut muter l'intent/params sans polluer l'index."""
+    out = dict(intent)
+    out["params"] = dict(intent.get("params") or {})
+    return out
+
+
+def _exact_lookup(
+    phrase_norm: str, intents: list[dict[str, Any]] | None = None
+) -> dict[str, Any] | None:
+    """
+    Lookup O(1) dans l'index précompilé (retourne l'entrée indexée, sans copie).
+    Si une liste d'intents différente du cache est fournie, on indexe cette liste à la volée.
+    """
+    if intents is None or intents is _intent_cache:
+        return _phrase_index.get(phrase_norm)
+    _, index = _build_phrase_index(intents)
+    return index.get(phrase_norm)
+
+
+def _exact_match(
+    phrase_norm: str, intents: list[dict[str, Any]] | None = None
+) -> dict[str, Any] | None:
+    hit = _exact_lookup(phrase_norm, intents)
+    return _copy_intent(hit) if hit is not None else None
+
+
+def _slot_fill(phrase: str, intents: list[dict[str, Any]] | None = None) -> dict[str, Any] | None:
+    """Match d'un template à slots: nouvel intent avec params remplis (déjà une copie)."""
+    if intents is None or intents is _intent_cache:
+        matcher = _slot_matcher
+    else:
+        matcher, _ = _build_slot_stage(intents, _build_phrase_index(intents)[0])
+    if matcher is None:
+        return None
+    try:
+        return matcher.fill(phrase)
+    except Exception as e:
+        log.warning(f"⚠️ Slots non convertibles pour '{phrase}': {e}")
+        return None
+
+
+def _nlp_pool(intents: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Intents candidats du NLP/fuzzy: sans les intents à templates."""
+    if intents is _intent_cache:
+        return _nlp_intents
+    return [it for it in intents if "templates" not in it]
+
+
+def _phonetic_lookup(
+    phrase: str, intents: list[dict[str, Any]] | None = None
+) -> dict[str, Any] | None:
+    """Lookup O(1) par clé phonétique (transcriptions "sfer", "a joute"…), sans copie."""
+    key = phonetic_key(phrase)
+    if len(key) < PHONETIC_MIN_KEY:
+        return None
+    if intents is None or intents is _intent_cache:
+        return _phonetic_index.get(key)
+    std, _ = _build_phrase_index(intents)
+    return _build_phonetic_index(std).get(key)
 
 
 def _fuzzy_match_fallback(
@@ -162,26 +528,50 @@ def _fuzzy_match_fallback(
     Fallback fuzzy local (difflib) si module NLP indisponible.
     Retourne (intent, score[0..1])
     """
-    candidates: list[tuple[str, dict[str, Any]]] = []
+    # clé normalisée → intent (1er gagnant): pas de second scan après get_close_matches
+    candidates: dict[str, dict[str, Any]] = {}
     for it in intents:
         for variant in _iter_all_phrases(it):
-            candidates.append((_norm_txt(variant), it))
+            candidates.setdefault(_norm_txt(variant), it)
 
     if not candidates:
         return None, 0.0
 
     phrase_n = _norm_txt(phrase)
-    keys = [k for (k, _) in candidates]
-    best = difflib.get_close_matches(phrase_n, keys, n=1, cutoff=0.6)
+    best = difflib.get_close_matches(phrase_n, candidates, n=1, cutoff=0.6)
     if not best:
         return None, 0.0
 
     best_key = best[0]
-    for k, it in candidates:
-        if k == best_key:
-            return _standardize_intent(it), difflib.SequenceMatcher(None, phrase_n, k).ratio()
+    return (
+        _standardize_intent(candidates[best_key]),
+        difflib.SequenceMatcher(None, phrase_n, best_key).ratio(),
+    )
 
-    return None, 0.0
+
+def _fuzzy_breakdown_fallback(
+    phrase: str, intents: list[dict[str, Any]]
+) -> tuple[list[float], list[float]]:
+    """Scores difflib par intent (sans boost couleur) si le module NLP est indisponible."""
+    phrase_n = _norm_txt(phrase)
+    fuzzy = []
+    for it in intents:
+        best = 0.0
+        for variant in _iter_all_phrases(it):
+            best = max(best, difflib.SequenceMatcher(None, phrase_n, _norm_txt(variant)).ratio())
+        fuzzy.append(best)
+    return fuzzy, [0.0] * len(intents)
+
+
+def _score_breakdown(phrase: str, intents: list[dict[str, Any]]) -> tuple[list[float], list[float]]:
+    """(fuzzy, boost couleur) par intent, alignés sur `intents` – NLP si dispo, sinon difflib."""
+    try:
+        from ares.tools import nlp_intent_matcher as nlp
+
+        return nlp.score_breakdown(phrase, intents)
+    except Exception as e:
+        log.debug(f"Breakdown NLP indisponible → fallback difflib: {e}")
+        return _fuzzy_breakdown_fallback(phrase, intents)
 
 
 def _nlp_match(phrase: str, intents: list[dict[str, Any]]) -> tuple[dict[str, Any] | None, float]:
@@ -204,6 +594,24 @@ def _nlp_match(phrase: str, intents: list[dict[str, Any]]) -> tuple[dict[str, An
         return _fuzzy_match_fallback(phrase, intents)
 
 
+def _nlp_match_batch(
+    phrases: list[str], intents: list[dict[str, Any]]
+) -> list[tuple[dict[str, Any] | None, float]]:
+    """Version lot de _nlp_match(): un seul appel au matcher pour toutes les phrases."""
+    try:
+        from ares.tools import nlp_intent_matcher as nlp
+
+        matches = nlp.match_batch(phrases, intents)
+    except Exception as e:
+        log.warning(f"⚠️ NLP matcher (lot) indisponible/erreur → fallback difflib: {e}")
+        return [_fuzzy_match_fallback(p, intents) for p in phrases]
+
+    return [
+        (_standardize_intent(best) if best else None, float(score or 0.0))
+        for best, score in matches
+    ]
+
+
 # ---------------------------
 # Public API
 # ---------------------------
@@ -214,7 +622,9 @@ def parse_intent(phrase: str) -> dict[str, Any] | None:
     Reçoit une phrase, retourne l'intent correspondant si trouvé.
     Priorités:
       1) Matching exact (phrases/aliases normalisés, sans accents)
-      2) Matching NLP (ou fuzzy fallback)
+      2) Templates à slots typés (params remplis depuis la phrase)
+      3) Matching phonétique (clé précalculée, robuste aux fautes du speech-to-text)
+      4) Matching NLP (ou fuzzy fallback)
     """
     if not phrase or not str(phrase).strip():
         log.warning("🛑 Phrase vide reçue.")
@@ -223,24 +633,204 @@ def parse_intent(phrase: str) -> dict[str, Any] | None:
     phrase_clean = _norm_txt(phrase)
     intents = load_intents()
 
+    # 0️⃣ Cache LRU (phrase normalisée + version de config)
+    key = (phrase_clean, _config_version)
+    cached = _parse_cache_get(key)
+    if cached is not _MISS:
+        log.debug(f"⚡ Intent en cache: {cached.get('name') if cached else None} ('{phrase}')")
+        return _copy_intent(cached) if cached else None
+
     # 1️⃣ Matching exact
-    exact = _exact_match(phrase_clean, intents)
-    if exact:
+    exact = _exact_lookup(phrase_clean, intents)
+    if exact is not None:
         log.info(f"✅ Intent trouvé (exact): {exact.get('name')} pour phrase '{phrase}'")
-        return exact
+        _parse_cache_put(key, exact)
+        return _copy_intent(exact)
 
-    # 2️⃣ Matching NLP / fuzzy
-    best_intent, score = _nlp_match(phrase, intents)
+    # 2️⃣ Templates à slots
+    filled = _slot_fill(phrase, intents)
+    if filled is not None:
+        log.info(
+            f"🧩 Intent trouvé (slots {filled['slots']}): {filled.get('name')} pour '{phrase}'"
+        )
+        _parse_cache_put(key, filled)
+        return _copy_intent(filled)
+
+    # 3️⃣ Matching phonétique
+    phonetic = _phonetic_lookup(phrase, intents)
+    if phonetic is not None:
+        log.info(f"🔊 Intent trouvé (phonétique): {phonetic.get('name')} pour phrase '{phrase}'")
+        _parse_cache_put(key, phonetic)
+        return _copy_intent(phonetic)
+
+    # 4️⃣ Matching NLP / fuzzy
+    t0 = time.perf_counter_ns()
+    best_intent, score = _nlp_match(phrase, _nlp_pool(intents))
+    metrics.observe("nlp", time.perf_counter_ns() - t0)
+    _parse_cache_put(key, best_intent)
     if best_intent:
         log.info(
             f"🤖 Intent trouvé (NLP/Fuzzy {score:.2f}): {best_intent.get('name')} pour phrase '{phrase}'"
         )
-        return best_intent
+        return _copy_intent(best_intent)
 
     log.warning(f"❓ Aucun intent trouvé pour la phrase: '{phrase}' (score max {score:.2f})")
     return None
 
 
+def parse_intents(phrases: Iterable[str]) -> list[dict[str, Any] | None]:
+    """
+    Version lot de parse_intent(), alignée sur `phrases` (None si aucun intent).
+    - un seul snapshot de la config (un seul load_intents)
+    - normalisation de toutes les phrases en une passe, matching exact, slots puis phonétique
+    - les phrases restantes sont scorées ensemble par le matcher NLP (un seul appel)
+    Les logs par phrase passent en DEBUG; un seul résumé en INFO.
+    """
+    phrases = [str(p) if p is not None else "" for p in phrases]
+    results: list[dict[str, Any] | None] = [None] * len(phrases)
+    if not phrases:
+        return results
+
+    intents = load_intents()
+    version = _config_version
+    pending: list[int] = []
+    exact_count = slot_count = phonetic_count = 0
+    for i, phrase in enumerate(phrases):
+        if not phrase.strip():
+            continue
+        phrase_clean = _norm_txt(phrase)
+        cached = _parse_cache_get((phrase_clean, version))
+        if cached is not _MISS:
+            results[i] = _copy_intent(cached) if cached else None
+            continue
+        hit = _exact_lookup(phrase_clean, intents)
+        if hit is not None:
+            exact_count += 1
+        else:
+            hit = _slot_fill(phrase, intents)
+            slot_count += hit is not None
+        if hit is None:
+            hit = _phonetic_lookup(phrase, intents)
+            phonetic_count += hit is not None
+        if hit is not None:
+            _parse_cache_put((phrase_clean, version), hit)
+            results[i] = _copy_intent(hit)
+        else:
+            pending.append(i)
+
+    if pending and intents:
+        t0 = time.perf_counter_ns()
+        matches = _nlp_match_batch([phrases[i] for i in pending], _nlp_pool(intents))
+        metrics.observe("nlp", time.perf_counter_ns() - t0)
+        for i, (best, score) in zip(pending, matches, strict=True):
+            _parse_cache_put((_norm_txt(phrases[i]), version), best)
+            results[i] = _copy_intent(best) if best else None
+            log.debug(
+                f"Lot: '{phrases[i]}' → {best.get('name') if best else None} (score {score:.2f})"
+            )
+
+    found = sum(1 for r in results if r)
+    log.info(
+        f"📦 parse_intents: {found}/{len(phrases)} intents trouvés "
+        f"(exact={exact_count}, slots={slot_count}, phonétique={phonetic_count}, "
+        f"nlp+cache={found - exact_count - slot_count - phonetic_count})"
+    )
+    return results
+
+
+def parse_utterance(phrase: str) -> list[dict[str, Any] | None]:
+    """
+    Énoncé potentiellement multi-commandes ("ajoute un cube et mets-le en rouge").
+    - phrase entière connue (exact / slots) → un seul intent
+    - sinon découpage (et, puis, ensuite, virgules…) et matching de TOUS les segments
+      en un seul appel parse_intents()
+    Retour aligné sur les segments (None pour un segment non reconnu).
+    """
+    segments = split_utterance(phrase)
+    if len(segments) <= 1:
+        return [parse_intent(phrase)]
+
+    intents = load_intents()
+    whole = _exact_lookup(_norm_txt(phrase), intents)
+    if whole is not None:
+        return [_copy_intent(whole)]
+    filled = _slot_fill(phrase, intents)
+    if filled is not None:
+        return [filled]
+
+    log.info(f"✂️ Énoncé découpé en {len(segments)} commandes: {segments}")
+    return parse_intents(segments)
+
+
+def match_top_k(phrase: str, k: int = 5, threshold: float = 0.0) -> list[dict[str, Any]]:
+    """
+    Classe les k meilleurs intents pour une phrase, en une seule passe de scoring.
+    Retour (du meilleur au moins bon):
+      [{
+        "intent": dict (standardisé, copie),
+        "name": str,
+        "score": float,                       # 1.0 si match exact/slots, sinon fuzzy + boost
+        "scores": {"exact": float, "fuzzy": float, "color_boost": float},
+      }, ...]
+    Sélection via un tas borné (heapq.nlargest) – pas de tri complet du catalogue.
+    """
+    if k <= 0 or not phrase or not str(phrase).strip():
+        return []
+
+    intents = load_intents()
+    if not intents:
+        return []
+
+    if intents is _intent_cache:
+        std, index = _intent_std, _phrase_index
+    else:
+        std, index = _build_phrase_index(intents)
+    exact_hit = index.get(_norm_txt(phrase))
+    filled = None if exact_hit is not None else _slot_fill(phrase, intents)
+    if filled is not None:
+        # le template gagnant compte comme un match exact (params remplis)
+        exact_hit = next((s_it for s_it in std if s_it.get("name") == filled.get("name")), None)
+    # scoring sur le pool NLP de parse_intent (mêmes objets que `std`, même liste → moteur
+    # NLP réutilisé), réaligné sur `std`; les templates restent à 0
+    pool = _nlp_intents if intents is _intent_cache else [s for s in std if "templates" not in s]
+    pool_fuzzy, pool_boost = _score_breakdown(phrase, pool)
+    fuzzy, boost = [0.0] * len(std), [0.0] * len(std)
+    position = {id(s_it): i for i, s_it in enumerate(std)}
+    for j, s_it in enumerate(pool):
+        i = position.get(id(s_it))
+        if i is not None:
+            fuzzy[i], boost[i] = pool_fuzzy[j], pool_boost[j]
+
+    def _total(i: int) -> float:
+        if std[i] is exact_hit:
+            return 1.0
+        if "templates" in std[i]:
+            return 0.0  # un template sans slots remplis n'est pas exécutable
+        return min(1.0, fuzzy[i] + boost[i])
+
+    top = heapq.nlargest(k, range(len(std)), key=lambda i: (_total(i), -i))
+
+    ranked: list[dict[str, Any]] = []
+    for i in top:
+        score = _total(i)
+        if score <= 0.0 or score < threshold:
+            break
+        hit = std[i] is exact_hit
+        ranked.append(
+            {
+                "intent": _copy_intent(filled if hit and filled is not None else std[i]),
+                "name": std[i].get("name"),
+                "score": score,
+                "scores": {
+                    "exact": 1.0 if hit else 0.0,
+                    "fuzzy": fuzzy[i],
+                    "color_boost": boost[i],
+                },
+            }
+        )
+    return ranked
+
+
 # ---------------------------
 # Dev helpers
 # ---------------------------
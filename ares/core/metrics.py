@@ -0,0 +1,277 @@
+# ares/core/metrics.py
+"""
+metrics.py – Métriques de la pipeline (latences par étape, compteurs, caches).
+
+- Histogrammes type HDR: buckets log-linéaires (128 sous-buckets par puissance de 2,
+  erreur relative < 1%), mémoire bornée, p50/p99 sans garder les échantillons
+- Latences en ns: parse, nlp, enrich, inject, execute, voice_to_action (bout en bout)
+- Compteurs: étape finale des exécutions (resolver, fallback_ops, fallback_direct, bulk,
+  failed…), taux de hit des caches enregistrés (register_cache)
+- Export: JSON ou texte Prometheus, vers un fichier (write) ou un endpoint localhost
+  (serve: GET /metrics, /metrics.json), activable via BLADE_METRICS_PORT au register
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ares.core.logger import get_logger
+
+log = get_logger("Metrics")
+
+PREFIX = "blade"
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+# étapes d'ExecResult regroupées dans "execute"
+_EXEC_STAGES = ("select", "resolve", "fallback", "bulk")
+
+
+# ---------------------------
+# Histogramme HDR (simplifié)
+# ---------------------------
+
+_SUB_BITS = 7
+_SUB = 1 << _SUB_BITS  # valeurs < 128 exactes
+_HALF = _SUB >> 1
+
+
+def _bucket(value: int) -> int:
+    if value < _SUB:
+        return value
+    shift = value.bit_length() - _SUB_BITS
+    return _SUB + (shift - 1) * _HALF + ((value >> shift) - _HALF)
+
+
+def _bucket_bounds(index: int) -> tuple[int, int]:
+    """[bas, haut] des valeurs du bucket `index`."""
+    if index < _SUB:
+        return index, index
+    shift, mantissa = divmod(index - _SUB, _HALF)
+    shift += 1
+    low = (mantissa + _HALF) << shift
+    return low, low + (1 << shift) - 1
+
+
+class Histogram:
+    """Compte par bucket log-linéaire (dict creux) + count/sum/min/max exacts."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        value = max(0, int(value))
+        index = _bucket(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def value_at(self, quantile: float) -> int:
+        """Valeur au quantile (0..1), borne haute du bucket (≤ max)."""
+        if not self.count:
+            return 0
+        rank = max(1, int(quantile * self.count + 0.999999))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return max(self.min, min(self.max, _bucket_bounds(index)[1]))
+        return self.max
+
+
+# ---------------------------
+# Registre
+# ---------------------------
+
+_lock = threading.Lock()
+_histograms: dict[tuple[str, str], Histogram] = {}  # (nom, étape) → histogramme
+_counters: dict[tuple[str, str], int] = {}  # (nom, étape) → compteur
+_caches: dict[str, Callable[[], dict[str, Any]]] = {}
+
+
+def observe(stage: str, ns: int, name: str = "latency") -> None:
+    """Enregistre une durée (ns) pour `stage`."""
+    with _lock:
+        hist = _histograms.get((name, stage))
+        if hist is None:
+            hist = _histograms[(name, stage)] = Histogram()
+        hist.record(ns)
+
+
+def inc(stage: str, n: int = 1, name: str = "executions") -> None:
+    with _lock:
+        _counters[(name, stage)] = _counters.get((name, stage), 0) + n
+
+
+def register_cache(cache: str, stats: Callable[[], dict[str, Any]]) -> None:
+    """`stats()` → {"hits": int, "misses": int, ...} lu à chaque export."""
+    _caches[cache] = stats
+
+
+def observe_result(res: Any, total_ns: int | None = None) -> None:
+    """Latences par étape d'un ExecResult (tools.exec_result) + compteur d'étape finale."""
+    timings = res.timings
+    for stage in ("parse", "enrich", "inject"):
+        if stage in timings:
+            observe(stage, timings[stage])
+    execute = sum(timings.get(s, 0) for s in _EXEC_STAGES)
+    if execute:
+        observe("execute", execute)
+    if total_ns is not None:
+        observe("voice_to_action", total_ns)
+    inc(res.stage or "unknown")
+
+
+def reset() -> None:
+    with _lock:
+        _histograms.clear()
+        _counters.clear()
+
+
+# ---------------------------
+# Export
+# ---------------------------
+
+
+def _cache_stats() -> dict[str, dict[str, Any]]:
+    out = {}
+    for cache, stats in list(_caches.items()):
+        try:
+            data = stats()
+            hits, misses = int(data.get("hits", 0)), int(data.get("misses", 0))
+        except Exception as e:  # une source en erreur ne casse pas l'export
+            log.debug(f"Stats du cache '{cache}' indisponibles: {e}")
+            continue
+        total = hits + misses
+        out[cache] = {"hits": hits, "misses": misses, "hit_rate": hits / total if total else 0.0}
+    return out
+
+
+def snapshot() -> dict[str, Any]:
+    """Vue cohérente des métriques (durées en ms)."""
+    with _lock:
+        histograms: dict[str, dict[str, Any]] = {}
+        for (name, stage), hist in sorted(_histograms.items()):
+            entry = {
+                "count": hist.count,
+                "sum_ms": hist.total / 1e6,
+                "min_ms": hist.min / 1e6,
+                "max_ms": hist.max / 1e6,
+            }
+            for q in QUANTILES:
+                entry[f"p{q * 100:g}_ms"] = hist.value_at(q) / 1e6
+            histograms.setdefault(name, {})[stage] = entry
+        counters: dict[str, dict[str, int]] = {}
+        for (name, stage), value in sorted(_counters.items()):
+            counters.setdefault(name, {})[stage] = value
+    return {"histograms": histograms, "counters": counters, "caches": _cache_stats()}
+
+
+def to_json(indent: int | None = 2) -> str:
+    return json.dumps(snapshot(), indent=indent, ensure_ascii=False)
+
+
+def to_prometheus() -> str:
+    """Format texte Prometheus 0.0.4 (histogrammes exportés en summary, en secondes)."""
+    lines: list[str] = []
+    with _lock:
+        by_name: dict[str, list[tuple[str, Histogram]]] = {}
+        for (name, stage), hist in sorted(_histograms.items()):
+            by_name.setdefault(name, []).append((stage, hist))
+        for name, items in by_name.items():
+            metric = f"{PREFIX}_{name}_seconds"
+            lines.append(f"# TYPE {metric} summary")
+            for stage, hist in items:
+                for q in QUANTILES:
+                    value = hist.value_at(q) / 1e9
+                    lines.append(f'{metric}{{stage="{stage}",quantile="{q:g}"}} {value:.9g}')
+                lines.append(f'{metric}_sum{{stage="{stage}"}} {hist.total / 1e9:.9g}')
+                lines.append(f'{metric}_count{{stage="{stage}"}} {hist.count}')
+        counters: dict[str, list[tuple[str, int]]] = {}
+        for (name, stage), value in sorted(_counters.items()):
+            counters.setdefault(name, []).append((stage, value))
+    for name, items in counters.items():
+        metric = f"{PREFIX}_{name}_total"
+        lines.append(f"# TYPE {metric} counter")
+        lines.extend(f'{metric}{{stage="{stage}"}} {value}' for stage, value in items)
+
+    caches = _cache_stats()
+    for field, kind in (("hits", "counter"), ("misses", "counter"), ("hit_rate", "gauge")):
+        metric = f"{PREFIX}_cache_{field}" + ("_total" if kind == "counter" else "")
+        if caches:
+            lines.append(f"# TYPE {metric} {kind}")
+        lines.extend(f'{metric}{{cache="{c}"}} {s[field]:g}' for c, s in caches.items())
+    return "\n".join(lines) + "\n"
+
+
+def write(path: str, fmt: str | None = None) -> str:
+    """Écrit les métriques dans `path` (fmt "json" | "prometheus", sinon selon l'extension)."""
+    fmt = fmt or ("json" if path.endswith(".json") else "prometheus")
+    text = to_json() if fmt == "json" else to_prometheus()
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+    return path
+
+
+# ---------------------------
+# Endpoint HTTP (localhost)
+# ---------------------------
+
+_server: ThreadingHTTPServer | None = None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self) -> None:  # noqa: N802 (API http.server)
+        if self.path == "/metrics":
+            body, ctype = to_prometheus(), "text/plain; version=0.0.4; charset=utf-8"
+        elif self.path == "/metrics.json":
+            body, ctype = to_json(), "application/json; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:  # pas de bruit sur stderr
+        pass
+
+
+def serve(port: int = 9464, host: str = "127.0.0.1") -> int:
+    """Démarre l'endpoint (thread daemon); retourne le port effectif (port=0 → libre)."""
+    global _server
+    if _server is not None:
+        return _server.server_address[1]
+    _server = ThreadingHTTPServer((host, port), _Handler)
+    _server.daemon_threads = True
+    threading.Thread(target=_server.serve_forever, name="BladeMetrics", daemon=True).start()
+    port = _server.server_address[1]
+    log.info(f"📈 Métriques exposées sur http://{host}:{port}/metrics")
+    return port
+
+
+def stop_server() -> None:
+    global _server
+    if _server is not None:
+        _server.shutdown()
+        _server.server_close()
+        _server = None
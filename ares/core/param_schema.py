@@ -0,0 +1,148 @@
+# ares/core/param_schema.py
+"""
+param_schema.py – Validation + coercition des `params` d'un intent, une fois au chargement.
+
+Schéma d'un paramètre, par ordre de priorité:
+  1) déclaré dans le YAML:  schema: { value: color, location: vector, type: [SUBSURF, MIRROR] }
+     types: color | vector | float | int | bool | str, ou liste = enum
+  2) introspecté: propriétés RNA de l'opérateur (catalogue bpy.ops, si construit)
+  3) déduit: normalize: color → value est une couleur; liste de nombres → vecteur
+
+Sortie (stockée dans l'intent compilé): couleurs en tuple RGBA de floats, vecteurs en
+tuples, nombres/booléens typés, enums vérifiés. Les placeholders de slots ("{color}",
+"{axis.vector}") sont laissés tels quels (remplis à l'exécution).
+Une entrée invalide lève ParamSchemaError: le catalogue la rejette au chargement.
+"""
+
+from __future__ import annotations
+
+import re
+from numbers import Number
+from typing import Any
+
+from ares.core.slots import COLOR_ALIASES, COLOR_PALETTE
+
+_PLACEHOLDER = re.compile(r"\{\w+(?:\.\w+)?\}")
+
+# types RNA (catalogue d'opérateurs) → types du schéma
+_RNA_TYPES = {"FLOAT": "float", "INT": "int", "BOOLEAN": "bool", "STRING": "str"}
+
+
+class ParamSchemaError(ValueError):
+    """Paramètre d'intent invalide pour son schéma."""
+
+
+def _is_seq(value: Any) -> bool:
+    return isinstance(value, (list, tuple))
+
+
+def _to_float(value: Any, key: str) -> float:
+    if isinstance(value, bool) or not isinstance(value, Number):
+        raise ParamSchemaError(f"'{key}': nombre attendu, reçu {value!r}")
+    return float(value)
+
+
+def to_color(value: Any, key: str = "value") -> tuple[float, float, float, float]:
+    """Nom de la palette, RGB ou RGBA → tuple RGBA de floats."""
+    if isinstance(value, str):
+        name = COLOR_ALIASES.get(value.lower(), value.lower())
+        if name not in COLOR_PALETTE:
+            raise ParamSchemaError(f"'{key}': couleur inconnue {value!r}")
+        value = COLOR_PALETTE[name]
+    if not _is_seq(value) or len(value) not in (3, 4):
+        raise ParamSchemaError(f"'{key}': couleur RGB/RGBA attendue, reçu {value!r}")
+    rgba = tuple(_to_float(v, key) for v in value)
+    return rgba if len(rgba) == 4 else (*rgba, 1.0)
+
+
+def _coerce(key: str, value: Any, spec: Any) -> Any:
+    """Valeur convertie selon `spec` (nom de type, liste d'enum ou schéma RNA dict)."""
+    if isinstance(spec, dict):  # schéma RNA du catalogue d'opérateurs
+        return _coerce_rna(key, value, spec)
+    if _is_seq(spec):
+        if value not in spec:
+            raise ParamSchemaError(f"'{key}': {value!r} hors enum {list(spec)}")
+        return value
+    if spec == "color":
+        return to_color(value, key)
+    if spec == "vector":
+        if not _is_seq(value):
+            raise ParamSchemaError(f"'{key}': vecteur attendu, reçu {value!r}")
+        return tuple(_to_float(v, key) for v in value)
+    if spec == "float":
+        return _to_float(value, key)
+    if spec == "int":
+        if isinstance(value, bool) or not isinstance(value, Number) or int(value) != value:
+            raise ParamSchemaError(f"'{key}': entier attendu, reçu {value!r}")
+        return int(value)
+    if spec == "bool":
+        if not isinstance(value, (bool, int)):
+            raise ParamSchemaError(f"'{key}': booléen attendu, reçu {value!r}")
+        return bool(value)
+    if spec == "str":
+        return str(value)
+    raise ParamSchemaError(f"'{key}': type de schéma inconnu {spec!r}")
+
+
+def _coerce_rna(key: str, value: Any, spec: dict[str, Any]) -> Any:
+    kind = spec.get("type")
+    if kind == "ENUM":
+        items = spec.get("enum") or []
+        chosen = list(value) if spec.get("flag") and _is_seq(value) else [value]
+        bad = [c for c in chosen if items and c not in items]
+        if bad:
+            raise ParamSchemaError(f"'{key}': {bad} hors enum {items}")
+        return set(chosen) if spec.get("flag") else value
+    simple = _RNA_TYPES.get(kind)
+    if simple is None:  # POINTER / COLLECTION: laissé tel quel
+        return value
+    length = spec.get("array")
+    if length:
+        if not _is_seq(value) or len(value) != length:
+            raise ParamSchemaError(f"'{key}': {length} composantes attendues, reçu {value!r}")
+        return tuple(_coerce(key, v, simple) for v in value)
+    return _coerce(key, value, simple)
+
+
+def _is_placeholder(value: Any) -> bool:
+    return isinstance(value, str) and _PLACEHOLDER.search(value) is not None
+
+
+def coerce_params(
+    intent: dict[str, Any], op_props: dict[str, dict[str, Any]] | None = None
+) -> dict[str, Any]:
+    """
+    Params de `intent` validés et convertis (nouveau dict; l'intent n'est pas modifié).
+    `op_props`: schéma RNA de l'opérateur ({prop: schéma}, catalogue bpy.ops) si connu.
+    """
+    params = intent.get("params") or {}
+    if not isinstance(params, dict):
+        raise ParamSchemaError(f"params doit être un dict, reçu {type(params).__name__}")
+    declared = intent.get("schema") or {}
+    if not isinstance(declared, dict):
+        raise ParamSchemaError("schema doit être un dict {param: type}")
+
+    out: dict[str, Any] = {}
+    for key, value in params.items():
+        if _is_placeholder(value) or value is None:
+            out[key] = value
+            continue
+        if key in declared:
+            spec = declared[key]
+        elif op_props is not None:
+            if key not in op_props:
+                raise ParamSchemaError(
+                    f"paramètre inconnu '{key}' pour {intent.get('operator')}"
+                    f" (attendus: {', '.join(sorted(op_props))})"
+                )
+            spec = op_props[key]
+        elif key == "value" and params.get("normalize") == "color":
+            spec = "color"
+        elif _is_seq(value) and value and all(isinstance(v, Number) for v in value):
+            out[key] = tuple(value)  # vecteur: types d'éléments conservés
+            continue
+        else:
+            out[key] = value
+            continue
+        out[key] = _coerce(key, value, spec)
+    return out
@@ -0,0 +1,81 @@
+# ares/core/phonetic.py
+"""
+phonetic.py – Clé phonétique française (Soundex/Phonex simplifié) pour le matching vocal.
+
+Objectif: rendre identiques des transcriptions qui "sonnent" pareil
+  "ajoute une sphère" / "a joute une sfer" / "ajouter une sphere" → même clé
+
+- encodage par mot (règles graphie → son), puis concaténation sans séparateur
+  (absorbe les coupures de mots du speech-to-text: "a joute" == "ajoute")
+- articles ignorés (un/une/le/la/les/des/du/de…)
+- sans dépendance externe: re + unicodedata
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+
+# Articles / liaisons souvent mal transcrits ou omis par le speech-to-text
+ARTICLES = {"un", "une", "le", "la", "les", "l", "des", "du", "de", "d"}
+
+# Règles appliquées dans l'ordre sur chaque mot (minuscule, sans accents).
+# Les majuscules sont des codes de son internes (jamais produits par l'entrée).
+_RULES: list[tuple[re.Pattern[str], str]] = [
+    (re.compile(p), r)
+    for p, r in (
+        (r"[^a-z0-9]", ""),
+        (r"ph", "f"),
+        (r"th", "t"),
+        (r"rh", "r"),
+        (r"s?ch|sh", "X"),  # son "ch"
+        (r"x", "ks"),
+        (r"qu|q|ck", "k"),
+        (r"c(?=[eiy])", "s"),
+        (r"c", "k"),
+        (r"g(?=[eiy])", "j"),
+        (r"gu(?=[eiy])", "g"),
+        (r"gn", "N"),
+        (r"w", "v"),
+        (r"z", "s"),
+        (r"e?au", "O"),
+        (r"ou", "U"),
+        (r"oi", "Wa"),
+        (r"[ae][nm](?=[^aeiouy]|$)", "A"),  # an/en/am/em
+        (r"o[nm](?=[^aeiouy]|$)", "Q"),  # on/om
+        (r"(?:ai|ei|i|u|y)[nm](?=[^aeiouy]|$)", "I"),  # in/ain/ein/un
+        (r"ai|ei|ay|ey", "E"),
+        (r"y", "i"),
+        (r"h", ""),
+        (r"o", "O"),
+    )
+]
+_DOUBLES = re.compile(r"([a-zA-Z])\1+")  # lettres seulement: "100" != "10"
+# Lettres finales muettes (après les règles): pluriels, consonnes finales, e/é final
+_SILENT_FINAL = re.compile(r"(?<=.)(?:[sxtdp]|e|E)+$")
+
+
+def _strip_accents(s: str) -> str:
+    return "".join(c for c in unicodedata.normalize("NFKD", s) if not unicodedata.combining(c))
+
+
+def encode_word(word: str) -> str:
+    """Clé phonétique d'un mot (chaîne vide si rien de prononçable)."""
+    w = _strip_accents(word.lower())
+    if len(w) >= 6 and w[-2:] in ("er", "ez"):
+        w = w[:-2] + "e"  # ajouter / ajoutez / ajoute → même terminaison
+    for pattern, repl in _RULES:
+        w = pattern.sub(repl, w)
+    w = _DOUBLES.sub(r"\1", w)
+    return _SILENT_FINAL.sub("", w)
+
+
+def phonetic_key(text: str) -> str:
+    """
+    Clé phonétique d'une phrase: mots encodés puis concaténés (articles ignorés).
+    "Ajoute une sphère" → "ajUsfer"
+    """
+    if not isinstance(text, str):
+        text = str(text)
+    words = re.split(r"[\s'’\-]+", _strip_accents(text.lower()))
+    return "".join(encode_word(w) for w in words if w and w not in ARTICLES)
@@ -1,6 +1,8 @@
 # ares/core/pipeline_manager.py
 from __future__ import annotations
 
+from collections.abc import Callable
+from time import perf_counter_ns
 from typing import Any
 
 from ares.core.logger import get_logger
@@ -8,6 +10,7 @@ from ares.pipelines.base import PipelineBase
 from ares.pipelines.default import DefaultPipeline
 from ares.pipelines.material import MaterialPipeline
 from ares.pipelines.render import RenderPipeline
+from ares.tools.exec_result import ExecResult, to_result
 
 log = get_logger("PipelineManager")
 
@@ -30,15 +33,29 @@ class PipelineManager:
                 log.warning(f"Match échoué sur {pipe.name}: {e}")
         return DefaultPipeline()
 
-    def run(self, intent: dict[str, Any]) -> bool:
+    def run(
+        self,
+        intent: dict[str, Any],
+        *,
+        on_retry_done: Callable[[ExecResult], None] | None = None,
+    ) -> ExecResult:
+        t0 = perf_counter_ns()
         pipe = self.select(intent)
+        select_ns = perf_counter_ns() - t0
         log.info(f"▶️ Pipeline sélectionnée: {pipe.name}")
-        return pipe.run(intent)
+        outcome = pipe.run(intent, on_retry_done=on_retry_done)
+        res = to_result(outcome, intent.get("name") or pipe.name)
+        res.add_timing("select", select_ns)
+        return res
 
 
 # singleton simple
 _manager = PipelineManager()
 
 
-def run_with_manager(intent: dict[str, Any]) -> bool:
-    return _manager.run(intent)
+def run_with_manager(
+    intent: dict[str, Any],
+    *,
+    on_retry_done: Callable[[ExecResult], None] | None = None,
+) -> ExecResult:
+    return _manager.run(intent, on_retry_done=on_retry_done)
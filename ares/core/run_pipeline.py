@@ -6,8 +6,11 @@ import time
 import traceback
 from typing import Any
 
-from ares.core.intent_parser import parse_intent
+from ares.core import metrics
+from ares.core.intent_parser import parse_utterance
 from ares.core.logger import get_logger
+from ares.core.segmenter import split_utterance
+from ares.tools.exec_result import ExecResult, record, to_result
 
 # Bots (optionnels) : on protège les imports pour ne jamais bloquer la pipeline.
 try:
@@ -28,9 +31,10 @@ except Exception:  # pragma: no cover
 
 # Fallback direct si le manager est indisponible
 try:
-    from ares.tools.intent_executor import execute_intent  # type: ignore
+    from ares.tools.intent_executor import execute_batch, execute_intent  # type: ignore
 except Exception:  # pragma: no cover
     execute_intent = None  # type: ignore
+    execute_batch = None  # type: ignore
 
 log = get_logger("RunPipeline")
 
@@ -48,7 +52,9 @@ def main(
     Lance la pipeline principale Blade.
 
     Étapes :
-      1) Parse la phrase (ou utilise `preparsed_intent` si fourni)
+      1) Parse la phrase (ou utilise `preparsed_intent` si fourni); un énoncé
+         multi-commandes ("… et … puis …") part en lot via execute_batch, ou n'est pas
+         exécuté du tout si l'un de ses segments n'est pas reconnu
       2) Enrichit le log (si bot dispo)
       3) Injecte l'intent dans les "pending" si nouveau (si bot dispo & allow_injection)
       4) Exécute l'intent (sauf en dry_run), via Pipeline Manager si dispo, sinon fallback direct.
@@ -62,10 +68,16 @@ def main(
         use_pipeline_manager: True pour router via Pipeline Manager si dispo
 
     Returns:
-        bool: True si tout s'est bien passé (ou si dry_run a réussi), False sinon.
+        bool: True si tout s'est bien passé (ou si dry_run a réussi), False sinon
+        (y compris un retry différé encore en attente: son issue est loguée et
+        enregistrée à la fin du retry).
+        Le détail (ExecResult: étape, erreur, timings ns de parse → exécution) est
+        conservé dans l'historique de tools.exec_result.
     """
     t0 = time.perf_counter()
     log.info("🚀 Lancement de la pipeline Blade…")
+    res = ExecResult("pipeline")
+    t = time.perf_counter_ns()
 
     # ---------------------------
     # 1) Résolution de l'intent
@@ -75,38 +87,52 @@ def main(
     if preparsed_intent is not None:
         if not isinstance(preparsed_intent, dict):
             log.error("❌ 'preparsed_intent' doit être un dict.")
-            return False
+            return _failed(res, "preparsed_intent invalide")
         intent = dict(preparsed_intent)  # shallow copy
         log.info("🧩 Intent pré-parsé reçu (bypass parse_intent).")
 
     else:
         if not phrase or not str(phrase).strip():
             log.warning("🛑 Aucune phrase reçue.")
-            return False
+            return _failed(res, "aucune phrase")
 
         log.info(f"🗣️ Phrase reçue : {phrase}")
         try:
-            intent = parse_intent(phrase)
+            intents = parse_utterance(phrase)
         except Exception as e:
             log.error(f"❌ Exception pendant parse_intent : {e}")
             log.debug("".join(traceback.format_exc()))
-            intent = None
+            intents = []
+        t = res.lap("parse", t)
+
+        if len(intents) > 1:
+            return _run_multi(
+                intents,
+                phrase=phrase,
+                mode=mode,
+                allow_injection=allow_injection,
+                dry_run=dry_run,
+                t0=t0,
+                pre=res,
+            )
+        intent = intents[0] if intents else None
 
     if not intent:
         log.warning("❓ Aucun intent détecté.")
-        return False
+        return _failed(res, "aucun intent")
 
     # Standardisation minimale (sécurité)
     intent.setdefault("name", intent.get("id") or "intent_sans_nom")
     intent.setdefault("params", intent.get("params", {}) or {})
     name = intent.get("name")
     operator = intent.get("operator")
+    res.name = name
 
     log.info(f"🎯 Intent détecté : {name} | operator={operator}")
 
-    if not operator:
+    if not operator and not intent.get("bulk"):
         log.error("❌ Intent sans opérateur : exécution impossible.")
-        return False
+        return _failed(res, "intent sans opérateur")
 
     # ---------------------------
     # 2) Enrichissement du log
@@ -120,6 +146,7 @@ def main(
     except Exception as e:  # ne doit pas casser la pipeline
         log.warning(f"⚠️ Échec enrichissement log : {e}")
         log.debug("".join(traceback.format_exc()))
+    t = res.lap("enrich", t)
 
     # ---------------------------
     # 3) Injection en pending
@@ -136,6 +163,7 @@ def main(
     except Exception as e:  # ne doit pas casser la pipeline
         log.warning(f"⚠️ Échec injection pending : {e}")
         log.debug("".join(traceback.format_exc()))
+    res.lap("inject", t)
 
     # ---------------------------
     # 4) Exécution
@@ -145,19 +173,40 @@ def main(
         log.info(
             f"🧪 Dry-run activé : exécution sautée (parse/log/injection uniquement). ({dt:.1f} ms)"
         )
+        res.update(ok=True, stage="dry_run", message="dry_run")
+        _record(res, t0)
         return True
 
+    first: list[ExecResult] = []  # 1er passage, complété par le retry différé
+
+    def _on_retry_done(final: ExecResult) -> None:
+        if first:
+            final.merge_timings(first[0])
+        _record(final, t0)
+        if final:
+            log.info(f"✅ '{name}' exécuté après retry différé ({final.stage}).")
+        else:
+            log.error(f"❌ Échec de '{name}' après retry différé : {final.error}")
+
     try:
         # Route via Pipeline Manager si demandé et disponible, sinon fallback direct.
         if use_pipeline_manager and run_with_manager is not None:
-            success = run_with_manager(intent)
+            outcome = run_with_manager(intent, on_retry_done=_on_retry_done)
         else:
             if execute_intent is None:
                 log.error("❌ Aucun exécuteur disponible (ni Pipeline Manager, ni execute_intent).")
-                return False
-            success = execute_intent(intent)
+                return _failed(res, "aucun exécuteur")
+            outcome = execute_intent(intent, on_retry_done=_on_retry_done)
 
-        if not success:
+        result = to_result(outcome, name)
+        result.merge_timings(res)
+        if result.stage == "retry_scheduled":
+            # en attente: ni échec ni métrique ici, _on_retry_done enregistre l'issue
+            first.append(result)
+            log.info(f"⏳ '{name}' : échec transitoire, retry différé en cours.")
+            return False
+        _record(result, t0)
+        if not result:
             log.error("❌ Échec lors de l'exécution de l'intent.")
             return False
 
@@ -168,7 +217,100 @@ def main(
     except Exception as e:
         log.error(f"💥 Exception dans run_pipeline lors de l'exécution : {e}")
         log.debug("".join(traceback.format_exc()))
-        return False
+        return _failed(res, "exception", f"{type(e).__name__}: {e}")
+
+
+def _record(res: ExecResult, t0: float | None = None) -> None:
+    """Historique (tools.exec_result) + métriques; t0 → latence voix → action."""
+    record(res)
+    total_ns = int((time.perf_counter() - t0) * 1e9) if t0 is not None else None
+    metrics.observe_result(res, total_ns)
+
+
+def _failed(res: ExecResult, message: str, error: str | None = None) -> bool:
+    """Enregistre l'échec de la pipeline (historique, compteur "failed"); retour de main()."""
+    res.update(ok=False, stage="failed", message=message, error=error)
+    _record(res)
+    return False
+
+
+def _run_multi(
+    intents: list[dict[str, Any] | None],
+    *,
+    phrase: str,
+    mode: str,
+    allow_injection: bool,
+    dry_run: bool,
+    t0: float,
+    pre: ExecResult,
+) -> bool:
+    """
+    Énoncé multi-commandes: bots sur chaque intent puis UNE exécution en lot transactionnelle
+    (arrêt au premier échec: les commandes suivantes dépendent souvent des précédentes;
+    le lot entier est alors annulé, un seul pas d'undo sinon).
+    Un segment non reconnu invalide tout l'énoncé AVANT exécution (rien n'est modifié).
+    Timings communs (parse, bots) de `pre` imputés au premier résultat du lot.
+    """
+    missing = [i for i, it in enumerate(intents) if not it]
+    if missing:
+        segments = split_utterance(phrase)
+        unknown = [segments[i] if i < len(segments) else f"#{i + 1}" for i in missing]
+        log.warning(
+            f"❓ {len(missing)}/{len(intents)} segment(s) sans intent {unknown} : "
+            "lot non exécuté."
+        )
+        return _failed(pre, "segment(s) sans intent", ", ".join(unknown))
+    found = [dict(it) for it in intents]
+
+    pre.name = "lot"
+    t = time.perf_counter_ns()
+
+    for intent in found:
+        intent.setdefault("name", intent.get("id") or "intent_sans_nom")
+        intent.setdefault("params", intent.get("params", {}) or {})
+        try:
+            if enrich_log is not None:
+                enrich_log(intent, mode=mode)
+        except Exception as e:  # ne doit pas casser la pipeline
+            log.warning(f"⚠️ Échec enrichissement log : {e}")
+    t = pre.lap("enrich", t)
+    try:
+        if allow_injection and inject_intents_into_pending is not None:
+            inject_intents_into_pending(found)
+    except Exception as e:  # ne doit pas casser la pipeline
+        log.warning(f"⚠️ Échec injection pending : {e}")
+    pre.lap("inject", t)
+
+    log.info(f"🎯 Lot détecté : {[it['name'] for it in found]}")
+    if dry_run:
+        log.info("🧪 Dry-run activé : exécution du lot sautée.")
+        pre.update(ok=True, stage="dry_run", message="dry_run")
+        _record(pre, t0)
+        return True
+    if execute_batch is None:
+        log.error("❌ Aucun exécuteur de lot disponible (execute_batch).")
+        return _failed(pre, "aucun exécuteur")
+
+    try:
+        # un seul pas d'undo pour l'énoncé, annulé en entier si un segment échoue
+        label = "Blade: " + " + ".join(it["name"] for it in found)
+        summary = execute_batch(found, stop_on_error=True, transactional=True, label=label)
+    except Exception as e:
+        log.error(f"💥 Exception dans run_pipeline lors de l'exécution du lot : {e}")
+        log.debug("".join(traceback.format_exc()))
+        return _failed(pre, "exception", f"{type(e).__name__}: {e}")
+
+    details = [to_result(d) for d in summary.get("details") or []]
+    if details:
+        details[0].merge_timings(pre)
+    for result in details:
+        _record(result)
+    dt = (time.perf_counter() - t0) * 1000.0
+    metrics.observe("voice_to_action", int(dt * 1e6))
+    ok = summary.get("failed", 1) == 0 and summary.get("success") == len(found)
+    icon = "✅" if ok else "❌"
+    log.info(f"{icon} Lot terminé ({summary.get('success')}/{len(found)} intents) ({dt:.1f} ms)")
+    return ok
 
 
 # Alias historique si d'autres modules appellent run_pipeline(text)
@@ -0,0 +1,31 @@
+# ares/core/segmenter.py
+"""
+segmenter.py – Découpe un énoncé multi-commandes en segments exécutables.
+
+  "ajoute un cube et mets-le en rouge puis rends l'image"
+      → ["ajoute un cube", "mets-le en rouge", "rends l'image"]
+
+Séparateurs: ponctuation (, ; .) et enchaîneurs (et, puis, ensuite, et puis,
+et ensuite, après ça/cela, et après). Le parser vérifie d'abord que la phrase
+entière n'est pas déjà une commande connue avant d'utiliser ce découpage.
+"""
+
+from __future__ import annotations
+
+import re
+
+_SEQUENCER = r"(?:puis|ensuite|apr[eè]s\s+(?:ça|ca|cela))"
+_SEPARATORS = re.compile(
+    rf"\s*[,;.]\s+(?:(?:et\s+)?{_SEQUENCER}\s+)?"  # "2,5" / "1.5" ne sont pas coupés
+    rf"|\s+(?:et\s+)?{_SEQUENCER}\s+"
+    r"|\s+et\s+",
+    re.IGNORECASE,
+)
+
+
+def split_utterance(phrase: str) -> list[str]:
+    """Segments non vides, dans l'ordre de l'énoncé (la phrase seule si rien à couper)."""
+    if not phrase or not str(phrase).strip():
+        return []
+    parts = [p.strip() for p in _SEPARATORS.split(f" {phrase} ")]
+    return [p for p in parts if p]
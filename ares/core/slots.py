@@ -0,0 +1,264 @@
+# ares/core/slots.py
+"""
+slots.py – Intents "templates" à slots typés: un intent couvre une famille de phrases.
+
+YAML:
+  - name: changer_couleur
+    templates: ["change en {color}", "mets en {color}"]
+    operator: context.object.active_material.diffuse_color
+    params: { value: "{color}", normalize: color }
+
+- types de slots: number, angle (degrés → radians), axis, color, object
+  (un placeholder nommé comme un type n'a pas besoin de déclaration; sinon
+   `slots: {distance: number}` ou `slots: {teinte: {type: color, values: {...}}}`)
+- params: "{slot}" est remplacé par la valeur typée, "{axis.vector}" / "{axis.mask}" /
+  "{axis.index}" donnent les formes dérivées d'un axe
+- tous les templates du catalogue sont compilés en UNE regex (alternation nommée):
+  un seul fullmatch par phrase, quel que soit le nombre de templates
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import unicodedata
+from collections.abc import Callable
+from typing import Any
+
+# Palette par défaut du type "color" (tuples RGBA, même forme que les params compilés)
+COLOR_PALETTE: dict[str, tuple[float, float, float, float]] = {
+    "rouge": (0.64, 0.00, 0.00, 1.00),
+    "vert": (0.00, 0.64, 0.00, 1.00),
+    "bleu": (0.00, 0.00, 0.64, 1.00),
+    "jaune": (0.90, 0.80, 0.05, 1.00),
+    "blanc": (1.00, 1.00, 1.00, 1.00),
+    "noir": (0.00, 0.00, 0.00, 1.00),
+    "orange": (1.00, 0.50, 0.00, 1.00),
+    "violet": (0.60, 0.20, 0.80, 1.00),
+}
+COLOR_ALIASES = {
+    "verte": "vert",
+    "bleue": "bleu",
+    "blanche": "blanc",
+    "noire": "noir",
+    "violette": "violet",
+}
+
+# Politesses tolérées autour d'une commande ("mets en rouge stp")
+_PREFIX = r"(?:(?:ok|bon|alors|blade)\s+)?"
+_SUFFIX = r"(?:\s+(?:stp|svp|s'il te plait|s'il vous plait|merci))?"
+
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+_PARAM_REF = re.compile(r"\{(\w+)(?:\.(\w+))?\}")
+_NUMBER = r"-?\d+(?:[.,]\d+)?"
+
+
+def _norm(s: str) -> str:
+    """Normalisation du parser (minuscule, sans accents, espaces réduits) + apostrophes."""
+    s = "".join(
+        c for c in unicodedata.normalize("NFKD", str(s).lower()) if not unicodedata.combining(c)
+    )
+    return " ".join(s.replace("’", "'").split())
+
+
+def _to_number(raw: str) -> float | int:
+    val = float(raw.replace(",", "."))
+    return int(val) if val.is_integer() else val
+
+
+def _to_radians(raw: str) -> float:
+    return math.radians(_to_number(raw.rstrip(" °")))
+
+
+def _axis_attrs(axis: str) -> dict[str, Any]:
+    i = "XYZ".index(axis)
+    return {
+        "index": i,
+        "vector": [1.0 if j == i else 0.0 for j in range(3)],
+        "mask": [j == i for j in range(3)],
+    }
+
+
+# ---------------------------
+# Types de slots
+# ---------------------------
+
+
+class SlotType:
+    """Regex de capture + conversion texte → valeur (+ attributs dérivés optionnels)."""
+
+    def __init__(
+        self,
+        pattern: str,
+        convert: Callable[[str], Any],
+        attrs: Callable[[Any], dict[str, Any]] | None = None,
+    ):
+        self.pattern = pattern
+        self.convert = convert
+        self.attrs = attrs
+
+
+def _rgba(value: Any) -> tuple[float, ...]:
+    """Couleur RGB/RGBA → tuple RGBA de floats (comme param_schema.to_color)."""
+    rgba = tuple(float(c) for c in value)
+    return rgba if len(rgba) != 3 else (*rgba, 1.0)
+
+
+def _color_type(values: dict[str, Any] | None = None) -> SlotType:
+    table = {_norm(k): v for k, v in (values or COLOR_PALETTE).items()}
+    if values is None:
+        table.update({_norm(a): COLOR_PALETTE[c] for a, c in COLOR_ALIASES.items()})
+    names = sorted(table, key=len, reverse=True)  # "violette" avant "violet"
+    return SlotType(
+        "(?:" + "|".join(re.escape(n) for n in names) + r")\b",
+        lambda raw: _rgba(table[raw]),
+    )
+
+
+SLOT_TYPES: dict[str, SlotType] = {
+    "number": SlotType(_NUMBER, _to_number),
+    "angle": SlotType(_NUMBER + r"(?:\s*°)?", _to_radians),
+    "axis": SlotType(r"[xyz]\b", str.upper, _axis_attrs),
+    "color": _color_type(),
+    "object": SlotType(r".+", str),
+}
+
+
+def _slot_type(name: str, spec: Any) -> SlotType:
+    """`spec` = nom de type, dict {type, values} ou None (type = nom du placeholder)."""
+    if isinstance(spec, dict):
+        kind = spec.get("type", name)
+        if kind == "color" and spec.get("values"):
+            return _color_type(spec["values"])
+    else:
+        kind = spec or name
+    try:
+        return SLOT_TYPES[kind]
+    except KeyError:
+        raise ValueError(f"type de slot inconnu: '{kind}' (slot '{name}')") from None
+
+
+# ---------------------------
+# Compilation
+# ---------------------------
+
+
+class _Template:
+    __slots__ = ("intent", "group", "slots")
+
+    def __init__(self, intent: dict[str, Any], group: str, slots: list[tuple[str, str, SlotType]]):
+        self.intent = intent
+        self.group = group  # nom du groupe de l'alternative dans la regex globale
+        self.slots = slots  # (nom du slot, nom du groupe, type)
+
+
+def _compile_template(text: str, group: str, specs: dict[str, Any]) -> tuple[str, list]:
+    parts: list[str] = []
+    slots: list[tuple[str, str, SlotType]] = []
+    pos = 0
+    norm = _norm(text)
+    for m in _PLACEHOLDER.finditer(norm):
+        parts.append(_literal(norm[pos : m.start()]))
+        name = m.group(1)
+        stype = _slot_type(name, specs.get(name))
+        gname = f"{group}_{len(slots)}"
+        parts.append(f"(?P<{gname}>{stype.pattern})")
+        slots.append((name, gname, stype))
+        pos = m.end()
+    parts.append(_literal(norm[pos:]))
+    return f"(?P<{group}>{''.join(parts)})", slots
+
+
+def _literal(text: str) -> str:
+    # espaces souples; "l'objet" == "l objet" == "l' objet"
+    out = re.escape(text)
+    out = out.replace(r"\ ", r"[\s\-]+").replace("'", r"['\s]\s*")
+    return out
+
+
+class SlotMatcher:
+    """Matcher compilé de tous les templates du catalogue (une regex, un fullmatch)."""
+
+    def __init__(self, std: list[dict[str, Any]]):
+        self.templates: dict[str, _Template] = {}
+        alternatives: list[str] = []
+        for s_it in std:
+            templates = s_it.get("templates")
+            if not isinstance(templates, list):
+                continue
+            specs = s_it.get("slots") or {}
+            for text in templates:
+                if not isinstance(text, str) or not text.strip():
+                    continue
+                group = f"t{len(self.templates)}"
+                pattern, slots = _compile_template(text, group, specs)
+                self.templates[group] = _Template(s_it, group, slots)
+                alternatives.append(pattern)
+        self.regex = (
+            re.compile(_PREFIX + "(?:" + "|".join(alternatives) + ")" + _SUFFIX)
+            if alternatives
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self.templates)
+
+    def _match(self, phrase: str) -> tuple[_Template, re.Match[str]] | None:
+        if self.regex is None:
+            return None
+        m = self.regex.fullmatch(_norm(phrase))
+        if m is None:
+            return None
+        # Le groupe d'alternative t<i> englobe ceux des slots: c'est le dernier fermé
+        return self.templates[m.lastgroup], m
+
+    def match(self, phrase: str) -> tuple[dict[str, Any], dict[str, str]] | None:
+        """(intent standardisé du template, {slot: texte capturé}) ou None."""
+        hit = self._match(phrase)
+        if hit is None:
+            return None
+        tpl, m = hit
+        return tpl.intent, {name: m.group(gname) for name, gname, _ in tpl.slots}
+
+    def fill(self, phrase: str) -> dict[str, Any] | None:
+        """Intent prêt à exécuter: params avec les slots remplacés par leurs valeurs typées."""
+        hit = self._match(phrase)
+        if hit is None:
+            return None
+        tpl, m = hit
+        raw = {name: m.group(gname) for name, gname, _ in tpl.slots}
+        types = {name: stype for name, _, stype in tpl.slots}
+        values = {name: types[name].convert(text) for name, text in raw.items()}
+        out = dict(tpl.intent)
+        out["params"] = _substitute(tpl.intent.get("params") or {}, values, types)
+        out["slots"] = raw
+        return out
+
+
+def _substitute(obj: Any, values: dict[str, Any], types: dict[str, SlotType]) -> Any:
+    if isinstance(obj, dict):
+        return {k: _substitute(v, values, types) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_substitute(v, values, types) for v in obj]
+    if not isinstance(obj, str) or "{" not in obj:
+        return obj
+
+    def _value(m: re.Match[str]) -> Any:
+        name, attr = m.group(1), m.group(2)
+        if name not in values:
+            return m.group(0)
+        if attr is None:
+            return values[name]
+        attrs = types[name].attrs
+        return attrs(values[name])[attr] if attrs else m.group(0)
+
+    whole = _PARAM_REF.fullmatch(obj)
+    if whole:
+        return _value(whole)
+    return _PARAM_REF.sub(lambda m: str(_value(m)), obj)
+
+
+def compile_slots(std: list[dict[str, Any]]) -> SlotMatcher | None:
+    """SlotMatcher du catalogue, None s'il n'a aucun intent à templates."""
+    matcher = SlotMatcher(std)
+    return matcher if len(matcher) else None
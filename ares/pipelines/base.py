@@ -1,8 +1,11 @@
 # ares/pipelines/base.py
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
+from ares.tools.exec_result import ExecResult
+
 
 class PipelineBase:
     """Contrat minimal pour une mini‑pipeline."""
@@ -13,6 +16,13 @@ class PipelineBase:
         """Retourne True si cette pipeline sait gérer l'intent."""
         return False
 
-    def run(self, intent: dict[str, Any]) -> bool:
-        """Exécute l'intent (peut appeler execute_intent ou steps custom)."""
+    def run(
+        self,
+        intent: dict[str, Any],
+        *,
+        on_retry_done: Callable[[ExecResult], None] | None = None,
+    ) -> ExecResult | bool:
+        """Exécute l'intent (peut appeler execute_intent ou steps custom).
+        Retour évalué en booléen: ExecResult (bool = ok) ou bool.
+        on_retry_done: transmis à execute_intent (issue d'un retry différé)."""
         raise NotImplementedError
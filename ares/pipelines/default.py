@@ -1,9 +1,11 @@
 # ares/pipelines/default.py
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from ares.pipelines.base import PipelineBase
+from ares.tools.exec_result import ExecResult
 from ares.tools.intent_executor import execute_intent
 
 
@@ -13,5 +15,10 @@ class DefaultPipeline(PipelineBase):
     def match(self, intent: dict[str, Any]) -> bool:
         return True  # fallback
 
-    def run(self, intent: dict[str, Any]) -> bool:
-        return execute_intent(intent)
+    def run(
+        self,
+        intent: dict[str, Any],
+        *,
+        on_retry_done: Callable[[ExecResult], None] | None = None,
+    ) -> ExecResult:
+        return execute_intent(intent, on_retry_done=on_retry_done)
@@ -1,9 +1,11 @@
 # ares/pipelines/material.py
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from ares.pipelines.base import PipelineBase
+from ares.tools.exec_result import ExecResult
 from ares.tools.intent_executor import execute_intent
 
 
@@ -16,6 +18,11 @@ class MaterialPipeline(PipelineBase):
         op = (intent.get("operator") or "").lower()
         return domain == "material" or {"material", "shader"} & tags or ".active_material" in op
 
-    def run(self, intent: dict[str, Any]) -> bool:
+    def run(
+        self,
+        intent: dict[str, Any],
+        *,
+        on_retry_done: Callable[[ExecResult], None] | None = None,
+    ) -> ExecResult:
         # Ici tu peux ajouter des steps spécifiques (création mat, nodes…)
-        return execute_intent(intent)
+        return execute_intent(intent, on_retry_done=on_retry_done)
@@ -1,10 +1,12 @@
 # ares/pipelines/render.py
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 from ares.core.logger import get_logger
 from ares.pipelines.base import PipelineBase
+from ares.tools.exec_result import ExecResult
 
 # from ares.tools.render_video import quick_render_mp4  # à brancher quand prêt
 from ares.tools.intent_executor import execute_intent
@@ -23,8 +25,13 @@ class RenderPipeline(PipelineBase):
             domain == "render" or "render" in tags or op.startswith("render.")  # ex: render.render
         )
 
-    def run(self, intent: dict[str, Any]) -> bool:
+    def run(
+        self,
+        intent: dict[str, Any],
+        *,
+        on_retry_done: Callable[[ExecResult], None] | None = None,
+    ) -> ExecResult:
         # Ici, tu pourras faire: préparation scène, config FFmpeg, etc.
         # if intent["name"] == "rendu_mp4_rapide":
         #     return quick_render_mp4(**intent.get("params", {}))
-        return execute_intent(intent)
+        return execute_intent(intent, on_retry_done=on_retry_done)
@@ -0,0 +1,130 @@
+# ares/tools/bpy_path.py
+"""
+bpy_path.py – Compilation des chemins de propriétés Blender en accès pré-découpés.
+
+  "context.object.active_material.diffuse_color[0]"
+      → root="context", steps=(ATTR object, ATTR active_material, ATTR diffuse_color, ITEM 0)
+  "data.objects['Cube'].location[0]"
+      → root="data", steps=(ATTR objects, ITEM 'Cube', ATTR location, ITEM 0)
+
+- compile_path() est mémoïsé par chaîne: le découpage n'est fait qu'une fois par chemin
+- walk() enchaîne simplement getattr/getitem sur les étapes compilées
+- forme "à affecter" (head, attr, index): parent = walk(root, head), puis
+  setattr(parent, attr, v) ou getattr(parent, attr)[index] = v
+- aucun import de bpy: la racine (bpy.context / bpy.data / autre) est fournie par l'appelant
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Any
+
+from ares.core import metrics
+
+ATTR = 0
+ITEM = 1
+
+ROOTS = ("context", "data")
+
+# "name" / ".name" / "[0]" / "['Cube']" / '["Cube"]'
+_TOKEN = re.compile(
+    r"""(?P<dot>\.)?(?P<attr>[A-Za-z_]\w*)"""
+    r"""|\[\s*(?:(?P<int>-?\d+)|'(?P<sq>[^']*)'|"(?P<dq>[^"]*)")\s*\]"""
+)
+
+Step = tuple[int, Any]
+
+
+class CompiledPath:
+    """Chemin découpé une fois pour toutes (immutable, partagé via le cache)."""
+
+    __slots__ = ("text", "root", "steps", "head", "attr", "index")
+
+    def __init__(self, text: str, root: str | None, steps: tuple[Step, ...]):
+        self.text = text
+        self.root = root  # "context" / "data" si le chemin en commence par un, sinon None
+        self.steps = steps
+        # Forme d'affectation: dernier attribut + au plus un index final
+        self.head: tuple[Step, ...] = steps
+        self.attr: str | None = None
+        self.index: Any = None
+        last_attr = max((i for i, (op, _) in enumerate(steps) if op == ATTR), default=-1)
+        tail = steps[last_attr + 1 :]
+        if last_attr >= 0 and len(tail) <= 1:
+            self.head = steps[:last_attr]
+            self.attr = steps[last_attr][1]
+            self.index = tail[0][1] if tail else None
+
+    def __repr__(self) -> str:
+        return f"CompiledPath({self.text!r})"
+
+
+@lru_cache(maxsize=1024)
+def compile_path(path: str) -> CompiledPath:
+    """
+    Compile "bpy.context.x.y[0]" / "data.objects['Cube'].location" / "object.name".
+    Lève ValueError si le chemin est mal formé.
+    """
+    text = path.strip()
+    rest = text[4:] if text.startswith("bpy.") else text
+    root = None
+    for name in ROOTS:
+        if rest == name or rest.startswith((name + ".", name + "[")):
+            root, rest = name, rest[len(name) :]
+            break
+
+    steps: list[Step] = []
+    pos = 0
+    while pos < len(rest):
+        m = _TOKEN.match(rest, pos)
+        # un attribut doit suivre un "." (sauf en tête de chemin relatif)
+        if m is None or (m.group("attr") and not m.group("dot") and (pos or root)):
+            raise ValueError(f"Chemin invalide: '{path}' (position {pos})")
+        if m.group("attr") is not None:
+            steps.append((ATTR, m.group("attr")))
+        elif m.group("int") is not None:
+            steps.append((ITEM, int(m.group("int"))))
+        else:
+            key = m.group("sq")
+            steps.append((ITEM, key if key is not None else m.group("dq")))
+        pos = m.end()
+    return CompiledPath(text, root, tuple(steps))
+
+
+def walk(obj: Any, steps: tuple[Step, ...]) -> Any:
+    """Applique les étapes depuis `obj` (AttributeError explicite si une étape échoue)."""
+    for op, key in steps:
+        if op == ATTR:
+            try:
+                obj = getattr(obj, key)
+            except AttributeError:
+                raise AttributeError(
+                    f"Chemin invalide: '{type(obj).__name__}.{key}' n'existe pas."
+                ) from None
+        else:
+            try:
+                obj = obj[key]
+            except Exception as e:
+                raise AttributeError(f"Index invalide [{key!r}] : {e}") from e
+    return obj
+
+
+def resolve(root: Any, path: str) -> Any:
+    """Valeur au bout du chemin, depuis `root`."""
+    return walk(root, compile_path(path).steps)
+
+
+def resolve_parent(root: Any, path: str) -> tuple[Any, str, Any]:
+    """(parent, attribut final, index final ou None) pour une affectation."""
+    cp = compile_path(path)
+    if cp.attr is None:
+        raise ValueError(f"Chemin non affectable: '{path}'")
+    return walk(root, cp.head), cp.attr, cp.index
+
+
+def clear_cache() -> None:
+    compile_path.cache_clear()
+
+
+metrics.register_cache("bpy_path", lambda: compile_path.cache_info()._asdict())
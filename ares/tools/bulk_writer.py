@@ -0,0 +1,143 @@
+# ares/tools/bulk_writer.py
+"""
+bulk_writer.py – Écriture/lecture vectorisée d'une propriété sur toute une collection Blender.
+
+  bulk_set(bpy.data.materials, "diffuse_color", [0.64, 0, 0, 1])   # "tout en rouge"
+  bulk_set(bpy.data.objects, "location", 0.0, index=2)               # tous au sol (z = 0)
+
+- un seul foreach_get/foreach_set par appel (1 appel RNA au lieu d'un par élément)
+- numpy pour les buffers (dtype attendu par RNA, broadcast valeur unique → N éléments,
+  écriture d'une seule composante); sans numpy: listes Python plates, toujours 1 appel
+- collections sans foreach (ex: context.selected_objects = liste Python): boucle de repli
+- aucun import de bpy: l'appelant fournit la collection (cf. intent_executor, stage "bulk")
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ares.core.logger import get_logger
+
+try:
+    import numpy as np
+except Exception:  # environnement sans numpy → buffers Python
+    np = None
+
+log = get_logger("BulkWriter")
+
+
+def _is_seq(value: Any) -> bool:
+    # list/tuple, mais aussi bpy_prop_array, mathutils.Vector/Color, np.ndarray
+    return hasattr(value, "__len__") and not isinstance(value, (str, bytes, dict))
+
+
+def _layout(sample: Any) -> tuple[int, type]:
+    """(largeur, type scalaire) d'une propriété à partir d'un élément: 1 pour un scalaire."""
+    if _is_seq(sample):
+        width = len(sample)
+        first = sample[0] if width else 0.0
+    else:
+        width, first = 1, sample
+    if isinstance(first, bool):
+        return width, bool
+    if isinstance(first, int):
+        return width, int
+    return width, float
+
+
+def _np_dtype(kind: type):
+    return {bool: np.bool_, int: np.int32}.get(kind, np.float32)
+
+
+def _has_foreach(collection: Any) -> bool:
+    return hasattr(collection, "foreach_set") and hasattr(collection, "foreach_get")
+
+
+def bulk_get(collection: Any, attr: str) -> Any:
+    """Valeurs de `attr` pour tous les éléments: array (N, largeur) / (N,) ou liste Python."""
+    n = len(collection)
+    if n == 0:
+        return np.empty(0) if np is not None else []
+    width, kind = _layout(getattr(collection[0], attr))
+    if not _has_foreach(collection):
+        return [getattr(item, attr) for item in collection]
+    if np is not None:
+        buf = np.empty(n * width, dtype=_np_dtype(kind))
+        collection.foreach_get(attr, buf)
+        return buf.reshape(n, width) if width > 1 else buf
+    buf = [kind()] * (n * width)
+    collection.foreach_get(attr, buf)
+    return [buf[i * width : (i + 1) * width] for i in range(n)] if width > 1 else buf
+
+
+def bulk_set(collection: Any, attr: str, value: Any, *, index: int | None = None) -> int:
+    """
+    Écrit `value` sur `attr` de tous les éléments de `collection`. Retourne le nombre d'éléments.
+      - value: scalaire / vecteur (diffusé à tous) ou une valeur par élément (N lignes)
+      - index: n'écrit que la composante [index] (lecture + écriture groupées)
+    Lève ValueError si la forme de la valeur ne correspond pas à la propriété.
+    """
+    n = len(collection)
+    if n == 0:
+        return 0
+    width, kind = _layout(getattr(collection[0], attr))
+    if index is not None and not -width <= index < width:
+        raise ValueError(f"Index {index} hors de '{attr}' (largeur {width})")
+
+    if not _has_foreach(collection):
+        _loop_set(collection, attr, value, index)
+        return n
+
+    if np is not None:
+        buf = _np_buffer(collection, attr, value, index, n, width, kind)
+    else:
+        buf = _py_buffer(collection, attr, value, index, n, width, kind)
+    collection.foreach_set(attr, buf)
+    log.info(f"🧮 Bulk set {attr}{'' if index is None else f'[{index}]'} sur {n} éléments")
+    return n
+
+
+def _np_buffer(collection, attr, value, index, n, width, kind):
+    dtype = _np_dtype(kind)
+    val = np.asarray(value, dtype=dtype)
+    if index is None:
+        shape = (n, width) if width > 1 else (n,)
+        if width > 1 and val.ndim == 1 and val.shape[0] != width:
+            raise ValueError(f"'{attr}' attend {width} composantes, reçu {val.shape[0]}")
+        try:
+            return np.ascontiguousarray(np.broadcast_to(val, shape)).ravel()
+        except ValueError:
+            raise ValueError(f"Valeur de forme {val.shape} incompatible avec '{attr}'") from None
+    buf = np.empty(n * width, dtype=dtype)
+    collection.foreach_get(attr, buf)
+    view = buf.reshape(n, width)
+    view[:, index] = val  # scalaire diffusé ou une valeur par élément
+    return buf
+
+
+def _py_buffer(collection, attr, value, index, n, width, kind):
+    if index is None:
+        if width == 1:
+            return [kind(value)] * n if not _is_seq(value) else [kind(v) for v in value]
+        rows = [value] * n if not _is_seq(value[0]) else list(value)
+        buf = [kind(v) for row in rows for v in row]
+        if len(rows) != n or len(buf) != n * width:
+            raise ValueError(f"Valeur incompatible avec '{attr}' ({n} × {width} attendus)")
+        return buf
+    buf = [kind()] * (n * width)
+    collection.foreach_get(attr, buf)
+    values = list(value) if _is_seq(value) else [value] * n
+    for i in range(n):
+        buf[i * width + (index % width)] = kind(values[i])
+    return buf
+
+
+def _loop_set(collection, attr, value, index) -> None:
+    """Repli élément par élément (listes Python sans foreach_set)."""
+    per_item = _is_seq(value) and len(value) == len(collection) and _is_seq(value[0])
+    for i, item in enumerate(collection):
+        v = value[i] if per_item else value
+        if index is None:
+            setattr(item, attr, v)
+        else:
+            getattr(item, attr)[index] = v
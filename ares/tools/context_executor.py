@@ -1,6 +1,8 @@
 ﻿import bpy
 
 from ares.core.logger import get_logger
+from ares.tools import object_index
+from ares.tools.bpy_path import resolve
 
 log = get_logger("ContextExecutor")
 
@@ -36,10 +38,7 @@ def resolve_bpy_path(path: str):
     """
     RÃ©sout une chaÃ®ne comme "object.active_material.diffuse_color" en objet rÃ©el Blender.
     """
-    current = bpy.context
-    for part in path.split("."):
-        current = getattr(current, part)
-    return current
+    return resolve(bpy.context, path)
 
 
 def ensure_context_for_path(path: str):
@@ -60,13 +59,13 @@ def ensure_object_selected():
     SÃ©lectionne un objet actif si aucun n'est sÃ©lectionnÃ©.
     """
     if not bpy.context.object:
-        objs = bpy.data.objects
-        for obj in objs:
-            if obj.type == 'MESH':
-                bpy.context.view_layer.objects.active = obj
-                obj.select_set(True)
-                log.info(f"ðŸ” Objet sÃ©lectionnÃ© automatiquement : {obj.name}")
-                return
+        obj = object_index.find_editable(
+            bpy.context.scene, ("MESH",), visible_only=False, last=False
+        )
+        if obj is not None:
+            bpy.context.view_layer.objects.active = obj
+            obj.select_set(True)
+            log.info(f"ðŸ” Objet sÃ©lectionnÃ© automatiquement : {obj.name}")
 
 
 def ensure_material_on_object():
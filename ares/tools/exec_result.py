@@ -0,0 +1,167 @@
+# ares/tools/exec_result.py
+"""
+exec_result.py – Résultat d'exécution d'un intent (record __slots__, compatible dict).
+
+- Champs: name, ok, stage, message, error, failure (mêmes clés que l'ancien dict:
+  res["ok"], res.get("stage") continuent de fonctionner)
+- bool(res) == res.ok: un échec n'est plus "truthy" (PipelineBase.run, run_with_manager)
+- Timings par étape en nanosecondes (perf_counter_ns), un slot entier par étape:
+  parse, enrich, inject, select, resolve, fallback, bulk (cumulés sur les retries)
+- Historique: ring buffer borné (deque) des derniers résultats pour le profiling
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from time import perf_counter_ns
+from typing import Any
+
+STAGES = ("parse", "enrich", "inject", "select", "resolve", "fallback", "bulk")
+FIELDS = ("name", "ok", "stage", "message", "error", "failure")
+
+_TIMING_SLOTS = tuple(f"t_{s}" for s in STAGES)
+
+
+class ExecResult:
+    """Résultat d'un intent; ~140 octets (hors valeurs), sans __dict__."""
+
+    __slots__ = FIELDS + _TIMING_SLOTS
+
+    def __init__(
+        self,
+        name: str = "intent",
+        ok: bool = False,
+        stage: str | None = None,
+        message: str = "",
+        error: str | None = None,
+        failure: str | None = None,
+    ):
+        self.name = name
+        self.ok = ok
+        self.stage = stage
+        self.message = message
+        self.error = error
+        self.failure = failure
+        for slot in _TIMING_SLOTS:
+            setattr(self, slot, 0)
+
+    # --- compat dict -------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in FIELDS:
+            return getattr(self, key)
+        if key == "timings":
+            return self.timings
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in FIELDS or key == "timings"
+
+    def keys(self) -> tuple[str, ...]:
+        return FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def update(self, **fields: Any) -> None:
+        for key, value in fields.items():
+            if key not in FIELDS:
+                raise KeyError(key)
+            setattr(self, key, value)
+
+    def __bool__(self) -> bool:
+        return bool(self.ok)
+
+    def __repr__(self) -> str:
+        return f"ExecResult({self.name!r}, ok={self.ok}, stage={self.stage!r})"
+
+    # --- timings -----------------------------------------------------------
+
+    def add_timing(self, stage: str, ns: int) -> None:
+        slot = f"t_{stage}"
+        setattr(self, slot, getattr(self, slot) + ns)
+
+    def lap(self, stage: str, start_ns: int) -> int:
+        """Ajoute (maintenant - start_ns) à `stage`; retourne maintenant (début du suivant)."""
+        now = perf_counter_ns()
+        self.add_timing(stage, now - start_ns)
+        return now
+
+    def merge_timings(self, other: ExecResult) -> None:
+        """Ajoute les timings de `other` (ex: parse/bots de run_pipeline) à ce résultat."""
+        for slot in _TIMING_SLOTS:
+            setattr(self, slot, getattr(self, slot) + getattr(other, slot))
+
+    @property
+    def timings(self) -> dict[str, int]:
+        """{étape: ns} des étapes mesurées."""
+        return {s: t for s, t in zip(STAGES, self.timing_values(), strict=True) if t}
+
+    def timing_values(self) -> tuple[int, ...]:
+        return tuple(getattr(self, slot) for slot in _TIMING_SLOTS)
+
+    @property
+    def total_ns(self) -> int:
+        return sum(self.timing_values())
+
+    def to_dict(self) -> dict[str, Any]:
+        out = {key: getattr(self, key) for key in FIELDS}
+        out["timings"] = self.timings
+        return out
+
+
+def to_result(value: Any, name: str = "intent") -> ExecResult:
+    """ExecResult depuis un retour hétérogène (ExecResult, dict, bool) d'un exécuteur."""
+    if isinstance(value, ExecResult):
+        return value
+    if isinstance(value, dict):
+        res = ExecResult(value.get("name") or name)
+        res.update(**{k: value[k] for k in FIELDS if k in value and k != "name"})
+        return res
+    return ExecResult(name, ok=bool(value), stage="done" if value else "failed")
+
+
+def sum_timings(results: Any) -> dict[str, int]:
+    """Timings cumulés par étape sur un lot (les détails sans timings sont ignorés)."""
+    totals = [0] * len(STAGES)
+    for res in results:
+        if isinstance(res, ExecResult):
+            for i, ns in enumerate(res.timing_values()):
+                totals[i] += ns
+    return {s: t for s, t in zip(STAGES, totals, strict=True) if t}
+
+
+# ---------------------------
+# Historique (ring buffer)
+# ---------------------------
+
+HISTORY_SIZE = 10_000
+
+_history: deque[ExecResult] = deque(maxlen=HISTORY_SIZE)
+
+
+def record(res: ExecResult) -> ExecResult:
+    _history.append(res)
+    return res
+
+
+def history(last: int | None = None) -> list[ExecResult]:
+    """Derniers résultats enregistrés (du plus ancien au plus récent)."""
+    items = list(_history)
+    return items if last is None else items[-last:]
+
+
+def set_history_size(size: int) -> None:
+    global _history
+    _history = deque(_history, maxlen=max(1, int(size)))
+
+
+def clear_history() -> None:
+    _history.clear()
@@ -0,0 +1,75 @@
+# ares/tools/failure_classifier.py
+"""
+failure_classifier.py – Classe un échec d'exécution pour choisir la bonne réaction.
+
+  context   → contexte invalide (poll() False, pas d'objet actif, mauvais mode, pas de
+              matériau): correctifs ciblés (`fixes`) puis nouvel essai immédiat
+  transient → Blender momentanément indisponible (données verrouillées pendant un
+              rendu/handler, depsgraph en cours): nouvel essai différé (bpy.app.timers)
+  fatal     → erreur qui ne disparaîtra pas en réessayant (opérateur inconnu, mauvais
+              paramètre, chemin invalide): échec immédiat
+
+Entrée: l'exception ou le message "Type: message" (intent_resolver.last_error(), messages
+des fallbacks de intent_executor). Sans dépendance à bpy.
+"""
+
+from __future__ import annotations
+
+import re
+
+CONTEXT = "context"
+TRANSIENT = "transient"
+FATAL = "fatal"
+
+# (kind, fixes, motif) testés dans l'ordre sur "Type: message" (minuscules)
+_RULES: list[tuple[str, tuple[str, ...], re.Pattern[str]]] = [
+    (
+        TRANSIENT,
+        (),
+        re.compile(
+            r"can't modify blend data|restricted context|is busy|while rendering"
+            r"|depsgraph is being evaluated|locked"
+        ),
+    ),
+    (CONTEXT, ("object_mode",), re.compile(r"edit ?mode|must be in object mode|mode_set")),
+    (CONTEXT, ("active_object", "material"), re.compile(r"active_material|material slot")),
+    (
+        CONTEXT,
+        ("active_object",),
+        re.compile(
+            r"poll\(\) failed|context is incorrect|no active object"
+            r"|'nonetype' object has no attribute|nonetype"
+        ),
+    ),
+]
+
+
+class Failure:
+    """Résultat du classement: type d'échec + correctifs de contexte à appliquer."""
+
+    __slots__ = ("kind", "fixes", "message")
+
+    def __init__(self, kind: str, fixes: tuple[str, ...] = (), message: str = ""):
+        self.kind = kind
+        self.fixes = fixes
+        self.message = message
+
+    @property
+    def recoverable(self) -> bool:
+        return self.kind != FATAL
+
+    def __repr__(self) -> str:
+        return f"Failure({self.kind!r}, fixes={self.fixes!r})"
+
+
+def classify_failure(error: BaseException | str | None) -> Failure:
+    """Classe un échec; une erreur inconnue est fatale (pas de retry à l'aveugle)."""
+    if error is None:
+        return Failure(FATAL, (), "échec sans cause connue")
+    if isinstance(error, BaseException):
+        error = f"{type(error).__name__}: {error}"
+    text = error.lower()
+    for kind, fixes, pattern in _RULES:
+        if pattern.search(text):
+            return Failure(kind, fixes, error)
+    return Failure(FATAL, (), error)
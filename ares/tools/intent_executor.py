@@ -4,11 +4,16 @@
 IntentExecutor – exécute un intent unique ou un lot d'intents avec robustesse.
 
 ✔️ Pipeline :
+    0) Intent "bulk" (toute une collection) → écriture vectorisée foreach_set [tools.bulk_writer]
     1) Appel primaire : resolve_and_execute(intent)  [tools.intent_resolver]
     2) En cas d'échec → fallback interne :
         - Exécution bpy.ops (si "op" fourni)
         - Accès direct (si "direct" fourni) ex: "context.object.name", "data.objects['Cube'].location[0]"
-    3) Auto-fix optionnel du contexte (objet actif, matériau, slot…), puis retry.
+    3) Échec classé (context / transient / fatal) : correctifs ciblés puis retry immédiat,
+       retry différé via bpy.app.timers, ou échec immédiat.
+    Lot transactionnel (execute_batch(transactional=True)) : un seul pas d'undo,
+    une seule mise à jour du view layer, rollback complet si un intent échoue.
+    Résultat : ExecResult (tools.exec_result), compatible dict, timings ns par étape.
 
 Format d'intent attendu (souple) :
 {
@@ -17,6 +22,8 @@ Format d'intent attendu (souple) :
   "args": [],                              # optionnel
   "kwargs": {"size": 2.0},                 # optionnel
   "direct": {"path": "context.scene.frame_end", "value": 250},   # optionnel
+  "bulk": {"collection": "data.materials", "attr": "diffuse_color",
+           "value": [0.64, 0, 0, 1], "index": None},               # optionnel – collection
   "requires": ["active_object"],           # optionnel – aide auto_fix
   "ensure": ["active_object", "material"], # optionnel – aide auto_fix
   "meta": {"tags": ["objects", "add"]}     # libre
@@ -24,21 +31,33 @@ Format d'intent attendu (souple) :
 
 Notes :
 - On ne fait AUCUN eval/exec dynamique côté utilisateur.
-- Le parsing d’indexation simple [i] est supporté pour le dernier segment.
+- Les chemins directs sont compilés une fois (tools.bpy_path) : [i] / ['Key'] supportés.
 - Les auto-fix sont minimaux et sûrs (création cube, mat par défaut).
 """
 
 from __future__ import annotations
 
-import time
 import traceback
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
+from time import perf_counter_ns
 from typing import Any
 
 import bpy
 
 from ares.core.logger import get_logger
-from ares.tools.intent_resolver import resolve_and_execute
+from ares.tools import node_cache, object_index
+from ares.tools.bpy_path import compile_path, walk
+from ares.tools.bulk_writer import bulk_set
+from ares.tools.exec_result import ExecResult, sum_timings
+from ares.tools.failure_classifier import FATAL, TRANSIENT, classify_failure
+from ares.tools.intent_resolver import (
+    _normalize_color,
+    call_op,
+    resolve_and_execute,
+    set_base_color_bulk,
+    set_deferred_undo,
+)
+from ares.tools.intent_resolver import last_error as resolver_last_error
 
 log = get_logger("IntentExecutor")
 
@@ -64,22 +83,7 @@ def _get_bpy_ops_callable(op_path: str):
     return node
 
 
-def _parse_last_index(segment: str) -> tuple[str, int | None]:
-    """
-    Détecte une indexation finale de type 'attr[0]'.
-    Retourne (base_attr, index_int_or_None).
-    """
-    if "[" in segment and segment.endswith("]"):
-        base, idx = segment.split("[", 1)
-        idx = idx[:-1]  # drop ]
-        try:
-            return base, int(idx)
-        except ValueError:
-            return segment, None
-    return segment, None
-
-
-def _walk_bpy_path(path: str) -> tuple[Any, str, int | None]:
+def _walk_bpy_path(path: str) -> tuple[Any, str, Any]:
     """
     Navigue dans un chemin de type:
       - "context.scene.frame_end"
@@ -87,65 +91,15 @@ def _walk_bpy_path(path: str) -> tuple[Any, str, int | None]:
       - "context.object.active_material.diffuse_color[1]"
 
     Retourne (parent_obj, last_attr_name, last_index_or_None) pour un set.
-    Supporte une indexation finale [i]. Supporte l'accès dict ['Key'] au milieu.
+    Le chemin est compilé une fois (bpy_path, mémoïsé) puis rejoué en getattr/getitem.
     """
     # On n'autorise que "bpy.context" et "bpy.data" comme racines
     if not (path.startswith("context.") or path.startswith("data.")):
         raise ValueError("Path must start with 'context.' or 'data.' (without 'bpy.').")
-    root_name, rest = path.split(".", 1)
-
-    node = getattr(bpy, root_name)  # bpy.context ou bpy.data
-
-    # Découpage custom qui conserve les segments avec quotes/brackets
-    segments: list[str] = []
-    cur = ""
-    bracket = 0
-    quote = None
-    for ch in rest:
-        if quote:
-            cur += ch
-            if ch == quote:
-                quote = None
-            continue
-        if ch in ("'", '"'):
-            quote = ch
-            cur += ch
-            continue
-        if ch == "[":
-            bracket += 1
-            cur += ch
-            continue
-        if ch == "]":
-            bracket -= 1
-            cur += ch
-            continue
-        if ch == "." and bracket == 0:
-            segments.append(cur)
-            cur = ""
-        else:
-            cur += ch
-    if cur:
-        segments.append(cur)
-
-    # On parcourt jusqu'au dernier parent
-    for seg in segments[:-1]:
-        # Dict style objects['Cube']
-        if "[" in seg and seg.endswith("]"):
-            before, key = seg.split("[", 1)
-            key = key[:-1]  # drop ]
-            if (key.startswith("'") and key.endswith("'")) or (
-                key.startswith('"') and key.endswith('"')
-            ):
-                key = key[1:-1]
-            container = getattr(node, before)
-            node = container[key]
-        else:
-            node = getattr(node, seg)
-
-    last = segments[-1]
-    last_attr, last_index = _parse_last_index(last)
-    parent = node
-    return parent, last_attr, last_index
+    cp = compile_path(path)
+    if cp.attr is None:
+        raise ValueError(f"Path not assignable: '{path}'")
+    return walk(getattr(bpy, cp.root), cp.head), cp.attr, cp.index
 
 
 def _set_bpy_path_value(path: str, value: Any):
@@ -203,23 +157,35 @@ def _ensure_active_material(obj: bpy.types.Object) -> bpy.types.Material | None:
     return obj.active_material
 
 
-def _auto_fix_context(intent: dict[str, Any]):
-    """
-    Applique des corrections minimales en fonction de intent['requires'] / intent['ensure'].
-    """
-    requires = intent.get("requires", []) or []
-    ensure = intent.get("ensure", []) or []
+def _ensure_object_mode() -> None:
+    obj = bpy.context.object
+    if obj is not None and getattr(obj, "mode", "OBJECT") != "OBJECT":
+        bpy.ops.object.mode_set(mode="OBJECT")
+
+
+# Correctifs connus, dans l'ordre d'application
+_FIXES = ("object_mode", "active_object", "material")
 
-    if "active_object" in requires or "active_object" in ensure:
-        obj = _ensure_active_object()
-        if obj is None:
-            log.warning("⚠️ Impossible de garantir un objet actif.")
 
-    if "material" in ensure:
-        obj = bpy.context.object
-        if obj is None:
-            obj = _ensure_active_object()
-        _ = _ensure_active_material(obj)
+def _declared_fixes(intent: dict[str, Any]) -> tuple[str, ...]:
+    """Correctifs déclarés par l'intent (intent['requires'] / intent['ensure'])."""
+    declared = list(intent.get("requires", []) or []) + list(intent.get("ensure", []) or [])
+    return tuple(f for f in _FIXES if f in declared)
+
+
+def _apply_fixes(fixes: Iterable[str]) -> None:
+    """Applique uniquement les correctifs demandés (cf. failure_classifier)."""
+    for fix in fixes:
+        try:
+            if fix == "object_mode":
+                _ensure_object_mode()
+            elif fix == "active_object":
+                if _ensure_active_object() is None:
+                    log.warning("⚠️ Impossible de garantir un objet actif.")
+            elif fix == "material":
+                _ensure_active_material(bpy.context.object or _ensure_active_object())
+        except Exception:
+            log.debug(f"Auto-fix '{fix}': exception ignorée.", exc_info=True)
 
 
 # ---------------------------------------------------------------------------
@@ -235,7 +201,7 @@ def _try_bpy_ops(intent: dict[str, Any]) -> tuple[bool, str]:
     kwargs = intent.get("kwargs") or {}
     try:
         fn = _get_bpy_ops_callable(op)
-        res = fn(*args, **kwargs)
+        res = call_op(fn, *args, **kwargs)
         # Les opérateurs Blender renvoient set({'FINISHED'}) ou {'CANCELLED'}
         if isinstance(res, set) and "FINISHED" in res:
             return True, "FINISHED"
@@ -266,6 +232,37 @@ def _try_direct_set(intent: dict[str, Any]) -> tuple[bool, str]:
         return False, f"{type(e).__name__}: {e}"
 
 
+def _try_bulk_set(intent: dict[str, Any]) -> tuple[bool, str]:
+    """
+    Écriture d'une propriété sur toute une collection ("tout en rouge"):
+    un foreach_set au lieu d'une affectation RNA par élément.
+    La valeur vient de bulk.value, sinon de params.value (slots, normalize="color").
+    diffuse_color: Base Color des Principled aussi réglée, comme pour un objet unique.
+    """
+    bulk = intent.get("bulk")
+    if not bulk or not isinstance(bulk, dict):
+        return False, "No 'bulk' dict provided."
+    params = intent.get("params") or {}
+    coll_path, attr = bulk.get("collection"), bulk.get("attr")
+    if not coll_path or not attr:
+        return False, "'bulk' needs 'collection' and 'attr'."
+    value = bulk.get("value", params.get("value"))
+    if "color" in (bulk.get("normalize"), params.get("normalize")):
+        value = _normalize_color(value)
+    try:
+        cp = compile_path(coll_path)
+        if cp.root is None:
+            raise ValueError("Collection path must start with 'context.' or 'data.'.")
+        collection = walk(getattr(bpy, cp.root), cp.steps)
+        count = bulk_set(collection, attr, value, index=bulk.get("index"))
+        if attr == "diffuse_color" and bulk.get("index") is None:
+            nodal = set_base_color_bulk(collection, value)
+            return True, f"BULK({count}, base_color={nodal})"
+        return True, f"BULK({count})"
+    except Exception as e:
+        return False, f"{type(e).__name__}: {e}"
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -277,75 +274,215 @@ def execute_intent(
     auto_fix: bool = True,
     retries: int = 1,
     delay_s: float = 0.05,
-) -> dict[str, Any]:
+    defer_retries: bool = True,
+    on_retry_done: Callable[[ExecResult], None] | None = None,
+) -> ExecResult:
     """
     Exécute un intent unique de manière robuste.
 
-    Retour:
-      {
-        "name": str,
-        "ok": bool,
-        "stage": "resolver" | "fallback_ops" | "fallback_direct" | "failed",
-        "message": str,
-        "error": Optional[str]
-      }
+    Chaque échec est classé (tools.failure_classifier):
+      - context   → correctifs ciblés (objet actif, matériau, mode objet) puis retry immédiat
+      - transient → retry différé via bpy.app.timers (jamais de sleep sur le thread principal);
+                    le résumé est alors "retry_scheduled" et `on_retry_done(résumé)` est
+                    appelé à la fin. defer_retries=False (lots): retry immédiat
+      - fatal     → échec immédiat, sans retry
+
+    Retour: ExecResult (bool(res) == res.ok, accès res["stage"] / res.get(...) conservés)
+        name: str
+        ok: bool
+        stage: "bulk" | "resolver" | "fallback_ops" | "fallback_direct"
+               | "retry_scheduled" | "failed"
+        message: str
+        error: Optional[str]
+        failure: None | "context" | "transient" | "fatal"
+        timings: {"resolve" | "fallback" | "bulk": ns}
     """
-    name = intent.get("name") or intent.get("id") or "intent"
-    summary: dict[str, Any] = {
-        "name": name,
-        "ok": False,
-        "stage": None,
-        "message": "",
-        "error": None,
-    }
-
     if not isinstance(intent, dict):
         msg = "❌ Intent must be a dict."
         log.error(msg)
-        summary.update(stage="failed", message=msg)
+        return ExecResult("intent", stage="failed", message=msg)
+
+    name = intent.get("name") or intent.get("id") or "intent"
+    summary = ExecResult(name)
+
+    # 0) Intent collection : écriture vectorisée, pas de resolver/fallback unitaires
+    if intent.get("bulk"):
+        t0 = perf_counter_ns()
+        ok, msg = _try_bulk_set(intent)
+        summary.lap("bulk", t0)
+        if ok:
+            summary.update(ok=True, stage="bulk", message=msg)
+        else:
+            log.error(f"❌ Échec bulk '{name}': {msg}")
+            summary.update(stage="failed", message="bulk:failed", error=msg)
         return summary
 
-    # 1) Essai principal : resolver
-    try:
-        result = resolve_and_execute(intent)
-        if result and (result is True or result.get("ok") is True):
-            summary.update(ok=True, stage="resolver", message="resolver:ok")
-            return summary
-    except Exception:
-        log.debug(f"Resolver a levé une exception sur '{name}'.", exc_info=True)
+    if auto_fix and (intent.get("requires") or intent.get("ensure")):
+        _apply_fixes(_declared_fixes(intent))
 
-    # 2) Auto-fix + retries
     tries = max(1, int(retries) + 1)  # ex : retries=1 → 2 passages (fix + retry)
-    for idx in range(tries):
-        if auto_fix:
-            try:
-                _auto_fix_context(intent)
-            except Exception:
-                log.debug("Auto-fix context: exception ignorée.", exc_info=True)
-
-        # 2a) Fallback via bpy.ops
-        ok, msg = _try_bpy_ops(intent)
-        if ok:
-            summary.update(ok=True, stage="fallback_ops", message=msg)
+    for attempt in range(tries):
+        # 1) Essai principal : resolver, puis 2) fallbacks bpy.ops / accès direct
+        stage, msg, error = _attempt(intent, summary)
+        if stage is not None:
+            summary.update(ok=True, stage=stage, message=msg)
             return summary
 
-        # 2b) Fallback accès direct
-        ok, msg2 = _try_direct_set(intent)
-        if ok:
-            summary.update(ok=True, stage="fallback_direct", message=msg2)
-            return summary
+        failure = classify_failure(error)
+        summary.update(failure=failure.kind, error=error)
+        if failure.kind == FATAL or attempt == tries - 1:
+            break
 
-        # Retarder avant tentative suivante
-        if idx < tries - 1:
-            time.sleep(max(0.0, float(delay_s)))
+        if failure.kind == TRANSIENT:
+            if defer_retries and _schedule_retry(
+                intent, tries - attempt - 2, delay_s, auto_fix, on_retry_done
+            ):
+                log.info(f"⏳ '{name}': échec transitoire, nouvel essai dans {delay_s:.2f}s.")
+                summary.update(stage="retry_scheduled", message="retry:scheduled")
+                return summary
+            _update_view_layer()
+        elif auto_fix:
+            log.info(f"🩹 '{name}': contexte invalide → correctifs {failure.fixes}")
+            _apply_fixes(failure.fixes)
 
     # 3) Échec
-    err = f"resolver+fallback failed | ops='{intent.get('op')}' | direct='{(intent.get('direct') or {}).get('path')}'"
-    log.error(f"❌ Échec intent '{name}'. {err}\n{_short_stack()}")
+    err = summary["error"] or "resolver+fallback failed"
+    log.error(
+        f"❌ Échec intent '{name}' ({summary['failure']}). {err} | ops='{intent.get('op')}'"
+        f" | direct='{(intent.get('direct') or {}).get('path')}'"
+    )
     summary.update(stage="failed", message="failed", error=err)
     return summary
 
 
+def _attempt(intent: dict[str, Any], res: ExecResult) -> tuple[str | None, str, str | None]:
+    """
+    Un passage resolver → ops → direct: (stage réussi ou None, message, cause d'échec).
+    Durées cumulées dans res (étapes "resolve" et "fallback").
+    """
+    error: str | None = None
+    t0 = perf_counter_ns()
+    if intent.get("operator"):
+        try:
+            result = resolve_and_execute(intent)
+            if result and (result is True or result.get("ok") is True):
+                res.lap("resolve", t0)
+                return "resolver", "resolver:ok", None
+            error = resolver_last_error()
+        except Exception as e:
+            log.debug(f"Resolver a levé une exception sur '{intent.get('name')}'.", exc_info=True)
+            error = f"{type(e).__name__}: {e}"
+        t0 = res.lap("resolve", t0)
+
+    # Les fallbacks fournis par l'intent sont plus précis que l'échec du resolver
+    try:
+        if intent.get("op"):
+            ok, msg = _try_bpy_ops(intent)
+            if ok:
+                return "fallback_ops", msg, None
+            error = msg
+        if intent.get("direct"):
+            ok, msg = _try_direct_set(intent)
+            if ok:
+                return "fallback_direct", msg, None
+            error = msg
+    finally:
+        if intent.get("op") or intent.get("direct"):
+            res.lap("fallback", t0)
+    return None, "", error or "ValueError: ni 'operator', ni 'op', ni 'direct'"
+
+
+def _schedule_retry(
+    intent: dict[str, Any],
+    retries: int,
+    delay_s: float,
+    auto_fix: bool,
+    on_done: Callable[[ExecResult], None] | None,
+) -> bool:
+    """Planifie execute_intent sur bpy.app.timers (thread principal, sans bloquer l'UI)."""
+
+    def _retry():
+        res = execute_intent(
+            intent, auto_fix=auto_fix, retries=retries, delay_s=delay_s, on_retry_done=on_done
+        )
+        if on_done is not None and res.get("stage") != "retry_scheduled":
+            on_done(res)
+        return None  # one-shot
+
+    try:
+        bpy.app.timers.register(_retry, first_interval=max(0.0, float(delay_s)))
+        return True
+    except Exception:  # pas de timers (mode background, tests)
+        log.debug("bpy.app.timers indisponible: retry immédiat.", exc_info=True)
+        return False
+
+
+class BatchTransaction:
+    """
+    Regroupe un lot d'intents en UN pas d'undo:
+      begin()    → point de restauration (undo_push), opérateurs en EXEC_DEFAULT sans undo
+      commit()   → un seul undo_push nommé + un seul view_layer.update()
+      rollback() → retour à l'état d'avant le lot (undo_push puis undo)
+    Utilisable en context manager (rollback automatique sur exception).
+    """
+
+    def __init__(self, label: str = "Blade batch"):
+        self.label = label
+        self.state = "idle"  # idle → open → committed | rolled_back | rollback_failed
+        self._previous_defer = False
+
+    def __enter__(self) -> BatchTransaction:
+        self.begin()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if self.state == "open" and exc_type is not None:
+            self.rollback()
+        elif self.state == "open":
+            self.commit()
+
+    def begin(self) -> None:
+        _undo_push(f"{self.label} (début)")
+        self._previous_defer = set_deferred_undo(True)
+        self.state = "open"
+
+    def commit(self) -> None:
+        set_deferred_undo(self._previous_defer)
+        _undo_push(self.label)
+        _update_view_layer()
+        self.state = "committed"
+
+    def rollback(self) -> None:
+        set_deferred_undo(self._previous_defer)
+        try:
+            # pousse l'état courant puis revient d'un pas → état de begin()
+            bpy.ops.ed.undo_push(message=f"{self.label} (annulé)")
+            bpy.ops.ed.undo()
+            # l'undo recrée les données: références de nodes/objets en cache périmées
+            node_cache.clear()
+            object_index.clear()
+            self.state = "rolled_back"
+            log.warning(f"↩️ Lot '{self.label}' annulé (undo).")
+        except Exception as e:
+            self.state = "rollback_failed"
+            log.error(f"❌ Rollback impossible pour '{self.label}': {e}")
+        _update_view_layer()
+
+
+def _undo_push(message: str) -> None:
+    try:
+        bpy.ops.ed.undo_push(message=message)
+    except Exception:  # pas de pile d'undo (mode background…)
+        log.debug(f"undo_push indisponible ('{message}').", exc_info=True)
+
+
+def _update_view_layer() -> None:
+    try:
+        bpy.context.view_layer.update()
+    except Exception:
+        log.debug("view_layer.update() impossible.", exc_info=True)
+
+
 def execute_batch(
     intents: Iterable[dict[str, Any]],
     *,
@@ -353,11 +490,16 @@ def execute_batch(
     retries: int = 1,
     delay_s: float = 0.05,
     stop_on_error: bool = False,
+    transactional: bool = False,
+    label: str = "Blade batch",
 ) -> dict[str, Any]:
     """
     Exécute un lot d'intents et retourne un résumé.
+    transactional=True : un seul pas d'undo (`label`), mise à jour du view layer différée
+    à la fin, arrêt au premier échec et rollback du lot entier ("transaction" du résumé).
+    "details": un ExecResult par intent; "timings": ns cumulés par étape sur le lot.
     """
-    details: list[dict[str, Any]] = []
+    details: list[ExecResult] = []
     ok_count = 0
     failed_count = 0
     names_success: list[str] = []
@@ -366,33 +508,50 @@ def execute_batch(
     if not isinstance(intents, Iterable):
         raise TypeError("intents must be iterable of dicts")
 
-    for intent in intents:
-        try:
-            res = execute_intent(intent, auto_fix=auto_fix, retries=retries, delay_s=delay_s)
-            details.append(res)
-            if res.get("ok"):
-                ok_count += 1
-                names_success.append(res.get("name") or "intent")
-            else:
+    tx = BatchTransaction(label) if transactional else None
+    if tx is not None:
+        stop_on_error = True  # le lot sera annulé: inutile de continuer
+        tx.begin()
+
+    try:
+        for intent in intents:
+            try:
+                # retry transitoire immédiat: l'ordre du lot doit être préservé
+                res = execute_intent(
+                    intent,
+                    auto_fix=auto_fix,
+                    retries=retries,
+                    delay_s=delay_s,
+                    defer_retries=False,
+                )
+                details.append(res)
+                if res.get("ok"):
+                    ok_count += 1
+                    names_success.append(res.get("name") or "intent")
+                else:
+                    failed_count += 1
+                    names_failed.append(res.get("name") or "intent")
+                    if stop_on_error:
+                        break
+            except Exception:
                 failed_count += 1
-                names_failed.append(res.get("name") or "intent")
+                name = (intent or {}).get("name") if isinstance(intent, dict) else "intent"
+                names_failed.append(name or "intent")
+                details.append(
+                    ExecResult(
+                        name or "intent", stage="failed", message="exception", error=_short_stack()
+                    )
+                )
                 if stop_on_error:
                     break
-        except Exception:
-            failed_count += 1
-            name = (intent or {}).get("name") if isinstance(intent, dict) else "intent"
-            names_failed.append(name or "intent")
-            details.append(
-                {
-                    "name": name,
-                    "ok": False,
-                    "stage": "failed",
-                    "message": "exception",
-                    "error": _short_stack(),
-                }
-            )
-            if stop_on_error:
-                break
+    except BaseException:
+        if tx is not None:
+            tx.rollback()
+        raise
+    if tx is not None and failed_count:
+        tx.rollback()
+    elif tx is not None:
+        tx.commit()
 
     total = ok_count + failed_count
     summary = {
@@ -402,6 +561,8 @@ def execute_batch(
         "names_success": names_success,
         "names_failed": names_failed,
         "details": details,
+        "transaction": tx.state if tx is not None else None,
+        "timings": sum_timings(details),
     }
 
     log.info(
@@ -1,5 +1,7 @@
 ﻿# ares/tools/intent_resolver.py
 
+from __future__ import annotations
+
 import traceback
 from collections.abc import Sequence
 from typing import Any
@@ -7,10 +9,15 @@ from typing import Any
 import bpy
 
 from ares.core.logger import get_logger
+from ares.tools import node_cache, object_index
+from ares.tools.bpy_path import CompiledPath, compile_path, walk
+from ares.tools.operator_catalog import get_operator_catalog
 from ares.tools.operator_classifier import classify_operator
 
 log = get_logger("IntentResolver")
 
+_CONTEXT_PREFIXES = ("context.", "bpy.context.", "data.", "bpy.data.")
+
 
 # ---------------------------
 # Helpers: context preparation
@@ -25,11 +32,8 @@ def _find_any_editable_object() -> bpy.types.Object | None:
     selected = [o for o in bpy.context.selected_objects if not o.hide_get()]
     if selected:
         return selected[-1]
-    # fallback: dernier mesh visible
-    for o in reversed(list(bpy.context.scene.objects)):
-        if o.type in {"MESH", "CURVE", "SURFACE", "META", "GPENCIL"} and not o.hide_get():
-            return o
-    return None
+    # fallback: dernier mesh visible (index tenu à jour par le handler depsgraph)
+    return object_index.find_editable(bpy.context.scene)
 
 
 def ensure_active_object() -> bpy.types.Object | None:
@@ -108,7 +112,8 @@ def _find_principled(nt: bpy.types.NodeTree) -> bpy.types.Node | None:
 
 
 def _ensure_principled_pipeline(mat: bpy.types.Material) -> bpy.types.Node | None:
-    """Crée un Principled + branche à l'Output si nécessaire, retourne le Principled."""
+    """Crée un Principled + branche à l'Output si nécessaire, retourne le Principled.
+    Rôles des nodes mis en cache par matériau (node_cache): pas de scan à chaque couleur."""
     if not mat.use_nodes:
         mat.use_nodes = True
     nt = mat.node_tree
@@ -116,6 +121,10 @@ def _ensure_principled_pipeline(mat: bpy.types.Material) -> bpy.types.Node | Non
         log.warning("⚠️ Matériau sans node_tree, impossible de configurer les nodes.")
         return None
 
+    cached = node_cache.lookup(mat)
+    if cached is not None:
+        return cached.principled
+
     principled = _find_principled(nt)
     if not principled:
         principled = nt.nodes.new("ShaderNodeBsdfPrincipled")
@@ -135,6 +144,7 @@ def _ensure_principled_pipeline(mat: bpy.types.Material) -> bpy.types.Node | Non
     if not have_link:
         nt.links.new(principled.outputs.get("BSDF"), out.inputs.get("Surface"))
 
+    node_cache.store(mat, principled, out)
     return principled
 
 
@@ -148,10 +158,13 @@ def _set_principled_base_color(mat: bpy.types.Material, rgba: Sequence[float]) -
         if not socket:
             log.warning("⚠️ Principled sans socket 'Base Color'.")
             return False
-        # default_value attend 4 floats
-        val = list(_normalize_color(rgba))
-        if len(val) < 4:
-            val = (val + [1.0, 1.0, 1.0, 1.0])[:4]
+        # default_value attend 4 floats (déjà un tuple RGBA si compilé au chargement)
+        if isinstance(rgba, tuple) and len(rgba) == 4:
+            val = rgba
+        else:
+            val = list(_normalize_color(rgba))
+            if len(val) < 4:
+                val = (val + [1.0, 1.0, 1.0, 1.0])[:4]
         socket.default_value = val[:4]
         log.info(f"🎨 Base Color nodes = {val[:4]}")
         return True
@@ -161,26 +174,34 @@ def _set_principled_base_color(mat: bpy.types.Material, rgba: Sequence[float]) -
         return False
 
 
+def set_base_color_bulk(materials: Any, rgba: Sequence[float]) -> int:
+    """
+    Base Color du Principled de chaque matériau nodal (pendant de bulk_set sur diffuse_color:
+    "tout en rouge" change aussi le rendu). Pas de foreach entre node_trees: une boucle,
+    mais Principled via node_cache (pas de scan pour les matériaux déjà vus).
+    Les matériaux sans nodes ou sans Principled ne sont pas modifiés (diffuse_color suffit).
+    Retourne le nombre de matériaux mis à jour.
+    """
+    value = tuple(_normalize_color(rgba))[:4]
+    count = 0
+    for mat in materials:
+        if not getattr(mat, "use_nodes", False) or mat.node_tree is None:
+            continue
+        cached = node_cache.lookup(mat)
+        p = cached.principled if cached is not None else _find_principled(mat.node_tree)
+        socket = p.inputs.get("Base Color") if p is not None else None
+        if socket is not None:
+            socket.default_value = value
+            count += 1
+    return count
+
+
 # ---------------------------------------
 # Helpers: attribute path parse & set/get
 # ---------------------------------------
 
 
-def _split_attr_and_index(token: str) -> tuple[str, int | None]:
-    """
-    Ex.: 'diffuse_color[0]' -> ('diffuse_color', 0)
-         'location'         -> ('location', None)
-    """
-    if "[" in token and token.endswith("]"):
-        name, idx_str = token[:-1].split("[", 1)
-        try:
-            return name, int(idx_str)
-        except ValueError:
-            return token, None
-    return token, None
-
-
-def _resolve_path(root: Any, dotted_path: str) -> tuple[Any, str | None, int | None]:
+def _resolve_path(root: Any, dotted_path: str) -> tuple[Any, str | None, Any]:
     """
     Navigue jusqu'au parent de l’attribut final.
     Retourne (parent_obj, final_attr_name, index_opt)
@@ -188,36 +209,21 @@ def _resolve_path(root: Any, dotted_path: str) -> tuple[Any, str | None, int | N
     """
     if not dotted_path:
         return root, None, None
+    return _resolve_compiled(root, compile_path(dotted_path))
 
-    tokens = dotted_path.split(".")
-    current = root
-
-    for i, tok in enumerate(tokens):
-        name, idx = _split_attr_and_index(tok)
-        is_last = i == len(tokens) - 1
-
-        if not hasattr(current, name):
-            raise AttributeError(
-                f"Chemin invalide: '{type(current).__name__}.{name}' n'existe pas."
-            )
 
-        if is_last:
-            # On s'arrête au parent; on retourne les infos du dernier token
-            return current, name, idx
-
-        current = getattr(current, name)
-
-        if idx is not None:
-            # Index intermédiaire (séquence)
-            try:
-                current = current[idx]
-            except Exception as e:
-                raise AttributeError(
-                    f"Index intermédiaire invalide [{idx}] sur '{name}': {e}"
-                ) from e
-
-    # Fallback (ne devrait pas arriver)
-    return current, None, None
+def _resolve_compiled(root: Any, path: CompiledPath) -> tuple[Any, str | None, Any]:
+    """Comme _resolve_path, sur un chemin déjà compilé (plan d'exécution)."""
+    if not path.steps:
+        return root, None, None
+    if path.attr is None:
+        raise AttributeError(f"Chemin non affectable: '{path.text}'")
+    parent = walk(root, path.head)
+    if not hasattr(parent, path.attr):
+        raise AttributeError(
+            f"Chemin invalide: '{type(parent).__name__}.{path.attr}' n'existe pas."
+        )
+    return parent, path.attr, path.index
 
 
 def _assign_value_on_attr(parent: Any, attr: str, idx: int | None, value: Any) -> None:
@@ -249,23 +255,79 @@ def _assign_value_on_attr(parent: Any, attr: str, idx: int | None, value: Any) -
 # Ops execution with smart fallback
 # --------------------------------
 
+# Cause du dernier échec ("Type: message"), lue par intent_executor pour classer l'échec
+_last_error: str | None = None
 
-def _exec_bpy_ops(operator: str, params: dict) -> bool:
+
+def _fail(message: str | None) -> bool:
+    global _last_error
+    _last_error = message
+    return False
+
+
+def last_error() -> str | None:
+    """Cause du dernier échec de resolve_and_execute (None si succès)."""
+    return _last_error
+
+
+# Mode lot transactionnel (intent_executor.BatchTransaction): un seul undo_push pour le lot
+_defer_undo = False
+
+
+def set_deferred_undo(enabled: bool) -> bool:
+    """Active le mode lot (opérateurs sans undo_push individuel). Retourne l'état précédent."""
+    global _defer_undo
+    previous, _defer_undo = _defer_undo, bool(enabled)
+    return previous
+
+
+def call_op(op_func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Appel bpy.ops; en mode lot: EXEC_DEFAULT sans undo (le lot pousse son propre undo)."""
+    if _defer_undo and not args:
+        return op_func("EXEC_DEFAULT", False, **kwargs)
+    return op_func(*args, **kwargs)
+
+
+def _lookup_bpy_op(operator: str) -> tuple[Any, str, str] | None:
+    """(appelable bpy.ops, catégorie, commande) ou None (erreur loguée)."""
     parts = operator.split(".")
     if len(parts) != 2:
         log.error(f"❌ Format invalide pour opérateur bpy.ops: '{operator}'")
-        return False
+        return None
+    catalog = get_operator_catalog()
+    if catalog is not None and operator not in catalog:
+        log.error(f"❌ Opérateur inconnu: bpy.ops.{operator}")
+        return None
 
     category, command = parts
     op_module = getattr(bpy.ops, category, None)
     if not op_module:
         log.error(f"❌ Catégorie inconnue: bpy.ops.{category}")
-        return False
+        return None
 
     op_func = getattr(op_module, command, None)
     if not op_func or not callable(op_func):
         log.error(f"❌ Commande inconnue: bpy.ops.{category}.{command}")
-        return False
+        return None
+    return op_func, category, command
+
+
+def _exec_bpy_ops(operator: str, params: dict, plan: _ExecPlan | None = None) -> bool:
+    if plan is not None and plan.op_func is not None:
+        op_func, category, command = plan.op_func, plan.category, plan.command
+    else:
+        found = _lookup_bpy_op(operator)
+        if found is None:
+            return _fail(f"AttributeError: opérateur inconnu bpy.ops.{operator}")
+        op_func, category, command = found
+
+    # Params validés contre le schéma RNA (catalogue) avant tout appel
+    catalog = get_operator_catalog()
+    if catalog is not None:
+        errors = catalog.validate_params(f"{category}.{command}", params)
+        if errors:
+            log.error(f"❌ Params invalides pour bpy.ops.{category}.{command}: {errors}")
+            return _fail(f"TypeError: params invalides: {'; '.join(errors)}")
 
     # 1er essai: poll direct
     if hasattr(op_func, "poll") and not op_func.poll():
@@ -273,23 +335,23 @@ def _exec_bpy_ops(operator: str, params: dict) -> bool:
         obj = ensure_active_object()
         if obj is None:
             log.warning(f"⚠️ Impossible de préparer un objet actif pour {operator}.")
-            return False
+            return _fail(f"RuntimeError: {operator}.poll() failed, context is incorrect")
         if category == "object" and command in {"modifier_add", "material_slot_add"}:
             ensure_active_material(obj)
 
         if hasattr(op_func, "poll") and not op_func.poll():
             log.warning(f"⚠️ Contexte toujours invalide pour {operator} après préparation.")
-            return False
+            return _fail(f"RuntimeError: {operator}.poll() failed, context is incorrect")
 
     # Exécution
     try:
-        result = op_func(**(params or {}))
+        result = call_op(op_func, **(params or {}))
         log.info(f"✅ bpy.ops.{category}.{command} exécuté. Résultat: {result}")
         return True
     except Exception as e:
         log.error(f"❌ Erreur d’exécution bpy.ops.{category}.{command}: {e}")
         traceback.print_exc()
-        return False
+        return _fail(f"{type(e).__name__}: {e}")
 
 
 # ----------------------------------------
@@ -297,27 +359,7 @@ def _exec_bpy_ops(operator: str, params: dict) -> bool:
 # ----------------------------------------
 
 
-def _strip_root_prefix(op: str):
-    """
-    Retourne (root, path_sans_prefix):
-      - 'context.xxx'      -> (bpy.context, 'xxx')
-      - 'bpy.context.xxx'  -> (bpy.context, 'xxx')
-      - 'data.xxx'         -> (bpy.data, 'xxx')
-      - 'bpy.data.xxx'     -> (bpy.data, 'xxx')
-      - sinon              -> (bpy.context, op)  # compat
-    """
-    if op.startswith("bpy.context."):
-        return bpy.context, op[len("bpy.context.") :]
-    if op.startswith("context."):
-        return bpy.context, op[len("context.") :]
-    if op.startswith("bpy.data."):
-        return bpy.data, op[len("bpy.data.") :]
-    if op.startswith("data."):
-        return bpy.data, op[len("data.") :]
-    return bpy.context, op  # tolérance: chemin relatif à context
-
-
-def _exec_bpy_context(operator: str, params: dict) -> bool:
+def _exec_bpy_context(operator: str, params: dict, plan: _ExecPlan | None = None) -> bool:
     """
     Exécution d’un chemin du type:
       - 'context.object.active_material.diffuse_color'  (ou 'object.active_material.diffuse_color')
@@ -327,14 +369,16 @@ def _exec_bpy_context(operator: str, params: dict) -> bool:
       - Si active_material manquant → création + assignation.
       - Si mat.use_nodes → tente Principled 'Base Color' avant diffuse_color.
     """
+    if plan is None or plan.path is None:
+        plan = _context_plan(operator)
+        if plan.path is None:
+            return _fail(f"ValueError: chemin invalide '{operator}'")
+
     # Préparer un contexte viable
     obj = ensure_active_object()
 
     # Si le chemin nécessite un matériau actif, on le crée/assigne au besoin
-    needs_material = (".active_material" in operator) or (
-        "material" in operator and "diffuse_color" in operator
-    )
-    if needs_material:
+    if plan.needs_material:
         mat = ensure_active_material(obj)
     else:
         mat = getattr(bpy.context.object, "active_material", None)
@@ -342,28 +386,25 @@ def _exec_bpy_context(operator: str, params: dict) -> bool:
     # Récupérer la valeur à écrire
     if "value" not in params:
         log.warning(f"⚠️ Aucun 'value' fourni pour l’opérateur context: {operator}")
-        return False
+        return _fail("ValueError: 'value' manquant")
 
-    value = params.get("value")
-    normalize = params.get("normalize", None)
-    if normalize == "color":
-        value = _normalize_color(value)
+    value = plan.normalized_value(params)
 
     # Si demande de couleur et matériau nodal → régler Base Color nodes en priorité
-    if mat and mat.use_nodes and "diffuse_color" in operator:
+    if mat and mat.use_nodes and plan.is_diffuse_color:
         if _set_principled_base_color(mat, value):
             return True
         # si nodes KO, on tombera sur l'affectation property ci-dessous
 
     # Support des préfixes 'context.' / 'bpy.context.' / 'data.' / 'bpy.data.'
-    root, path = _strip_root_prefix(operator)
+    root = getattr(bpy, plan.root_name)
 
-    # Résoudre le chemin
+    # Résoudre le chemin (compilé une fois par le plan)
     try:
-        parent, attr, idx = _resolve_path(root, path)
+        parent, attr, idx = _resolve_compiled(root, plan.path)
         if attr is None:
             log.error(f"❌ Chemin context invalide: '{operator}' (attribut final introuvable)")
-            return False
+            return _fail(f"ValueError: chemin invalide '{operator}'")
 
         _assign_value_on_attr(parent, attr, idx, value)
         log.info(f"✅ Contexte '{operator}' affecté avec value={value} (idx={idx})")
@@ -372,7 +413,105 @@ def _exec_bpy_context(operator: str, params: dict) -> bool:
     except Exception as e:
         log.error(f"❌ Erreur d’affectation context '{operator}': {e}")
         traceback.print_exc()
-        return False
+        return _fail(f"{type(e).__name__}: {e}")
+
+
+# ---------------------------
+# Plans d'exécution (cache)
+# ---------------------------
+
+
+class _ExecPlan:
+    """
+    Tout ce qui ne dépend que de l'opérateur, calculé une fois:
+    classification, appelable bpy.ops résolu, chemin context/data pré-découpé,
+    besoins de contexte (matériau), + dernière normalisation de params mémorisée.
+    """
+
+    __slots__ = (
+        "operator",
+        "kind",
+        "op_func",
+        "category",
+        "command",
+        "root_name",
+        "path",
+        "needs_material",
+        "is_diffuse_color",
+        "_params_src",
+        "_value",
+    )
+
+    def __init__(self, operator: str, kind: str):
+        self.operator = operator
+        self.kind = kind
+        self.op_func: Any = None
+        self.category = self.command = ""
+        self.root_name = "context"
+        self.path: CompiledPath | None = None
+        self.needs_material = (".active_material" in operator) or (
+            "material" in operator and "diffuse_color" in operator
+        )
+        self.is_diffuse_color = "diffuse_color" in operator
+        self._params_src: dict | None = None
+        self._value: Any = None
+
+    def normalized_value(self, params: dict) -> Any:
+        """params['value'] normalisé (RGBA…), recalculé seulement si params a changé."""
+        if params != self._params_src:
+            value = params.get("value")
+            if params.get("normalize", None) == "color":
+                value = _normalize_color(value)
+            self._params_src, self._value = dict(params), value
+        return self._value
+
+
+_plans: dict[tuple[str, str], _ExecPlan] = {}
+
+
+def _compile_plan(operator: str) -> _ExecPlan:
+    # Priorité: si le chemin ressemble à du context/data, on force "context"
+    if operator.startswith(_CONTEXT_PREFIXES):
+        kind = "context"
+    else:
+        kind = classify_operator(operator)
+    if kind == "context":
+        return _context_plan(operator)
+    plan = _ExecPlan(operator, kind)
+    if kind == "ops":
+        found = _lookup_bpy_op(operator)
+        if found is not None:
+            plan.op_func, plan.category, plan.command = found
+    return plan
+
+
+def _context_plan(operator: str) -> _ExecPlan:
+    plan = _ExecPlan(operator, "context")
+    try:
+        plan.path = compile_path(operator)
+    except ValueError as e:
+        log.error(f"❌ {e}")
+        plan.kind = "unknown"
+        return plan
+    plan.root_name = plan.path.root or "context"  # compat: chemin nu = bpy.context
+    return plan
+
+
+def get_exec_plan(name: str, operator: str) -> _ExecPlan:
+    """Plan en cache pour (nom d'intent, opérateur); un opérateur non résolu n'est pas mis
+    en cache (il peut être enregistré plus tard par un addon)."""
+    key = (name, operator)
+    plan = _plans.get(key)
+    if plan is None:
+        plan = _compile_plan(operator)
+        if plan.kind == "context" or plan.op_func is not None:
+            _plans[key] = plan
+    return plan
+
+
+def clear_exec_plans() -> None:
+    """Invalide les plans (reload de la config / de l'addon)."""
+    _plans.clear()
 
 
 # ---------------------------
@@ -398,31 +537,26 @@ def resolve_and_execute(intent: dict) -> bool:
     name = intent.get("name", "intent_sans_nom")
     operator = intent.get("operator")
     params = intent.get("params", {}) or {}
+    _fail(None)
 
     if not operator:
         log.error(f"❌ Intent '{name}': opérateur manquant.")
-        return False
+        return _fail("ValueError: opérateur manquant")
 
-    # Priorité: si le chemin ressemble à du context/data, on force "context"
-    if operator.startswith(("context.", "bpy.context.", "data.", "bpy.data.")):
-        operator_type = "context"
-    else:
-        operator_type = classify_operator(operator)
+    plan = get_exec_plan(name, operator)
+    operator_type = plan.kind
 
     log.info(f"🔎 Résolution de '{name}' → operator='{operator}' (type: {operator_type})")
 
     try:
         if operator_type == "ops":
-            return _exec_bpy_ops(operator, params)
+            return _exec_bpy_ops(operator, params, plan)
         elif operator_type == "context":
-            return _exec_bpy_context(operator, params)
+            return _exec_bpy_context(operator, params, plan)
         else:
-            # Tolérance: retenter en "context" si le format s'y prête
-            if operator.startswith(("context.", "bpy.context.", "data.", "bpy.data.")):
-                return _exec_bpy_context(operator, params)
             log.warning(f"⚠️ Type d’opérateur non supporté pour '{name}': {operator_type}")
-            return False
+            return _fail(f"ValueError: type d'opérateur non supporté '{operator_type}'")
     except Exception as e:
         log.error(f"❌ Erreur pendant l'exécution de '{name}' ({operator}): {e}")
         traceback.print_exc()
-        return False
+        return _fail(f"{type(e).__name__}: {e}")
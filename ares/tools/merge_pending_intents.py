@@ -3,6 +3,7 @@
 import os
 from datetime import datetime
 
+from ares.core.intent_catalog import read_catalog_data
 from ares.core.logger import get_logger
 from ares.tools.utils_yaml import load_yaml, save_yaml
 
@@ -14,7 +15,7 @@ PENDING_PATH = os.path.join(CONFIG_DIR, "intents_pending.yaml")
 
 
 def merge_pending_intents():
-    base = load_yaml(VOICE_CONFIG)
+    base = read_catalog_data(VOICE_CONFIG)
     pending = load_yaml(PENDING_PATH)
 
     if not isinstance(base, list):
@@ -1,16 +1,26 @@
 # ares/tools/nlp_intent_matcher.py
 """
 nlp_intent_matcher.py – Correspondance floue/NLP pour les intents Blade.
-Utilise spaCy si dispo (fr_core_news_sm), sinon fallback difflib.
+Utilise spaCy si dispo (fr_core_news_sm), sinon fallback n-grammes caractères.
 - Prend en compte: 'phrase' (str), 'phrases' (List[str]), 'aliases' (List[str])
 - Normalise: minuscules + suppression des accents
 - Seuil par défaut abaissé à 0.50 pour mieux capter les tournures FR
 - Petit lexique de couleurs pour booster les correspondances
+- Moteur vectorisé: n-grammes caractères + tokens précalculés pour toutes les variantes,
+  scoring d'une phrase contre tout le catalogue en un seul produit creux (NumPy si dispo)
 """
 
 import difflib
+import heapq
+import math
 import re
 import unicodedata
+from collections import defaultdict
+
+try:
+    import numpy as np
+except Exception:  # outils externes sans numpy → fallback Python pur
+    np = None
 
 # Chargement spaCy si dispo
 try:
@@ -48,6 +58,8 @@ STOPWORDS = {
     "'",  # tolérance basique
 }
 
+COLOR_BOOST = 0.15
+
 COLOR_SYNONYMS = {
     "rouge": {"rouge", "red"},
     "vert": {"vert", "verte", "green"},
@@ -59,6 +71,9 @@ COLOR_SYNONYMS = {
     "violet": {"violet", "violette", "purple"},
 }
 
+# synonyme → classe de couleur (index inversé)
+_SYNONYM_TO_COLOR = {syn: cname for cname, syns in COLOR_SYNONYMS.items() for syn in syns}
+
 
 def _strip_accents(s: str) -> str:
     return "".join(c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn")
@@ -94,15 +109,398 @@ def _iter_variants(intent: dict) -> list[str]:
     return uniq
 
 
-def _boost_color(phrase_n: str, intent: dict, base_score: float) -> float:
-    # Si la phrase mentionne une couleur, on booste les intents contenant cette couleur.
-    for cname, syns in COLOR_SYNONYMS.items():
-        if any(s in phrase_n.split() for s in syns):
-            # présence du mot-couleur dans intent (name/phrases)
-            blob = " ".join(_iter_variants(intent) + [_norm(intent.get("name", ""))])
-            if cname in blob.split():
-                return min(1.0, base_score + 0.15)
-    return base_score
+def _features(text_n: str) -> dict[str, float]:
+    """
+    Vecteur creux (TF normalisé L2) d'une phrase déjà normalisée:
+    trigrammes caractères (avec bords) + tokens entiers.
+    """
+    if not text_n:
+        return {}
+    tf: dict[str, float] = defaultdict(float)
+    padded = f" {text_n} "
+    for i in range(len(padded) - 2):
+        tf[padded[i : i + 3]] += 1.0
+    for tok in text_n.split():
+        tf["w:" + tok] += 1.0
+    norm = math.sqrt(sum(v * v for v in tf.values())) or 1.0
+    return {k: v / norm for k, v in tf.items()}
+
+
+def _concat_ranges(starts, ends):
+    """Indices concaténés de [starts[i], ends[i]) pour tout i (gather vectorisé NumPy)."""
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(int(lengths.sum()), dtype=np.int64), lengths
+
+
+class _MatcherEngine:
+    """
+    Index précalculé pour une liste d'intents donnée.
+    - une ligne par variante normalisée (matrice creuse variantes × features,
+      stockée par colonne pour le scan complet et par ligne pour le scan élagué)
+    - owner[i] = index de l'intent propriétaire de la variante i (variantes contiguës par intent)
+    - couleurs présentes dans chaque intent (pour le boost couleur)
+    - index inversé token normalisé / classe de couleur → intents (élagage des candidats)
+    Le scoring d'une phrase = un produit creux matrice·vecteur (cosinus), puis max par intent.
+    """
+
+    def __init__(self, intents: list[dict]):
+        self.source = intents  # référence forte: identité = clé de cache
+        self.intents = list(intents)
+        self.size = len(intents)
+
+        variants: list[str] = []
+        owner: list[int] = []
+        offsets = [0]
+        intent_colors: list[frozenset[str]] = []
+        token_postings: dict[str, set[int]] = defaultdict(set)
+        color_postings: dict[str, set[int]] = defaultdict(set)
+        for idx, intent in enumerate(self.intents):
+            vs = _iter_variants(intent)
+            variants.extend(vs)
+            owner.extend([idx] * len(vs))
+            offsets.append(len(variants))
+            blob = set(" ".join(vs + [_norm(intent.get("name", ""))]).split())
+            colors = frozenset(c for c in COLOR_SYNONYMS if c in blob)
+            intent_colors.append(colors)
+            for tok in blob:
+                token_postings[tok].add(idx)
+            for c in colors:
+                color_postings[c].add(idx)
+        self.variants = variants
+        self.owner = owner
+        self.intent_colors = intent_colors
+        self.token_postings = dict(token_postings)
+        self.color_postings = dict(color_postings)
+
+        row_feats = [_features(v) for v in variants]
+
+        # Colonnes: feature → [(row, weight), ...]
+        columns: dict[str, list[tuple[int, float]]] = defaultdict(list)
+        for row, feats in enumerate(row_feats):
+            for feat, w in feats.items():
+                columns[feat].append((row, w))
+
+        self.vocab: dict[str, int] = {}
+        indptr = [0]
+        rows: list[int] = []
+        vals: list[float] = []
+        for col, (feat, entries) in enumerate(columns.items()):
+            self.vocab[feat] = col
+            rows.extend(r for r, _ in entries)
+            vals.extend(w for _, w in entries)
+            indptr.append(len(rows))
+
+        # Lignes (CSR) pour le scoring restreint aux candidats
+        row_ptr = [0]
+        row_cols: list[int] = []
+        row_vals: list[float] = []
+        for feats in row_feats:
+            row_cols.extend(self.vocab[f] for f in feats)
+            row_vals.extend(feats.values())
+            row_ptr.append(len(row_cols))
+
+        # spaCy: variantes parsées une seule fois (nlp.pipe) → matrice de vecteurs normalisés
+        self._vectors = None
+        if nlp_fr is not None and np is not None and variants:
+            self._vectors = self._embed(variants)
+
+        if np is not None:
+            self._indptr = np.asarray(indptr, dtype=np.int64)
+            self._rows = np.asarray(rows, dtype=np.int64)
+            self._vals = np.asarray(vals, dtype=np.float64)
+            self._row_ptr = np.asarray(row_ptr, dtype=np.int64)
+            self._row_cols = np.asarray(row_cols, dtype=np.int64)
+            self._row_vals = np.asarray(row_vals, dtype=np.float64)
+            self._owner = np.asarray(owner, dtype=np.int64)
+            self._offsets = np.asarray(offsets, dtype=np.int64)
+            # intents × classes de couleur (boost couleur vectorisé en mode lot)
+            self._color_names = list(COLOR_SYNONYMS)
+            self._color_matrix = np.array(
+                [[c in cs for c in self._color_names] for cs in intent_colors], dtype=np.float64
+            ).reshape(self.size, len(self._color_names))
+        else:
+            self._indptr, self._rows, self._vals = indptr, rows, vals
+            self._row_ptr, self._row_cols, self._row_vals = row_ptr, row_cols, row_vals
+            self._owner, self._offsets = owner, offsets
+
+    @staticmethod
+    def _embed(texts: list[str]):
+        vecs = [doc.vector for doc in nlp_fr.pipe(texts)]
+        mat = np.vstack(vecs).astype(np.float64) if vecs else np.zeros((0, 0))
+        norms = np.linalg.norm(mat, axis=1)
+        nz = norms > 0
+        mat[nz] /= norms[nz, None]
+        return mat
+
+    # -- élagage -------------------------------------------------------------
+
+    def candidate_intents(self, phrase_n: str) -> list[int] | None:
+        """
+        Union des postings (tokens hors stopwords + classes de couleur) de la phrase.
+        None si aucun candidat → l'appelant fait un scan complet.
+        """
+        ids: set[int] = set()
+        for tok in set(phrase_n.split()):
+            ids |= self.token_postings.get(tok, set())
+            cname = _SYNONYM_TO_COLOR.get(tok)
+            if cname:
+                ids |= self.color_postings.get(cname, set())
+        return sorted(ids) if ids else None
+
+    def _candidate_rows(self, candidates: list[int]):
+        if np is not None:
+            cand = np.asarray(candidates, dtype=np.int64)
+            rows, _ = _concat_ranges(self._offsets[cand], self._offsets[cand + 1])
+            return rows
+        return [r for i in candidates for r in range(self._offsets[i], self._offsets[i + 1])]
+
+    # -- scoring -------------------------------------------------------------
+
+    def variant_scores(self, phrase_n: str):
+        """
+        Score de la phrase contre les variantes des intents candidats (toutes si aucun candidat):
+        - spaCy dispo: cosinus des vecteurs (phrase parsée une seule fois, matrice en cache)
+        - sinon: cosinus n-grammes (un seul produit creux)
+        Les variantes élaguées ont un score de 0.
+        """
+        n = len(self.variants)
+        candidates = self.candidate_intents(phrase_n)
+        rows = self._candidate_rows(candidates) if candidates is not None else None
+
+        if self._vectors is not None:
+            q = nlp_fr(phrase_n).vector.astype(np.float64)
+            q_norm = float(np.linalg.norm(q))
+            if q_norm == 0.0 or n == 0:
+                return np.zeros(n, dtype=np.float64)
+            if rows is None:
+                return self._vectors @ (q / q_norm)
+            scores = np.zeros(n, dtype=np.float64)
+            scores[rows] = self._vectors[rows] @ (q / q_norm)
+            return scores
+
+        q = [(self.vocab[f], w) for f, w in _features(phrase_n).items() if f in self.vocab]
+
+        if np is not None:
+            if not q or n == 0:
+                return np.zeros(n, dtype=np.float64)
+            cols = np.fromiter((c for c, _ in q), dtype=np.int64, count=len(q))
+            qw = np.fromiter((w for _, w in q), dtype=np.float64, count=len(q))
+            if rows is None:
+                # Scan complet: concatène les postings des features de la requête
+                take, lengths = _concat_ranges(self._indptr[cols], self._indptr[cols + 1])
+                weights = self._vals[take] * np.repeat(qw, lengths)
+                return np.bincount(self._rows[take], weights=weights, minlength=n)
+            # Scan élagué: lignes candidates seulement, requête en vecteur dense
+            q_dense = np.zeros(len(self.vocab), dtype=np.float64)
+            q_dense[cols] = qw
+            take, lengths = _concat_ranges(self._row_ptr[rows], self._row_ptr[rows + 1])
+            weights = self._row_vals[take] * q_dense[self._row_cols[take]]
+            return np.bincount(np.repeat(rows, lengths), weights=weights, minlength=n)
+
+        scores = [0.0] * n
+        if rows is None:
+            for col, w in q:
+                for k in range(self._indptr[col], self._indptr[col + 1]):
+                    scores[self._rows[k]] += self._vals[k] * w
+            return scores
+        q_map = dict(q)
+        for row in rows:
+            acc = 0.0
+            for k in range(self._row_ptr[row], self._row_ptr[row + 1]):
+                acc += self._row_vals[k] * q_map.get(self._row_cols[k], 0.0)
+            scores[row] = acc
+        return scores
+
+    def breakdown(self, phrase_n: str):
+        """
+        Scores par intent, alignés sur self.intents:
+        - fuzzy: max sur les variantes de l'intent
+        - boost: bonus couleur effectivement appliqué (plafonné pour que fuzzy+boost <= 1)
+        """
+        vscores = self.variant_scores(phrase_n)
+        phrase_toks = set(phrase_n.split())
+        mentioned = {c for c, syns in COLOR_SYNONYMS.items() if syns & phrase_toks}
+
+        if np is not None:
+            fuzzy = np.zeros(self.size, dtype=np.float64)
+            if len(vscores):
+                np.maximum.at(fuzzy, self._owner, vscores)
+            boost = np.zeros(self.size, dtype=np.float64)
+            if mentioned:
+                mask = np.fromiter(
+                    (bool(cs & mentioned) for cs in self.intent_colors),
+                    dtype=bool,
+                    count=self.size,
+                )
+                boost[mask] = np.minimum(1.0, fuzzy[mask] + COLOR_BOOST) - fuzzy[mask]
+            return fuzzy, boost
+
+        fuzzy = [0.0] * self.size
+        for row, sc in enumerate(vscores):
+            o = self._owner[row]
+            if sc > fuzzy[o]:
+                fuzzy[o] = sc
+        boost = [0.0] * self.size
+        if mentioned:
+            for idx, cs in enumerate(self.intent_colors):
+                if cs & mentioned:
+                    boost[idx] = min(1.0, fuzzy[idx] + COLOR_BOOST) - fuzzy[idx]
+        return fuzzy, boost
+
+    def _variant_scores_batch(self, phrases_n: list[str]):
+        """Matrice (phrases × variantes) des scores, calculée en un seul produit (NumPy requis)."""
+        m, n = len(phrases_n), len(self.variants)
+        if n == 0:
+            return np.zeros((m, 0), dtype=np.float64)
+
+        if self._vectors is not None:
+            q = np.vstack([doc.vector for doc in nlp_fr.pipe(phrases_n)]).astype(np.float64)
+            norms = np.linalg.norm(q, axis=1)
+            nz = norms > 0
+            q[nz] /= norms[nz, None]
+            return q @ self._vectors.T
+
+        qids: list[int] = []
+        cols: list[int] = []
+        qws: list[float] = []
+        for qi, p in enumerate(phrases_n):
+            for f, w in _features(p).items():
+                col = self.vocab.get(f)
+                if col is not None:
+                    qids.append(qi)
+                    cols.append(col)
+                    qws.append(w)
+        if not cols:
+            return np.zeros((m, n), dtype=np.float64)
+        cols_a = np.asarray(cols, dtype=np.int64)
+        take, lengths = _concat_ranges(self._indptr[cols_a], self._indptr[cols_a + 1])
+        weights = self._vals[take] * np.repeat(np.asarray(qws, dtype=np.float64), lengths)
+        flat = np.repeat(np.asarray(qids, dtype=np.int64), lengths) * n + self._rows[take]
+        return np.bincount(flat, weights=weights, minlength=m * n).reshape(m, n)
+
+    def breakdown_batch(self, phrases_n: list[str]):
+        """
+        Version lot de breakdown(): matrices (phrases × intents) pour fuzzy et boost couleur.
+        NumPy: un seul produit pour toutes les phrases, puis même élagage que le chemin unitaire.
+        Sans NumPy: boucle sur breakdown().
+        """
+        if np is None or not phrases_n:
+            pairs = [self.breakdown(p) for p in phrases_n]
+            return [f for f, _ in pairs], [b for _, b in pairs]
+
+        m, n = len(phrases_n), len(self.variants)
+        vscores = self._variant_scores_batch(phrases_n)
+        for qi, p in enumerate(phrases_n):
+            candidates = self.candidate_intents(p)
+            if candidates is not None:
+                keep = np.zeros(n, dtype=bool)
+                keep[self._candidate_rows(candidates)] = True
+                vscores[qi, ~keep] = 0.0
+
+        fuzzy = np.zeros((m, self.size), dtype=np.float64)
+        if n:
+            np.maximum.at(fuzzy, (slice(None), self._owner), vscores)
+
+        mentioned = np.array(
+            [
+                [bool(COLOR_SYNONYMS[c] & set(p.split())) for c in self._color_names]
+                for p in phrases_n
+            ],
+            dtype=np.float64,
+        ).reshape(m, len(self._color_names))
+        mask = (mentioned @ self._color_matrix.T) > 0
+        boost = np.where(mask, np.minimum(1.0, fuzzy + COLOR_BOOST) - fuzzy, 0.0)
+        return fuzzy, boost
+
+    def intent_scores(self, phrase_n: str):
+        """Score max par intent (sur ses variantes), boost couleur inclus."""
+        fuzzy, boost = self.breakdown(phrase_n)
+        if np is not None:
+            return fuzzy + boost
+        return [f + b for f, b in zip(fuzzy, boost, strict=True)]
+
+
+_engine: _MatcherEngine | None = None
+
+
+def _get_engine(intents: list[dict]) -> _MatcherEngine:
+    """Réutilise le moteur tant que la même liste d'intents est fournie (cache par identité)."""
+    global _engine
+    if _engine is None or _engine.source is not intents or _engine.size != len(intents):
+        _engine = _MatcherEngine(intents)
+    return _engine
+
+
+def invalidate_engine() -> None:
+    """Force la reconstruction du moteur (ex: catalogue modifié en place)."""
+    global _engine
+    _engine = None
+
+
+def score_breakdown(phrase: str, intents: list[dict]) -> tuple[list[float], list[float]]:
+    """Scores (fuzzy, boost couleur) par intent, alignés sur `intents`, en une seule passe."""
+    if not intents:
+        return [], []
+    fuzzy, boost = _get_engine(intents).breakdown(_norm(phrase))
+    return [float(x) for x in fuzzy], [float(x) for x in boost]
+
+
+def match_top_k(phrase: str, intents: list[dict], k: int = 5, threshold: float = 0.0) -> list[dict]:
+    """
+    Retourne les k meilleurs intents (tas borné), du meilleur au moins bon:
+      [{"intent": dict, "score": float, "fuzzy": float, "color_boost": float}, ...]
+    Seuls les candidats avec score > 0 et >= threshold sont retenus.
+    """
+    if k <= 0:
+        return []
+    fuzzy, boost = score_breakdown(phrase, intents)
+    top = heapq.nlargest(k, range(len(fuzzy)), key=lambda i: (fuzzy[i] + boost[i], -i))
+    out = []
+    for i in top:
+        score = fuzzy[i] + boost[i]
+        if score <= 0.0 or score < threshold:
+            break
+        out.append(
+            {"intent": intents[i], "score": score, "fuzzy": fuzzy[i], "color_boost": boost[i]}
+        )
+    return out
+
+
+def match_batch(
+    phrases: list[str], intents: list[dict], threshold: float = 0.50
+) -> list[tuple[dict | None, float]]:
+    """
+    Équivalent de match_intent() pour un lot de phrases, scoré en un seul passage vectorisé.
+    Retourne une liste alignée sur `phrases`: [(intent | None, score), ...]
+    """
+    phrases_n = [_norm(p) for p in phrases]
+    if not phrases_n:
+        return []
+    if not intents:
+        return [(None, 0.0)] * len(phrases_n)
+
+    fuzzy, boost = _get_engine(intents).breakdown_batch(phrases_n)
+    if np is not None:
+        totals = fuzzy + boost
+        best_idx = np.argmax(totals, axis=1)
+        best_scores = totals[np.arange(len(phrases_n)), best_idx]
+    else:
+        totals = [
+            [f + b for f, b in zip(fr, br, strict=True)]
+            for fr, br in zip(fuzzy, boost, strict=True)
+        ]
+        best_idx = [max(range(len(row)), key=row.__getitem__) for row in totals]
+        best_scores = [row[i] for row, i in zip(totals, best_idx, strict=True)]
+
+    out: list[tuple[dict | None, float]] = []
+    for idx, score in zip(best_idx, best_scores, strict=True):
+        score = float(score)
+        if score >= threshold and score > 0.0:
+            out.append((intents[int(idx)], score))
+        else:
+            out.append((None, score))
+    return out
 
 
 def similarity(phrase: str, candidate: str) -> float:
@@ -119,26 +517,18 @@ def match_intent(
     phrase: str, intents: list[dict], threshold: float = 0.50
 ) -> tuple[dict | None, float]:
     phrase_n = _norm(phrase)
-    best_score = 0.0
-    best_intent = None
-
-    # Construire la liste des variantes normalisées par intent
-    variants = [(intent, _iter_variants(intent)) for intent in intents]
-
-    for intent, vs in variants:
-        # score max sur toutes les variantes de cet intent
-        local_best = 0.0
-        for v in vs:
-            local_best = max(local_best, similarity(phrase_n, v))
-        # Boost couleur si nécessaire
-        local_best = _boost_color(phrase_n, intent, local_best)
-
-        if local_best > best_score:
-            best_score = local_best
-            best_intent = intent
-
-    if best_score >= threshold:
-        return best_intent, best_score
+    if not intents:
+        return None, 0.0
+
+    scores = _get_engine(intents).intent_scores(phrase_n)
+    if np is not None:
+        best_idx = int(np.argmax(scores))
+    else:
+        best_idx = max(range(len(scores)), key=scores.__getitem__)
+    best_score = float(scores[best_idx])
+
+    if best_score >= threshold and best_score > 0.0:
+        return intents[best_idx], best_score
     return None, best_score
 
 
@@ -0,0 +1,105 @@
+# ares/tools/node_cache.py
+"""
+node_cache.py – Rôles des nodes d'un matériau (Principled, Output, lien Surface) en cache.
+
+- Clé: pointeur du matériau (mat.as_pointer()), stable tant que le matériau existe
+- Entrée: pointeur du node_tree + noms du Principled et de l'Output
+- Invalidation: le handler depsgraph (bots/editor_watcher) marque le matériau modifié;
+  une entrée marquée est revalidée par noms (nodes.get + is_linked) au lieu d'un
+  parcours de tous les nodes/liens
+- Sans handler enregistré (hors Blender, watcher désactivé): revalidation à chaque lookup
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+PRINCIPLED = "ShaderNodeBsdfPrincipled"
+OUTPUT = "ShaderNodeOutputMaterial"
+
+
+class NodeRoles:
+    """Nodes clés d'un node_tree de matériau."""
+
+    __slots__ = ("tree", "principled", "output")
+
+    def __init__(self, tree: int, principled: Any, output: Any):
+        self.tree = tree
+        self.principled = principled
+        self.output = output
+
+
+_roles: dict[int, NodeRoles] = {}
+_dirty: set[int] = set()
+_tracking = False
+
+
+def set_tracking(enabled: bool) -> None:
+    """Active la confiance dans les invalidations depsgraph (handler enregistré)."""
+    global _tracking
+    _tracking = enabled
+    if not enabled:
+        clear()
+
+
+def _revalidate(entry: NodeRoles, nt: Any) -> bool:
+    """Vérifie l'entrée en O(1) côté Python; rafraîchit les références de nodes."""
+    try:
+        if nt.as_pointer() != entry.tree:
+            return False
+        principled = nt.nodes.get(entry.principled.name)
+        output = nt.nodes.get(entry.output.name)
+        if principled is None or output is None:
+            return False
+        if principled.bl_idname != PRINCIPLED or output.bl_idname != OUTPUT:
+            return False
+        surface = output.inputs.get("Surface")
+        if surface is None or not surface.is_linked:
+            return False
+    except ReferenceError:  # node supprimé depuis la mise en cache
+        return False
+    entry.principled, entry.output = principled, output
+    return True
+
+
+def lookup(mat: Any) -> NodeRoles | None:
+    """Rôles en cache pour `mat` (None = absent ou périmé: au resolver de scanner)."""
+    key = mat.as_pointer()
+    entry = _roles.get(key)
+    if entry is None:
+        return None
+    if _tracking and key not in _dirty:
+        return entry
+    if _revalidate(entry, mat.node_tree):
+        _dirty.discard(key)
+        return entry
+    forget(key)
+    return None
+
+
+def store(mat: Any, principled: Any, output: Any) -> NodeRoles:
+    key = mat.as_pointer()
+    entry = NodeRoles(mat.node_tree.as_pointer(), principled, output)
+    _roles[key] = entry
+    _dirty.discard(key)
+    return entry
+
+
+def mark_dirty(pointer: int) -> None:
+    """Appelé par le handler depsgraph pour un matériau mis à jour."""
+    if pointer in _roles:
+        _dirty.add(pointer)
+
+
+def forget(pointer: int) -> None:
+    _roles.pop(pointer, None)
+    _dirty.discard(pointer)
+
+
+def clear() -> None:
+    _roles.clear()
+    _dirty.clear()
+
+
+def stats() -> dict[str, int]:
+    return {"size": len(_roles), "dirty": len(_dirty)}
@@ -0,0 +1,143 @@
+# ares/tools/object_index.py
+"""
+object_index.py – Index des objets de la scène par type (auto-fix du contexte).
+
+- Construit une fois par scène (un seul parcours de scene.objects), puis tenu à jour
+  par le handler depsgraph (bots/editor_watcher): objet modifié → note_object
+- Par type: {nom: position dans scene.objects}, même ordre que l'ancien parcours
+  → "dernier mesh visible" = parcours à rebours, arrêté au premier candidat
+- Objet modifié: garde sa position; objet inconnu (ajouté, renommé), changement de
+  type ou autre objet sous un nom connu (supprimé puis recréé: pointeur différent)
+  → index reconstruit au prochain lookup (ordre de la scène préservé)
+- Ajout/suppression (update Scene/Collection): nombre d'objets différent de l'index
+  → reconstruction paresseuse (couvre un nom supprimé puis recréé à la même adresse)
+- Visibilité: objets vus cachés mémorisés (sauts O(1)); update de la scène
+  (hide/unhide, view layer) → revérification paresseuse via hide_get()
+- Objets supprimés/renommés: détectés au lookup (scene.objects.get → None) et retirés
+- Sans handler enregistré: index reconstruit à chaque requête (= ancien parcours)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+EDITABLE_TYPES = ("MESH", "CURVE", "SURFACE", "META", "GPENCIL")
+
+_by_type: dict[str, dict[str, int]] = {}
+_type_of: dict[str, str] = {}
+_ptr_of: dict[str, int] = {}  # nom → obj.as_pointer() indexé
+_hidden: set[str] = set()
+_scene: int | None = None
+_count = 0  # len(scene.objects) au dernier rebuild
+_tracking = False
+
+
+def set_tracking(enabled: bool) -> None:
+    """Active la mise à jour incrémentale (handler depsgraph enregistré)."""
+    global _tracking
+    _tracking = enabled
+    clear()
+
+
+def clear() -> None:
+    global _scene
+    _by_type.clear()
+    _type_of.clear()
+    _ptr_of.clear()
+    _hidden.clear()
+    _scene = None
+
+
+def _add(name: str, kind: str, seq: int, ptr: int) -> None:
+    _type_of[name] = kind
+    _ptr_of[name] = ptr
+    _by_type.setdefault(kind, {})[name] = seq
+
+
+def _drop(name: str) -> None:
+    kind = _type_of.pop(name, None)
+    _ptr_of.pop(name, None)
+    if kind is not None:
+        _by_type[kind].pop(name, None)
+    _hidden.discard(name)
+
+
+def rebuild(scene: Any) -> None:
+    """Indexe tous les objets de `scene` (ordre de scene.objects)."""
+    global _scene, _count
+    clear()
+    for seq, obj in enumerate(scene.objects):
+        _add(obj.name, obj.type, seq, obj.as_pointer())
+    _scene = scene.as_pointer()
+    _count = len(scene.objects)
+
+
+def note_object(obj: Any) -> None:
+    """Objet ajouté ou modifié (update depsgraph)."""
+    global _scene
+    if _scene is None:
+        return  # pas encore indexé: le premier lookup fera le parcours complet
+    name = obj.name
+    if _type_of.get(name) != obj.type or _ptr_of.get(name) != obj.as_pointer():
+        _scene = None  # position inconnue dans scene.objects: reconstruction paresseuse
+        return
+    _hidden.discard(name)  # visibilité revérifiée au prochain lookup
+
+
+def note_membership(scene: Any) -> None:
+    """Update Scene/Collection: objets ajoutés ou supprimés → index à reconstruire."""
+    global _scene
+    if _scene is not None and (_scene != scene.as_pointer() or len(scene.objects) != _count):
+        _scene = None
+
+
+def recheck_visibility() -> None:
+    """Update de la scène (hide/unhide…): les objets cachés seront revérifiés."""
+    _hidden.clear()
+
+
+def find_editable(
+    scene: Any,
+    types: Iterable[str] = EDITABLE_TYPES,
+    *,
+    visible_only: bool = True,
+    last: bool = True,
+) -> Any:
+    """Dernier (ou premier si not last) objet de `scene` parmi `types`, dans l'ordre de
+    scene.objects (visible si visible_only), sinon None."""
+    if not _tracking or _scene != scene.as_pointer():
+        rebuild(scene)
+    objects = scene.objects
+    sign = 1 if last else -1
+    best, best_key, stale = None, None, []
+    for kind in types:
+        names = _by_type.get(kind)
+        if not names:
+            continue
+        for name in reversed(names) if last else names:
+            key = sign * names[name]
+            if best_key is not None and key < best_key:
+                break  # au-delà du meilleur candidat déjà trouvé
+            if visible_only and name in _hidden:
+                continue
+            obj = objects.get(name)
+            if obj is None:
+                stale.append(name)
+                continue
+            if obj.as_pointer() != _ptr_of.get(name):
+                # supprimé puis recréé sous le même nom sans notification: position périmée
+                rebuild(scene)
+                return find_editable(scene, types, visible_only=visible_only, last=last)
+            if visible_only and obj.hide_get():
+                _hidden.add(name)
+                continue
+            best, best_key = obj, key
+            break
+    for name in stale:
+        _drop(name)
+    return best
+
+
+def stats() -> dict[str, int]:
+    return {"objects": len(_type_of), "hidden": len(_hidden), "types": len(_by_type)}
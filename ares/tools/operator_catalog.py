@@ -0,0 +1,259 @@
+# ares/tools/operator_catalog.py
+"""
+operator_catalog.py – Catalogue introspecté des opérateurs bpy.ops (construit une fois).
+
+- À l'enregistrement de l'addon: parcours de bpy.ops.* → {"mesh.primitive_cube_add":
+  {prop: schéma RNA}} (type, taille de tableau, items d'enum, bornes)
+- Snapshot JSON dans ares/cache/ par version de Blender (bpy.app.version_string):
+  les démarrages suivants relisent le JSON au lieu de ré-introspecter ~2000 opérateurs
+- Classification ("ops" ou pas) et validation des params = lookups de dict;
+  un intent aux params invalides est rejeté avant l'appel de l'opérateur
+- Opérateur absent du catalogue (addon activé après coup): vérifié une fois via RNA
+  puis ajouté en mémoire
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+from numbers import Number
+from typing import Any
+
+from ares.core.logger import get_logger
+
+log = get_logger("OperatorCatalog")
+
+# ⚠️ À incrémenter si la structure du schéma change (invalide les snapshots existants)
+OPERATOR_CATALOG_FORMAT = 1
+
+CACHE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "cache"))
+
+_catalog: OperatorCatalog | None = None
+
+
+# ---------------------------
+# Introspection RNA
+# ---------------------------
+
+
+def _prop_schema(prop: Any) -> dict[str, Any]:
+    kind = prop.type
+    schema: dict[str, Any] = {"type": kind}
+    if kind in {"FLOAT", "INT", "BOOLEAN"}:
+        length = int(getattr(prop, "array_length", 0) or 0)
+        if length:
+            schema["array"] = length
+        if kind != "BOOLEAN":
+            schema["min"], schema["max"] = prop.hard_min, prop.hard_max
+    elif kind == "ENUM":
+        # enums dynamiques (callback): items vides hors contexte → non vérifiés
+        schema["enum"] = [item.identifier for item in prop.enum_items]
+        if prop.is_enum_flag:
+            schema["flag"] = True
+    return schema
+
+
+def _op_schema(op: Any) -> dict[str, dict[str, Any]]:
+    rna = op.get_rna_type()
+    return {p.identifier: _prop_schema(p) for p in rna.properties if p.identifier != "rna_type"}
+
+
+def introspect_operators(ops: Any) -> dict[str, dict[str, dict[str, Any]]]:
+    """{"categorie.commande": {prop: schéma}} pour tous les opérateurs de `ops` (bpy.ops)."""
+    table: dict[str, dict[str, dict[str, Any]]] = {}
+    for category in dir(ops):
+        if category.startswith("_"):
+            continue
+        module = getattr(ops, category)
+        for command in dir(module):
+            if command.startswith("_"):
+                continue
+            try:
+                table[f"{category}.{command}"] = _op_schema(getattr(module, command))
+            except Exception:  # opérateur non introspectable: ignoré
+                continue
+    return table
+
+
+# ---------------------------
+# Catalogue
+# ---------------------------
+
+
+class OperatorCatalog:
+    """Index des opérateurs et de leurs propriétés RNA (lecture seule, sauf découverte)."""
+
+    def __init__(self, version: str, operators: dict[str, dict[str, dict[str, Any]]]):
+        self.version = version
+        self.operators = operators
+        self.categories = {idname.split(".", 1)[0] for idname in operators}
+
+    def __len__(self) -> int:
+        return len(self.operators)
+
+    def __contains__(self, idname: str) -> bool:
+        return self.has_operator(idname)
+
+    def has_category(self, category: str) -> bool:
+        return category in self.categories
+
+    def has_operator(self, idname: str) -> bool:
+        """Opérateur connu (catalogue, sinon vérification RNA unique pour les addons tardifs)."""
+        if idname in self.operators:
+            return True
+        return self._discover(idname) is not None
+
+    def schema(self, idname: str) -> dict[str, dict[str, Any]] | None:
+        props = self.operators.get(idname)
+        return props if props is not None else self._discover(idname)
+
+    def _discover(self, idname: str) -> dict[str, dict[str, Any]] | None:
+        parts = idname.split(".")
+        if len(parts) != 2 or not all(p.isidentifier() for p in parts):
+            return None
+        try:
+            import bpy
+
+            props = _op_schema(getattr(getattr(bpy.ops, parts[0]), parts[1]))
+        except Exception:  # non enregistré (get_rna_type lève KeyError)
+            return None
+        self.operators[idname] = props
+        self.categories.add(parts[0])
+        return props
+
+    def validate_params(self, idname: str, params: dict[str, Any] | None) -> list[str]:
+        """Erreurs de params pour l'opérateur (liste vide = OK, opérateur inconnu = erreur)."""
+        props = self.schema(idname)
+        if props is None:
+            return [f"opérateur inconnu bpy.ops.{idname}"]
+        errors = []
+        for key, value in (params or {}).items():
+            spec = props.get(key)
+            if spec is None:
+                errors.append(f"paramètre inconnu '{key}' (attendus: {', '.join(sorted(props))})")
+                continue
+            error = check_value(spec, value)
+            if error:
+                errors.append(f"'{key}': {error}")
+        return errors
+
+
+def check_value(spec: dict[str, Any], value: Any) -> str | None:
+    """Message d'erreur si `value` ne respecte pas le schéma RNA `spec`, sinon None."""
+    kind = spec["type"]
+    length = spec.get("array")
+    if length:
+        if isinstance(value, (str, bytes, dict)) or not hasattr(value, "__len__"):
+            return f"séquence de {length} attendue, reçu {value!r}"
+        if len(value) != length:
+            return f"{length} composantes attendues, reçu {len(value)}"
+        values = list(value)
+    else:
+        values = [value]
+
+    for v in values:
+        if kind == "BOOLEAN" and not isinstance(v, (bool, int)):
+            return f"booléen attendu, reçu {v!r}"
+        if kind in {"INT", "FLOAT"}:
+            if isinstance(v, bool) or not isinstance(v, Number):
+                return f"nombre attendu, reçu {v!r}"
+            if kind == "INT" and not isinstance(v, int):
+                return f"entier attendu, reçu {v!r}"
+            lo, hi = spec.get("min"), spec.get("max")
+            if (lo is not None and v < lo) or (hi is not None and v > hi):
+                return f"{v!r} hors bornes [{lo}, {hi}]"
+        if kind == "STRING" and not isinstance(v, str):
+            return f"texte attendu, reçu {v!r}"
+    if kind == "ENUM" and spec.get("enum"):
+        chosen = set(value) if spec.get("flag") and not isinstance(value, str) else {value}
+        unknown = sorted(str(c) for c in chosen if c not in spec["enum"])
+        if unknown:
+            return f"valeur(s) {unknown} hors enum {spec['enum']}"
+    return None
+
+
+# ---------------------------
+# Snapshot disque
+# ---------------------------
+
+
+def _snapshot_path(version: str) -> str:
+    safe = re.sub(r"[^\w.\-]+", "_", version)
+    return os.path.join(CACHE_DIR, f"operator_catalog.{safe}.v{OPERATOR_CATALOG_FORMAT}.json")
+
+
+def _read_snapshot(version: str) -> OperatorCatalog | None:
+    path = _snapshot_path(version)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != version or data.get("format") != OPERATOR_CATALOG_FORMAT:
+            return None
+        return OperatorCatalog(version, data["operators"])
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f"⚠️ Snapshot opérateurs illisible ({path}): {e}")
+        return None
+
+
+def _write_snapshot(cat: OperatorCatalog) -> None:
+    path = _snapshot_path(cat.version)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "format": OPERATOR_CATALOG_FORMAT,
+                    "version": cat.version,
+                    "operators": cat.operators,
+                },
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp, path)
+    except Exception as e:
+        log.warning(f"⚠️ Écriture snapshot opérateurs impossible: {e}")
+
+
+# ---------------------------
+# API
+# ---------------------------
+
+
+def load_operator_catalog(*, rebuild: bool = False) -> OperatorCatalog:
+    """Catalogue de la version de Blender courante (mémoire → snapshot JSON → introspection)."""
+    global _catalog
+    import bpy
+
+    version = bpy.app.version_string
+    if _catalog is not None and _catalog.version == version and not rebuild:
+        return _catalog
+
+    cat = None if rebuild else _read_snapshot(version)
+    if cat is None:
+        cat = OperatorCatalog(version, introspect_operators(bpy.ops))
+        _write_snapshot(cat)
+        log.info(f"🧭 Catalogue opérateurs introspecté: {len(cat)} opérateurs (Blender {version})")
+    else:
+        log.info(f"🧭 Catalogue opérateurs chargé du cache: {len(cat)} opérateurs")
+    _catalog = cat
+    # les params des intents bpy.ops se valident désormais contre ce schéma: recompilation
+    parser = sys.modules.get("ares.core.intent_parser")
+    if parser is not None:
+        parser.invalidate_cache()
+    return cat
+
+
+def get_operator_catalog() -> OperatorCatalog | None:
+    """Catalogue déjà construit (None avant register(): les appelants gardent leur repli)."""
+    return _catalog
+
+
+def set_operator_catalog(cat: OperatorCatalog | None) -> None:
+    """Remplace le catalogue courant (None = désactivé, ex. unregister / tests)."""
+    global _catalog
+    _catalog = cat
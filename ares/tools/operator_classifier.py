@@ -3,6 +3,8 @@
 
 import bpy
 
+from ares.tools.operator_catalog import get_operator_catalog
+
 # --- utils --------------------------------------------------------------------
 
 
@@ -27,10 +29,15 @@ def _looks_like_bpy_ops(op: str) -> bool:
     """
     Ops heuristic: first segment must be a valid attribute on bpy.ops
     and there must be at least two segments ("mesh.primitive_cube_add").
+    Once the operator catalog is built, the full idname must be a registered operator.
     """
     parts = op.split(".")
     if len(parts) < 2:
         return False
+    # Catalogue introspecté (register): lookup exact "categorie.commande"
+    catalog = get_operator_catalog()
+    if catalog is not None:
+        return catalog.has_operator(op)
     first = parts[0]
     return hasattr(bpy.ops, first)
 
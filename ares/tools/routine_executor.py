@@ -2,14 +2,17 @@
 
 """
 RoutineExecutor – Exécute une routine validée (liste d'intents) depuis routines_validated.yaml
+La routine est rejouée en UN lot transactionnel: un seul pas d'undo, une seule mise à jour
+de la scène, annulée en entier si une étape échoue.
 """
 
 import os
 
 import yaml
 
+from ares.core.intent_parser import parse_intent
 from ares.core.logger import get_logger
-from ares.core.run_pipeline import main as run_pipeline
+from ares.tools.intent_executor import execute_batch
 
 ROUTINES_PATH = os.path.join(os.path.dirname(__file__), "..", "config", "routines_validated.yaml")
 VOICE_CONFIG = os.path.join(os.path.dirname(__file__), "..", "config", "voice_config.yaml")
@@ -46,14 +49,20 @@ def execute_routine(routine_name: str):
         if entry.get("name") and entry.get("phrase")
     }
 
+    intents = []
     for intent_name in sequence:
         phrase = name_to_phrase.get(intent_name)
-        if phrase:
-            log.info(f"?? Exécution : {intent_name} via '{phrase}'")
-            run_pipeline(phrase)
+        intent = parse_intent(phrase) if phrase else None
+        if intent:
+            log.info(f"?? Étape : {intent_name} via '{phrase}'")
+            intents.append(intent)
         else:
             log.warning(f"? Phrase introuvable pour intent : {intent_name}")
 
+    if not intents:
+        return None
+    return execute_batch(intents, transactional=True, label=f"Routine: {routine_name}")
+
 
 if __name__ == "__main__":
     execute_routine("routine_auto_1")
@@ -1,7 +1,6 @@
 ﻿import os
 
-import yaml
-
+from ares.core.intent_catalog import load_catalog
 from ares.core.logger import get_logger
 
 log = get_logger("VoiceConfigManager")
@@ -18,8 +17,7 @@ VOICE_CONFIG_PATH = get_voice_config_path()
 
 def load_config():
     try:
-        with open(VOICE_CONFIG_PATH, encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        config = load_catalog(VOICE_CONFIG_PATH).data
         log.info(f"ðŸ“„ voice_config.yaml chargÃ© depuis {VOICE_CONFIG_PATH}")
         return config or {}
     except Exception as e:
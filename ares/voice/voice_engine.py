@@ -28,13 +28,17 @@ class VoiceEngine:
     - anti-doublons, backoff erreurs
     - push transcript vers Scene.blade_transcript (si existe)
     - exécution auto de la pipeline (facultatif)
+    - reconnaissance incrémentale: l'énoncé est capté par tranches courtes
+      (partial_chunk_s), l'audio cumulé est transcrit après chaque tranche et poussé
+      via on_partial_transcript() → exécution dès que l'intent est non ambigu
     - support Whisper si installé, sinon SpeechRecognition (Google Web API)
     """
 
-    def __init__(self, *, device_index: int | None = None):
+    def __init__(self, *, device_index: int | None = None, language: str = "fr-FR"):
         self.recognizer: sr.Recognizer | None = None
         self.microphone: sr.Microphone | None = None
         self.device_index = device_index
+        self.language = language
 
         self.listening = False
         self._thread: threading.Thread | None = None
@@ -46,6 +50,19 @@ class VoiceEngine:
 
         self.auto_execute: bool = False  # si True, exécute immédiatement la pipeline
 
+        # Reconnaissance incrémentale (partiels) – créée au premier partiel reçu
+        #   - streaming: tranches de partial_chunk_s secondes, fin d'énoncé après
+        #     end_silence_s sans parole ou au-delà de max_phrase_s
+        self.streaming: bool = True
+        self.partial_chunk_s: float = 1.0
+        self.end_silence_s: float = 0.8
+        self.max_phrase_s: float = 6.0
+        self._incremental = None
+        self._early_intent: dict | None = None
+
+        # Le parser route les phrases vers le catalogue de la langue du SR
+        self.set_language(language)
+
         # Backend Whisper optionnel
         self._whisper_backend = self._init_whisper_backend()
 
@@ -92,6 +109,42 @@ class VoiceEngine:
         self.auto_execute = bool(enabled)
         log.info(f"⚙️ Auto-execute = {self.auto_execute}")
 
+    def set_language(self, language: str):
+        """Langue du SR (ex: 'fr-FR') + catalogue d'intents correspondant (chargé à la demande)."""
+        self.language = language
+        try:
+            from ares.core.intent_parser import set_language
+
+            set_language(language)
+        except Exception as e:
+            log.warning(f"⚠️ Routage des intents par langue indisponible : {e}")
+
+    def on_partial_transcript(self, text: str) -> dict | None:
+        """
+        Point d'entrée des backends streaming: texte partiel courant de l'énoncé.
+        Dès que le préfixe désigne un seul intent, il est poussé (et exécuté si
+        auto_execute) sans attendre la fin de phrase; la phrase finale ne le rejouera pas.
+        """
+        if not text or self._early_intent is not None:
+            return None
+        if self._incremental is None:
+            try:
+                from ares.core.incremental_matcher import IncrementalMatcher
+
+                self._incremental = IncrementalMatcher()
+            except Exception as e:
+                log.warning(f"⚠️ Matcher incrémental indisponible : {e}")
+                return None
+
+        intent = self._incremental.feed(text)
+        if intent is None:
+            return None
+        self._early_intent = intent
+        self._push_transcript_to_scene(text)
+        if self.auto_execute:
+            self._run_pipeline_on_main_thread(text, intent)
+        return intent
+
     # ------------------------------------------------------------------ #
     # Boucle d'écoute
     # ------------------------------------------------------------------ #
@@ -122,20 +175,26 @@ class VoiceEngine:
 
             try:
                 text = ""
-                if use_whisper:
+                if self.streaming and self.recognizer and self.microphone:
+                    # Partiels poussés pendant la diction, texte final en fin d'énoncé
+                    text = self._recognize_streaming(timeout=5)
+                elif use_whisper:
                     # Mode Whisper : on essaie d’enregistrer un chunk via SR si dispo,
                     # sinon on ne peut pas capturer (on resterait alors silencieux).
                     text = self._recognize_whisper()
                 else:
                     text = self._recognize_sr_blocking(timeout=5, phrase_time_limit=6)
 
-                if text:
+                if not text:
+                    self._end_utterance()  # énoncé non transcrit: partiels oubliés
+                else:
                     now = time.time()
                     # Anti-doublon rapproché
                     if (
                         text == self.last_transcript
                         and (now - self._last_emit_time) < self._min_repeat_interval_s
                     ):
+                        self._end_utterance()
                         continue
 
                     self._last_emit_time = now
@@ -161,13 +220,67 @@ class VoiceEngine:
                 audio = self.recognizer.listen(
                     source, timeout=timeout, phrase_time_limit=phrase_time_limit
                 )
-            return self.recognizer.recognize_google(audio, language="fr-FR").strip()
+            return self.recognizer.recognize_google(audio, language=self.language).strip()
         except sr.WaitTimeoutError:
             log.debug("⏱️ Timeout d'écoute (SR).")
             return ""
         except Exception:
             return ""
 
+    def _recognize_streaming(self, timeout: float = 5.0) -> str:
+        """
+        Capte un énoncé par tranches de partial_chunk_s secondes (SR listen):
+        après chaque tranche, l'audio cumulé est transcrit (Whisper si présent, sinon
+        Google) et poussé à on_partial_transcript(). Fin d'énoncé: pas de nouvelle
+        parole pendant end_silence_s, ou max_phrase_s atteint. Retourne le texte final.
+        """
+        if not (self.recognizer and self.microphone):
+            return ""
+        chunks: list = []
+        text, done = "", 0  # dernier partiel et nombre de tranches qu'il couvre
+        with self.microphone as source:
+            while True:
+                with self._lock:
+                    if not self.listening:
+                        break
+                try:
+                    audio = self.recognizer.listen(
+                        source,
+                        timeout=self.end_silence_s if chunks else timeout,
+                        phrase_time_limit=self.partial_chunk_s,
+                    )
+                except sr.WaitTimeoutError:
+                    if not chunks:
+                        log.debug("⏱️ Timeout d'écoute (SR).")
+                    break  # silence: fin d'énoncé
+                chunks.append(audio)
+                if len(chunks) * self.partial_chunk_s >= self.max_phrase_s:
+                    break
+                text, done = self._transcribe(self._join_audio(chunks)), len(chunks)
+                if text:
+                    self.on_partial_transcript(text)
+        if done == len(chunks):
+            return text  # fin sur silence: le dernier partiel couvre tout l'audio
+        return self._transcribe(self._join_audio(chunks))
+
+    @staticmethod
+    def _join_audio(chunks: list):
+        first = chunks[0]
+        if len(chunks) == 1:
+            return first
+        data = b"".join(c.frame_data for c in chunks)
+        return sr.AudioData(data, first.sample_rate, first.sample_width)
+
+    def _transcribe(self, audio) -> str:
+        """Transcrit un AudioData SR: Whisper si chargé, sinon Google Web API; "" si échec."""
+        try:
+            if self._whisper_backend is not None:
+                return self._transcribe_whisper(audio)
+            return self.recognizer.recognize_google(audio, language=self.language).strip()
+        except Exception as e:  # UnknownValueError (rien compris), réseau…
+            log.debug(f"Transcription vide : {e}")
+            return ""
+
     def _init_whisper_backend(self):
         """
         Tente de charger faster_whisper ou whisper (OpenAI) si dispo.
@@ -203,23 +316,27 @@ class VoiceEngine:
             # Pas de pipeline de capture -> silencieux
             return ""
 
-        backend, model = self._whisper_backend
         try:
             with self.microphone as source:
                 audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=6)
-            _ = audio.get_wav_data()  # debug hook
-
-            if backend == "faster_whisper":
-                # faster_whisper attend un chemin de fichier ou un buffer ndarray;
-                # pour rester simple ici on ne convertit pas → on passe.
-                # (À améliorer si besoin avec scipy.io.wavfile)
-                return ""
-            else:
-                # whisper (openai) accepte un chemin; on va créer un tmp si besoin.
-                # Pour éviter les I/O, on reste neutre ici. Amélioration ultérieure possible.
-                return ""
         except Exception:
             return ""
+        return self._transcribe(audio)
+
+    def _transcribe_whisper(self, audio) -> str:
+        """PCM 16 kHz mono float32 (ndarray, sans fichier temporaire) → Whisper."""
+        import numpy as np
+
+        from ares.core.intent_parser import normalize_language
+
+        backend, model = self._whisper_backend
+        raw = audio.get_raw_data(convert_rate=16000, convert_width=2)
+        pcm = np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+        lang = normalize_language(self.language)
+        if backend == "faster_whisper":
+            segments, _info = model.transcribe(pcm, language=lang)
+            return " ".join(s.text.strip() for s in segments).strip()
+        return str(model.transcribe(pcm, language=lang, fp16=False).get("text", "")).strip()
 
     # ------------------------------------------------------------------ #
     # Intégration UI + pipeline
@@ -228,10 +345,22 @@ class VoiceEngine:
         # 1) Mémoriser (déjà fait dans la boucle)
         # 2) Pousser vers l'UI
         self._push_transcript_to_scene(text)
-        # 3) Exécution auto optionnelle
+        # 3) Fin d'énoncé: l'intent a-t-il déjà été émis sur un partiel ?
+        early = self._end_utterance()
+        if early is not None:
+            log.debug(f"Intent '{early.get('name')}' déjà émis sur partiel : pas de rejeu.")
+            return
+        # 4) Exécution auto optionnelle
         if self.auto_execute:
             self._run_pipeline_on_main_thread(text)
 
+    def _end_utterance(self) -> dict | None:
+        """Remet à zéro l'état incrémental; retourne l'intent émis sur partiel (ou None)."""
+        early, self._early_intent = self._early_intent, None
+        if self._incremental is not None:
+            self._incremental.reset()
+        return early
+
     def _push_transcript_to_scene(self, text: str):
         if bpy is None:
             return
@@ -250,15 +379,15 @@ class VoiceEngine:
         except Exception as e:
             log.warning(f"Timers Blender indisponibles : {e}")
 
-    def _run_pipeline_on_main_thread(self, text: str):
+    def _run_pipeline_on_main_thread(self, text: str, intent: dict | None = None):
         if bpy is None:
             return
 
         def _run():
             try:
-                from ares.core.run_pipeline import run_pipeline
+                from ares.core.run_pipeline import main as run_pipeline
 
-                run_pipeline(text)
+                run_pipeline(text, preparsed_intent=intent)
             except Exception as e:
                 log.exception(e)
             return None
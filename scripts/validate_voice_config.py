@@ -21,6 +21,10 @@ ALLOWED_TOP_KEYS = {
     "requires",
     "ensure",
     "meta",
+    "templates",
+    "slots",
+    "bulk",
+    "schema",
 }
 
 
@@ -51,12 +55,17 @@ def validate(items):
         else:
             names.add(name)
 
-        phrases = it.get("phrases") or []
+        # phrases déclenchantes: liste, phrase unique ou templates à slots
+        phrases = it.get("phrases") or it.get("phrase") or it.get("templates") or []
         if not phrases:
             errors.append(f"{name}: empty 'phrases'")
 
         # must have at least one way to execute
-        if "operator" in it:
+        if "bulk" in it:
+            # écriture sur la collection: un "operator" serait un fallback invalide
+            if "operator" in it or "op" in it:
+                errors.append(f"{name}: 'bulk' intent must not define operator/op")
+        elif "operator" in it:
             if not isinstance(it["operator"], str) or not is_context_path(it["operator"]):
                 errors.append(f"{name}: invalid operator '{it['operator']}'")
         elif "op" in it or "direct" in it:
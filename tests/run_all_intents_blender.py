@@ -25,9 +25,11 @@ from ares import tools
 
 tools.intent_resolver = resolver
 
-from ares.core.run_pipeline import main as run_pipeline
 from ares.logger import get_logger
 
+from ares.core.intent_parser import parse_intents
+from ares.core.run_pipeline import main as run_pipeline
+
 log = get_logger("BlenderIntentRunner")
 
 
@@ -61,9 +63,14 @@ def main():
         for block in config.values()
         if isinstance(block, dict) and "phrase" in block
     ]
-    for phrase in phrases:
+    # Parsing de tout le catalogue en un seul job, puis exécution intent par intent
+    intents = parse_intents(phrases)
+    for phrase, intent in zip(phrases, intents, strict=True):
         log.info(f"â€ Test de la phrase : {phrase}")
-        result = run_pipeline(phrase, mode="test")
+        if intent is None:
+            log.warning(f"Intent non détecté : {phrase}")
+            continue
+        result = run_pipeline(phrase, mode="test", preparsed_intent=intent)
         log.info(f"â€œ Rsultat : {result}")
 
 
@@ -0,0 +1,56 @@
+"""
+Test bpy_path – compilation des chemins context/data en étapes getattr/getitem
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ares.tools.bpy_path import ATTR, ITEM, compile_path, resolve, resolve_parent
+
+
+def test_compile_root_and_steps():
+    cp = compile_path("bpy.context.object.active_material.diffuse_color[0]")
+    assert cp.root == "context"
+    assert cp.steps == (
+        (ATTR, "object"),
+        (ATTR, "active_material"),
+        (ATTR, "diffuse_color"),
+        (ITEM, 0),
+    )
+    assert (cp.attr, cp.index) == ("diffuse_color", 0)
+
+
+def test_compile_quoted_keys():
+    cp = compile_path("data.objects['Cube.001'].location[2]")
+    assert cp.root == "data"
+    assert cp.head == ((ATTR, "objects"), (ITEM, "Cube.001"))
+    assert compile_path('data.objects["Cube"].name').head[1] == (ITEM, "Cube")
+
+
+def test_compile_is_memoized():
+    assert compile_path("context.scene.frame_end") is compile_path("context.scene.frame_end")
+
+
+def test_relative_path_has_no_root():
+    cp = compile_path("object.location")
+    assert cp.root is None and cp.attr == "location"
+
+
+@pytest.mark.parametrize("bad", ["context.a b", "data.objects[Cube]", "context.x..y", "a[0]b"])
+def test_malformed_paths_rejected(bad):
+    with pytest.raises(ValueError):
+        compile_path(bad)
+
+
+def test_resolve_and_parent():
+    cube = SimpleNamespace(location=[1.0, 2.0, 3.0])
+    data = SimpleNamespace(objects={"Cube": cube})
+    assert resolve(data, "objects['Cube'].location[1]") == 2.0
+    parent, attr, idx = resolve_parent(data, "data.objects['Cube'].location[0]")
+    assert parent is cube and (attr, idx) == ("location", 0)
+
+
+def test_resolve_missing_attribute():
+    with pytest.raises(AttributeError, match="n'existe pas"):
+        resolve(SimpleNamespace(), "object.name")
@@ -0,0 +1,69 @@
+"""
+Test BulkWriter – écriture vectorisée foreach_set sur une collection (sans Blender)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ares.tools.bulk_writer import bulk_get, bulk_set
+
+
+class FakeCollection(list):
+    """Imite bpy_prop_collection: foreach_get/foreach_set sur un buffer plat."""
+
+    calls = 0
+
+    def foreach_get(self, attr, buf):
+        flat = []
+        for item in self:
+            val = getattr(item, attr)
+            flat.extend(val if isinstance(val, list) else [val])
+        buf[:] = flat
+
+    def foreach_set(self, attr, buf):
+        FakeCollection.calls += 1
+        flat = [v.item() if hasattr(v, "item") else v for v in buf]
+        width = len(flat) // len(self)
+        for i, item in enumerate(self):
+            row = flat[i * width : (i + 1) * width]
+            setattr(item, attr, row if isinstance(getattr(item, attr), list) else row[0])
+
+
+def _materials(n):
+    return FakeCollection(SimpleNamespace(diffuse_color=[0.8, 0.8, 0.8, 1.0]) for _ in range(n))
+
+
+def test_broadcast_single_write():
+    mats = _materials(500)
+    FakeCollection.calls = 0
+    assert bulk_set(mats, "diffuse_color", [1.0, 0.0, 0.0, 1.0]) == 500
+    assert FakeCollection.calls == 1
+    assert all(m.diffuse_color == pytest.approx([1.0, 0.0, 0.0, 1.0]) for m in mats)
+
+
+def test_single_component():
+    objs = FakeCollection(SimpleNamespace(location=[1.0, 2.0, float(i)]) for i in range(3))
+    bulk_set(objs, "location", 0.0, index=2)
+    assert [o.location for o in objs] == [[1.0, 2.0, 0.0]] * 3
+
+
+def test_per_item_values_and_get():
+    objs = FakeCollection(SimpleNamespace(frame=0) for _ in range(3))
+    bulk_set(objs, "frame", [5, 6, 7])
+    assert [int(v) for v in bulk_get(objs, "frame")] == [5, 6, 7]
+
+
+def test_width_mismatch_rejected():
+    with pytest.raises(ValueError):
+        bulk_set(_materials(2), "diffuse_color", [1.0, 0.0])
+
+
+def test_plain_list_falls_back_to_loop():
+    objs = [SimpleNamespace(hide_render=False) for _ in range(2)]
+    assert bulk_set(objs, "hide_render", True) == 2
+    assert all(o.hide_render for o in objs)
+
+
+def test_empty_collection():
+    assert bulk_set(FakeCollection(), "location", 0.0) == 0
@@ -0,0 +1,53 @@
+"""
+Test ConfigWatcher – détection de changement par hash de contenu (hors Blender).
+"""
+
+import os
+import time
+
+import pytest
+
+from ares.core.config_watcher import ConfigWatcher, file_digest
+
+
+def _wait_for(cond, timeout=3.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if cond():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.mark.parametrize("backend", ["poll", "inotify"])
+def test_watcher_notifies_on_content_change(tmp_path, backend):
+    path = tmp_path / "voice_config.yaml"
+    path.write_text("- name: a\n", encoding="utf-8")
+    seen = []
+    watcher = ConfigWatcher(str(path), lambda p, d: seen.append(d), interval=0.05, backend=backend)
+    watcher.start()
+    try:
+        # Remplacement atomique avec un mtime identique: seul le hash change
+        st = os.stat(path)
+        tmp = tmp_path / "voice_config.yaml.tmp"
+        tmp.write_text("- name: b\n", encoding="utf-8")
+        os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+        os.replace(tmp, path)
+        assert _wait_for(lambda: seen)
+        assert seen[-1] == file_digest(str(path))
+    finally:
+        watcher.stop()
+    assert not watcher.alive
+
+
+def test_touch_without_content_change_is_ignored(tmp_path):
+    path = tmp_path / "voice_config.yaml"
+    path.write_text("- name: a\n", encoding="utf-8")
+    seen = []
+    watcher = ConfigWatcher(str(path), lambda p, d: seen.append(d), interval=0.05)
+    assert watcher.check_now() is False
+    os.utime(path, None)
+    assert watcher.check_now() is False
+    path.write_text("- name: a\n- name: b\n", encoding="utf-8")
+    assert watcher.check_now() is True
+    assert len(seen) == 1
@@ -0,0 +1,53 @@
+"""
+Test ExecResult – record de résultat compatible dict, timings et historique
+"""
+
+import pytest
+
+from ares.tools import exec_result
+from ares.tools.exec_result import ExecResult, sum_timings, to_result
+
+
+def test_dict_compat_and_truthiness():
+    res = ExecResult("cube", stage="failed", error="boom")
+    assert not res
+    assert res["stage"] == "failed" and res.get("error") == "boom"
+    assert res.get("inconnu", 1) == 1
+    with pytest.raises(KeyError):
+        res["inconnu"]
+    res.update(ok=True, stage="resolver")
+    assert res and dict(res)["stage"] == "resolver"
+    assert not hasattr(res, "__dict__")
+
+
+def test_timings_accumulate_per_stage():
+    res = ExecResult()
+    res.add_timing("resolve", 100)
+    res.add_timing("resolve", 50)
+    t = res.lap("fallback", 0)
+    assert t > 0 and res.timings["resolve"] == 150
+    assert set(res.timings) == {"resolve", "fallback"}
+    other = ExecResult()
+    other.add_timing("parse", 7)
+    res.merge_timings(other)
+    assert res.to_dict()["timings"]["parse"] == 7
+    assert sum_timings([res, other, {"ok": True}])["parse"] == 14
+
+
+def test_to_result_from_legacy_returns():
+    assert to_result(True, "x").ok and to_result(True, "x").name == "x"
+    legacy = to_result({"name": "y", "ok": False, "stage": "failed", "extra": 1})
+    assert legacy.name == "y" and legacy.stage == "failed" and not legacy
+
+
+def test_history_ring_buffer():
+    exec_result.clear_history()
+    exec_result.set_history_size(3)
+    try:
+        for i in range(5):
+            exec_result.record(ExecResult(f"r{i}"))
+        assert [r.name for r in exec_result.history()] == ["r2", "r3", "r4"]
+        assert [r.name for r in exec_result.history(1)] == ["r4"]
+    finally:
+        exec_result.set_history_size(exec_result.HISTORY_SIZE)
+        exec_result.clear_history()
@@ -0,0 +1,34 @@
+"""
+Test FailureClassifier – context / transient / fatal
+"""
+
+from ares.tools.failure_classifier import CONTEXT, FATAL, TRANSIENT, classify_failure
+
+
+def test_poll_failure_is_contextual():
+    f = classify_failure("RuntimeError: Operator bpy.ops.object.shade_smooth.poll() failed")
+    assert f.kind == CONTEXT and f.fixes == ("active_object",)
+
+
+def test_missing_material_needs_object_and_material():
+    f = classify_failure(AttributeError("'NoneType' object has no attribute 'active_material'"))
+    assert f.kind == CONTEXT and f.fixes == ("active_object", "material")
+
+
+def test_edit_mode_switches_to_object_mode():
+    f = classify_failure("RuntimeError: Operator must be in object mode")
+    assert f.fixes == ("object_mode",)
+
+
+def test_locked_data_is_transient():
+    f = classify_failure(
+        "AttributeError: Writing to ID classes in this context is not allowed:"
+        " can't modify blend data in this state (drawing/rendering)"
+    )
+    assert f.kind == TRANSIENT and f.recoverable
+
+
+def test_bad_parameter_is_fatal():
+    f = classify_failure("TypeError: Converting py args to operator properties: keyword 'sise'")
+    assert f.kind == FATAL and not f.recoverable
+    assert classify_failure(None).kind == FATAL
@@ -0,0 +1,50 @@
+"""
+Test IncrementalMatcher – émission d'intent sur partiels (hors Blender).
+"""
+
+from ares.core.incremental_matcher import IncrementalMatcher, PrefixTrie
+
+STD = [
+    {"name": "ajouter_cube", "phrase": "ajoute un cube", "params": {}},
+    {"name": "ajouter_plan", "phrase": "ajoute un plan", "params": {}},
+    {"name": "ajouter_subsurf", "phrase": "ajoute un modificateur subdivision", "params": {}},
+    {"name": "changer_vue_solide", "phrase": "passe en vue solide", "params": {}},
+    {"name": "changer_couleur", "templates": ["passe en {color}"], "params": {}},
+    {"name": "annuler_action", "phrase": "annule", "params": {}},
+]
+
+
+def _matcher(**kw):
+    return IncrementalMatcher(PrefixTrie(STD), **kw)
+
+
+def test_emits_once_prefix_is_unambiguous():
+    m = _matcher()
+    assert m.feed("ajoute") is None
+    assert m.feed("ajoute un") is None
+    assert m.feed("ajoute un modif") is None  # mot incomplet
+    it = m.feed("ajoute un modificateur")
+    assert it["name"] == "ajouter_subsurf"
+    assert m.feed("ajoute un modificateur subdivision") is None  # déjà émis
+
+
+def test_full_variant_without_continuation_emits_immediately():
+    assert _matcher().feed("annule")["name"] == "annuler_action"
+    assert _matcher().feed("Ajoute un CUBE")["name"] == "ajouter_cube"
+
+
+def test_template_prefix_keeps_ambiguity():
+    m = _matcher()
+    assert m.feed("passe en") is None
+    assert m.feed("passe en rouge") is None
+    assert _matcher().feed("passe en vue")["name"] == "changer_vue_solide"
+
+
+def test_revised_partial_restarts_and_reset():
+    m = _matcher()
+    assert m.feed("ajoute un") is None
+    assert m.feed("ajoute une") is None  # dernier mot révisé, inconnu
+    assert m.feed("ajoute un plan")["name"] == "ajouter_plan"
+    m.reset()
+    assert m.emitted is None
+    assert m.feed("xyz abc") is None
@@ -0,0 +1,82 @@
+"""
+Test IntentCatalog – snapshot compilé du YAML (hors Blender).
+"""
+
+import copy
+import os
+
+import pytest
+
+from ares.core import intent_catalog
+
+YAML_INTENTS = """
+- name: ajouter_cube
+  phrase: ajoute un cube
+  operator: mesh.primitive_cube_add
+- name: ajouter_plan
+  phrases: ["ajoute un plan"]
+  operator: mesh.primitive_plane_add
+"""
+
+
+@pytest.fixture
+def catalog_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(intent_catalog, "CACHE_DIR", str(tmp_path / "cache"))
+    intent_catalog.clear_memory_cache()
+    path = tmp_path / "voice_config.yaml"
+    path.write_text(YAML_INTENTS, encoding="utf-8")
+    yield path
+    intent_catalog.clear_memory_cache()
+
+
+def test_compile_and_index(catalog_env):
+    cat = intent_catalog.load_catalog(str(catalog_env))
+    assert len(cat) == 2
+    assert cat.names == {"ajouter_cube", "ajouter_plan"}
+    assert cat.phrase_index["ajoute un plan"]["name"] == "ajouter_plan"
+    assert cat.phrase_index["ajoute un plan"] is cat.std[1]
+
+
+def test_snapshot_skips_yaml_parse(catalog_env, monkeypatch):
+    first = intent_catalog.load_catalog(str(catalog_env))
+    intent_catalog.clear_memory_cache()
+
+    def _boom(*_a, **_k):
+        raise AssertionError("YAML re-parsé malgré le snapshot")
+
+    monkeypatch.setattr(intent_catalog, "_compile", _boom)
+    again = intent_catalog.load_catalog(str(catalog_env))
+    assert again.digest == first.digest
+    assert again.phrase_index["ajoute un cube"] is again.std[0]
+
+
+def test_content_change_recompiles(catalog_env):
+    first = intent_catalog.load_catalog(str(catalog_env))
+    catalog_env.write_text(YAML_INTENTS + "- name: annuler\n  phrase: annule\n", encoding="utf-8")
+    second = intent_catalog.load_catalog(str(catalog_env))
+    assert second.digest != first.digest
+    assert "annuler" in second.names
+
+
+def test_snapshots_kept_per_schema(catalog_env, monkeypatch):
+    cat = intent_catalog.load_catalog(str(catalog_env))
+    blender = copy.copy(cat)
+    blender.schema_source = "4.2.0 LTS"
+    intent_catalog._write_snapshot(blender)  # ne supprime pas le snapshot sans bpy
+    snaps = sorted(os.listdir(intent_catalog.CACHE_DIR))
+    assert len(snaps) == 2
+    assert [s.split(".")[2] for s in snaps] == ["4_2_0_LTS", "nobpy"]
+
+    def _boom(*_a, **_k):
+        raise AssertionError("YAML recompilé malgré le snapshot du schéma")
+
+    monkeypatch.setattr(intent_catalog, "_compile", _boom)
+    intent_catalog.clear_memory_cache()
+    assert intent_catalog.load_catalog(str(catalog_env)).schema_source is None
+    monkeypatch.setattr(intent_catalog, "_schema_source", lambda: "4.2.0 LTS")
+    intent_catalog.clear_memory_cache()
+    assert intent_catalog.load_catalog(str(catalog_env)).schema_source == "4.2.0 LTS"
+
+
+def test_read_catalog_data_missing_file(tmp_path):
+    assert intent_catalog.read_catalog_data(str(tmp_path / "absent.yaml")) == []
@@ -0,0 +1,116 @@
+"""
+Test IntentExecutor – lot transactionnel (un seul undo, rollback sur échec)
+Note : bpy est simulé, seuls les appels undo/view_layer sont vérifiés
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ares.tools import intent_executor as ie
+from ares.tools import intent_resolver
+
+
+@pytest.fixture
+def fake_bpy(monkeypatch):
+    fake = MagicMock()
+    monkeypatch.setattr(ie, "bpy", fake)
+    seen = []
+
+    def fake_execute(intent, **_):
+        seen.append(intent_resolver._defer_undo)
+        return {"name": intent["name"], "ok": intent.get("ok", True)}
+
+    monkeypatch.setattr(ie, "execute_intent", fake_execute)
+    fake.seen = seen
+    return fake
+
+
+def test_transactional_commit_single_undo_step(fake_bpy):
+    summary = ie.execute_batch([{"name": "a"}, {"name": "b"}], transactional=True, label="lot")
+    assert summary["success"] == 2 and summary["transaction"] == "committed"
+    assert fake_bpy.seen == [True, True]  # ops sans undo pendant le lot
+    assert intent_resolver._defer_undo is False
+    messages = [c.kwargs["message"] for c in fake_bpy.ops.ed.undo_push.call_args_list]
+    assert messages == ["lot (début)", "lot"]
+    fake_bpy.context.view_layer.update.assert_called_once()
+    fake_bpy.ops.ed.undo.assert_not_called()
+
+
+def test_transactional_rollback_on_failure(fake_bpy):
+    intents = [{"name": "a"}, {"name": "b", "ok": False}, {"name": "c"}]
+    summary = ie.execute_batch(intents, transactional=True)
+    assert summary["transaction"] == "rolled_back"
+    assert summary["names_failed"] == ["b"] and summary["total"] == 2  # arrêt au 1er échec
+    fake_bpy.ops.ed.undo.assert_called_once()
+    assert intent_resolver._defer_undo is False
+
+
+def test_plain_batch_untouched(fake_bpy):
+    summary = ie.execute_batch([{"name": "a"}, {"name": "b", "ok": False}, {"name": "c"}])
+    assert summary["total"] == 3 and summary["transaction"] is None
+    assert fake_bpy.seen == [False, False, False]
+    fake_bpy.ops.ed.undo_push.assert_not_called()
+
+
+@pytest.fixture
+def fake_resolver(monkeypatch):
+    fake = MagicMock()
+    monkeypatch.setattr(ie, "bpy", fake)
+    state = {"calls": 0, "errors": []}
+
+    def fake_resolve(intent):
+        state["calls"] += 1
+        if state["errors"]:
+            error = state["errors"].pop(0)
+            monkeypatch.setattr(ie, "resolver_last_error", lambda: error)
+            return False
+        return True
+
+    monkeypatch.setattr(ie, "resolve_and_execute", fake_resolve)
+    fake.state = state
+    return fake
+
+
+def test_fatal_failure_fails_fast(fake_resolver):
+    fake_resolver.state["errors"] = ["TypeError: keyword 'sise' unrecognized"] * 3
+    res = ie.execute_intent({"name": "x", "operator": "mesh.cube"}, retries=2)
+    assert res["stage"] == "failed" and res["failure"] == "fatal"
+    assert fake_resolver.state["calls"] == 1
+
+
+def test_context_failure_fixed_then_retried(fake_resolver, monkeypatch):
+    fixes = []
+    monkeypatch.setattr(ie, "_apply_fixes", lambda f: fixes.append(tuple(f)))
+    fake_resolver.state["errors"] = ["RuntimeError: poll() failed, context is incorrect"]
+    res = ie.execute_intent({"name": "x", "operator": "object.shade_smooth"})
+    assert res["ok"] and res["stage"] == "resolver"
+    assert fixes == [("active_object",)]
+
+
+def test_transient_failure_scheduled_on_timer(fake_resolver):
+    fake_resolver.state["errors"] = ["RuntimeError: can't modify blend data in this state"]
+    done = []
+    res = ie.execute_intent({"name": "x", "operator": "a.b"}, on_retry_done=done.append)
+    assert res["stage"] == "retry_scheduled" and not res["ok"]
+    retry = fake_resolver.app.timers.register.call_args.args[0]
+    assert retry() is None  # one-shot
+    assert done and done[0]["ok"]
+
+
+def test_result_record_timings_and_batch_aggregate(fake_resolver):
+    res = ie.execute_intent({"name": "x", "operator": "a.b"})
+    assert isinstance(res, ie.ExecResult) and res
+    assert set(res.timings) == {"resolve"}
+    summary = ie.execute_batch([{"name": "a", "operator": "a.b"}, {"name": "b", "operator": "a.b"}])
+    assert summary["timings"]["resolve"] == sum(d.t_resolve for d in summary["details"])
+
+
+def test_rollback_clears_node_and_object_caches(fake_bpy, monkeypatch):
+    from ares.tools import node_cache, object_index
+
+    cleared = []
+    monkeypatch.setattr(node_cache, "clear", lambda: cleared.append("nodes"))
+    monkeypatch.setattr(object_index, "clear", lambda: cleared.append("objects"))
+    ie.execute_batch([{"name": "a", "ok": False}], transactional=True)
+    assert cleared == ["nodes", "objects"]
@@ -0,0 +1,241 @@
+"""
+Test IntentParser – matching exact via l'index précompilé (hors Blender).
+"""
+
+import os
+
+import pytest
+
+from ares.core import intent_catalog, intent_parser
+
+YAML_INTENTS = """
+- name: ajouter_cube
+  phrase: ajoute un cube
+  operator: mesh.primitive_cube_add
+  params:
+    location: [0, 0, 0]
+- name: changer_couleur_rouge
+  phrases: ["change en rouge", "Mets en ROUGE"]
+  operator: context.object.active_material.diffuse_color
+  params: { value: [0.64, 0.0, 0.0, 1.0], normalize: color }
+- name: doublon_cube
+  phrase: ajoute un cube
+  operator: mesh.primitive_cube_add
+"""
+
+
+@pytest.fixture
+def config(tmp_path, monkeypatch):
+    path = tmp_path / "voice_config.yaml"
+    path.write_text(YAML_INTENTS, encoding="utf-8")
+    monkeypatch.setattr(intent_parser, "CONFIG_PATH", str(path))
+    monkeypatch.setattr(intent_catalog, "CACHE_DIR", str(tmp_path / "cache"))
+    intent_parser.invalidate_cache()
+    yield path
+    intent_parser.invalidate_cache()
+
+
+def test_exact_match_uses_index(config):
+    intents = intent_parser.load_intents()
+    assert len(intents) == 3
+    assert "mets en rouge" in intent_parser._phrase_index
+
+    it = intent_parser.parse_intent("  Mets en rouge ")
+    assert it["name"] == "changer_couleur_rouge"
+    assert it["params"]["normalize"] == "color"
+
+
+def test_exact_match_first_intent_wins(config):
+    it = intent_parser.parse_intent("ajoute un cube")
+    assert it["name"] == "ajouter_cube"
+
+
+def test_exact_match_returns_copies(config):
+    it = intent_parser.parse_intent("ajoute un cube")
+    it["params"]["location"] = [9, 9, 9]
+    again = intent_parser.parse_intent("ajoute un cube")
+    assert again["params"]["location"] == (0, 0, 0)  # vecteur compilé en tuple
+
+
+def test_match_top_k_ranks_with_breakdown(config):
+    ranked = intent_parser.match_top_k("mets en rouge", k=2)
+    assert [r["name"] for r in ranked][0] == "changer_couleur_rouge"
+    best = ranked[0]
+    assert best["score"] == 1.0
+    assert best["scores"]["exact"] == 1.0
+    assert len(ranked) <= 2
+    assert all(r["score"] >= ranked[-1]["score"] for r in ranked)
+
+
+def test_match_top_k_fuzzy_has_no_exact_score(config):
+    ranked = intent_parser.match_top_k("ajoute cube stp", k=3)
+    assert ranked[0]["name"] == "ajouter_cube"
+    assert ranked[0]["scores"]["exact"] == 0.0
+    assert ranked[0]["scores"]["fuzzy"] > 0.5
+
+
+def test_fuzzy_fallback_returns_matching_intent():
+    intents = [
+        {"name": "ajouter_cube", "phrase": "ajoute un cube"},
+        {"name": "ajouter_plan", "phrase": "ajoute un plan"},
+    ]
+    it, score = intent_parser._fuzzy_match_fallback("ajoute un plant", intents)
+    assert it["name"] == "ajouter_plan"
+    assert score > 0.9
+
+
+def test_parse_intents_batch_aligned(config):
+    phrases = ["ajoute un cube", "", "mets en rouge stp", "xyz"]
+    results = intent_parser.parse_intents(phrases)
+    assert len(results) == len(phrases)
+    assert results[0]["name"] == "ajouter_cube"
+    assert results[1] is None
+    assert results[2]["name"] == "changer_couleur_rouge"
+    assert results[3] is None
+
+
+def test_parse_cache_hits_and_invalidation(config):
+    intent_parser.parse_intent("ajoute un cube")
+    before = intent_parser.cache_stats()
+    first = intent_parser.parse_intent("  AJOUTE un cube")
+    after = intent_parser.cache_stats()
+    assert first["name"] == "ajouter_cube"
+    assert after["hits"] == before["hits"] + 1
+    assert after["size"] >= 1
+
+    intent_parser.invalidate_cache()
+    assert intent_parser.cache_stats()["size"] == 0
+    intent_parser.parse_intent("ajoute un cube")
+    assert intent_parser.cache_stats()["misses"] == after["misses"] + 1
+
+
+def test_parse_cache_keeps_negative_results(config):
+    assert intent_parser.parse_intent("xyz") is None
+    hits = intent_parser.cache_stats()["hits"]
+    assert intent_parser.parse_intent("xyz") is None
+    assert intent_parser.cache_stats()["hits"] == hits + 1
+
+
+def test_reload_on_content_change_with_same_mtime(config, monkeypatch):
+    monkeypatch.setattr(intent_parser, "USE_CONFIG_WATCHER", False)
+    monkeypatch.setattr(intent_parser, "STAT_POLL_INTERVAL", 0.0)
+    intent_parser.stop_config_watcher()
+    assert intent_parser.parse_intent("ajoute un cube")["name"] == "ajouter_cube"
+
+    st = config.stat()
+    config.write_text(YAML_INTENTS.replace("ajouter_cube", "creer_cube"), encoding="utf-8")
+    os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert intent_parser.parse_intent("ajoute un cube")["name"] == "creer_cube"
+
+
+def test_watcher_marks_config_dirty(config):
+    intent_parser.load_intents()
+    intent_parser._on_config_changed(str(config), "autre-hash")
+    assert intent_parser._config_dirty
+    intent_parser.load_intents()
+    assert not intent_parser._config_dirty
+
+
+def test_watcher_reload_sees_same_size_same_mtime_edit(config):
+    assert intent_parser.parse_intent("ajoute un cube")["name"] == "ajouter_cube"
+
+    st = config.stat()
+    config.write_text(YAML_INTENTS.replace("ajouter_cube", "ajouter_bloc"), encoding="utf-8")
+    os.utime(config, ns=(st.st_atime_ns, st.st_mtime_ns))  # ex: cp -p, git checkout
+    assert config.stat().st_size == st.st_size
+
+    intent_parser._on_config_changed(str(config), "nouveau-hash")
+    assert intent_parser.parse_intent("ajoute un cube")["name"] == "ajouter_bloc"
+
+
+def test_phonetic_stage_between_exact_and_fuzzy(config):
+    it = intent_parser.parse_intent("a joute un cub")
+    assert it["name"] == "ajouter_cube"
+    assert intent_parser._phonetic_lookup("a joute un cub") is None  # clé partagée par le doublon
+    assert intent_parser._phonetic_lookup("chanje en rouj")["name"] == "changer_couleur_rouge"
+    assert intent_parser.parse_intents(["chanje en rouj"])[0]["name"] == "changer_couleur_rouge"
+
+
+def test_slot_stage_fills_params(config):
+    config.write_text(
+        YAML_INTENTS + """
+- name: changer_couleur
+  templates: ["passe en {color}"]
+  operator: context.object.active_material.diffuse_color
+  params: { value: "{color}", normalize: color }
+""",
+        encoding="utf-8",
+    )
+    intent_parser.invalidate_cache()
+    it = intent_parser.parse_intent("passe en bleu")
+    assert it["name"] == "changer_couleur"
+    assert it["params"]["value"] == (0.0, 0.0, 0.64, 1.0)  # même forme que les params statiques
+    # le template (non rempli) n'est jamais proposé par le fuzzy
+    assert all(i.get("name") != "changer_couleur" for i in intent_parser._nlp_intents)
+    assert intent_parser.match_top_k("passe en bleu")[0]["intent"]["params"]["value"][2] == 0.64
+    assert intent_parser.parse_intents(["passe en noir"])[0]["params"]["value"][3] == 1.0
+
+
+def test_parse_utterance_splits_multi_commands(config):
+    results = intent_parser.parse_utterance("ajoute un cube et mets en rouge puis xyz")
+    assert [r and r["name"] for r in results] == ["ajouter_cube", "changer_couleur_rouge", None]
+    assert [r["name"] for r in intent_parser.parse_utterance("ajoute un cube")] == ["ajouter_cube"]
+
+
+def test_language_shard_routing(config):
+    shard = config.with_name("voice_config_en.yaml")
+    shard.write_text(
+        "- name: add_cube\n  phrase: add a cube\n  operator: mesh.primitive_cube_add\n",
+        encoding="utf-8",
+    )
+    try:
+        intent_parser.set_language("en-US")
+        assert intent_parser.parse_intent("add a cube")["name"] == "add_cube"
+        assert intent_parser.parse_intent("ajoute un cube") is None
+        assert intent_parser.cache_stats()["language"] == "en"
+
+        intent_parser.set_language("de-DE")  # pas de shard → catalogue fusionné
+        assert intent_parser.parse_intent("ajoute un cube")["name"] == "ajouter_cube"
+        assert str(shard) not in intent_catalog._memory
+    finally:
+        intent_parser.set_language(None)
+
+
+def test_params_coerced_and_bad_entries_rejected(config):
+    config.write_text(
+        YAML_INTENTS + """
+- name: couleur_invalide
+  phrase: mets en plaid
+  operator: context.object.active_material.diffuse_color
+  params: { value: [1.0, 0.0], normalize: color }
+""",
+        encoding="utf-8",
+    )
+    intent_parser.invalidate_cache()
+    assert intent_parser.parse_intent("mets en rouge")["params"]["value"] == (0.64, 0.0, 0.0, 1.0)
+    assert intent_parser.parse_intent("mets en plaid") is None
+    assert intent_catalog.load_catalog(str(config)).rejected == ["couleur_invalide"]
+
+
+def test_match_top_k_aligned_after_rejection_and_engine_shared(config):
+    from ares.tools import nlp_intent_matcher as nlp
+
+    config.write_text(
+        """
+- name: couleur_invalide
+  phrase: mets en plaid
+  operator: context.object.active_material.diffuse_color
+  params: { value: [1.0, 0.0], normalize: color }
+""" + YAML_INTENTS,
+        encoding="utf-8",
+    )
+    intent_parser.invalidate_cache()
+    ranked = intent_parser.match_top_k("ajoute cube stp", k=3)
+    assert ranked[0]["name"] == "ajouter_cube" and ranked[0]["scores"]["fuzzy"] > 0.5
+
+    engine = nlp._engine
+    for _ in range(3):
+        intent_parser.parse_intent("ajoute cube vite")
+        intent_parser.clear_parse_cache()
+        intent_parser.match_top_k("ajoute cube stp")
+    assert nlp._engine is engine  # pas de reconstruction entre parse_intent et match_top_k
@@ -0,0 +1,64 @@
+"""
+Test IntentResolver – plans d'exécution compilés et mis en cache par intent
+Note : nécessite bpy (Blender) pour l'import du resolver
+"""
+
+from ares.core import intent_parser
+from ares.tools import intent_resolver as resolver
+
+
+def setup_function(_):
+    resolver.clear_exec_plans()
+
+
+def test_context_plan_precompiles_path():
+    plan = resolver.get_exec_plan("couleur", "bpy.context.object.active_material.diffuse_color")
+    assert plan.kind == "context"
+    assert plan.root_name == "context"
+    assert plan.needs_material and plan.is_diffuse_color
+    assert plan.path.attr == "diffuse_color" and plan.path.index is None
+    assert plan.path.head == ((0, "object"), (0, "active_material"))
+
+
+def test_data_plan_index_tokens():
+    plan = resolver.get_exec_plan("loc_x", "data.objects.location[0]")
+    assert plan.root_name == "data"
+    assert (plan.path.attr, plan.path.index) == ("location", 0)
+
+
+def test_plan_is_cached_per_intent():
+    first = resolver.get_exec_plan("cube", "mesh.primitive_cube_add")
+    assert resolver.get_exec_plan("cube", "mesh.primitive_cube_add") is first
+    assert resolver.get_exec_plan("autre", "mesh.primitive_cube_add") is not first
+
+
+def test_normalized_value_memoized():
+    plan = resolver.get_exec_plan("couleur", "context.object.active_material.diffuse_color")
+    params = {"value": [1.0, 0.0, 0.0], "normalize": "color"}
+    first = plan.normalized_value(params)
+    assert first == [1.0, 0.0, 0.0, 1.0]
+    assert plan.normalized_value(dict(params)) is first
+    assert plan.normalized_value({"value": [0.0, 1.0, 0.0]}) == [0.0, 1.0, 0.0]
+
+
+def test_config_reload_clears_plans():
+    first = resolver.get_exec_plan("cube", "mesh.primitive_cube_add")
+    intent_parser._bump_config_version()
+    assert resolver.get_exec_plan("cube", "mesh.primitive_cube_add") is not first
+
+
+def test_base_color_bulk_updates_nodal_materials_only():
+    from types import SimpleNamespace
+
+    def _mat(use_nodes, principled=True):
+        socket = SimpleNamespace(default_value=None)
+        node = SimpleNamespace(bl_idname="ShaderNodeBsdfPrincipled", inputs={"Base Color": socket})
+        tree = SimpleNamespace(nodes=[node] if principled else [])
+        mat = SimpleNamespace(use_nodes=use_nodes, node_tree=tree, socket=socket)
+        mat.as_pointer = lambda: id(mat)  # pas en cache: scan du node_tree
+        return mat
+
+    mats = [_mat(True), _mat(False), _mat(True, principled=False)]
+    assert resolver.set_base_color_bulk(mats, [1.0, 0.0, 0.0]) == 1
+    assert mats[0].socket.default_value == (1.0, 0.0, 0.0, 1.0)
+    assert mats[1].socket.default_value is None
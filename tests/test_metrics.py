@@ -0,0 +1,70 @@
+"""
+Test Metrics – histogrammes HDR, compteurs, caches et exports JSON / Prometheus
+"""
+
+import json
+import urllib.request
+
+import pytest
+
+from ares.core import metrics
+from ares.tools.exec_result import ExecResult
+
+
+@pytest.fixture(autouse=True)
+def clean():
+    metrics.reset()
+    yield
+    metrics.reset()
+    metrics.stop_server()
+
+
+def test_bucket_bounds_cover_values():
+    for value in (0, 1, 127, 128, 129, 255, 256, 1_000, 12_345_678, 2**40 + 17):
+        low, high = metrics._bucket_bounds(metrics._bucket(value))
+        assert low <= value <= high
+        assert high - low <= max(0, value) / 64  # erreur relative < 1/64
+
+
+def test_histogram_quantiles():
+    hist = metrics.Histogram()
+    for ms in range(1, 101):
+        hist.record(ms * 1_000_000)
+    assert hist.count == 100 and hist.min == 1_000_000 and hist.max == 100_000_000
+    assert hist.value_at(0.5) == pytest.approx(50_000_000, rel=0.01)
+    assert hist.value_at(0.99) == pytest.approx(99_000_000, rel=0.01)
+    assert hist.value_at(1.0) == 100_000_000
+
+
+def test_observe_result_and_exports(tmp_path):
+    res = ExecResult("cube", ok=True, stage="fallback_ops")
+    res.add_timing("parse", 2_000_000)
+    res.add_timing("resolve", 1_000_000)
+    res.add_timing("fallback", 3_000_000)
+    metrics.observe_result(res, total_ns=7_000_000)
+    metrics.register_cache("test", lambda: {"hits": 3, "misses": 1})
+
+    snap = json.loads(metrics.to_json())
+    latency = snap["histograms"]["latency"]
+    assert latency["execute"]["max_ms"] == pytest.approx(4.0)
+    assert latency["voice_to_action"]["count"] == 1 and "inject" not in latency
+    assert snap["counters"]["executions"] == {"fallback_ops": 1}
+    assert snap["caches"]["test"]["hit_rate"] == 0.75
+
+    text = metrics.to_prometheus()
+    assert '# TYPE blade_latency_seconds summary' in text
+    assert 'blade_latency_seconds_count{stage="parse"} 1' in text
+    assert 'blade_executions_total{stage="fallback_ops"} 1' in text
+    assert 'blade_cache_hit_rate{cache="test"} 0.75' in text
+
+    path = metrics.write(str(tmp_path / "metrics.json"))
+    assert json.loads(open(path, encoding="utf-8").read())["counters"]
+
+
+def test_localhost_endpoint():
+    metrics.inc("resolver")
+    port = metrics.serve(port=0)
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as r:
+        assert 'blade_executions_total{stage="resolver"} 1' in r.read().decode("utf-8")
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics.json", timeout=5) as r:
+        assert json.loads(r.read())["counters"]["executions"]["resolver"] == 1
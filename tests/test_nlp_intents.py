@@ -1,3 +1,5 @@
+import pytest
+
 from ares.tools.nlp_intent_matcher import match_intent
 
 
@@ -9,3 +11,92 @@ def test_match_red():
     intent, score = match_intent("mets en rouge", intents)
     assert intent and intent["name"] == "changer_couleur_rouge"
     assert score >= 0.50
+
+
+def test_engine_reused_for_same_catalog():
+    from ares.tools import nlp_intent_matcher as m
+
+    intents = [
+        {"name": "ajouter_cube", "phrases": ["ajoute un cube"]},
+        {"name": "ajouter_sphere", "phrases": ["ajoute une sphère"]},
+    ]
+    m.invalidate_engine()
+    intent, _ = m.match_intent("ajoute un cube", intents)
+    engine = m._engine
+    intent2, score = m.match_intent("ajoute une sphere", intents)
+    assert m._engine is engine
+    assert intent["name"] == "ajouter_cube"
+    assert intent2["name"] == "ajouter_sphere"
+    assert score > 0.99
+
+
+def test_no_match_below_threshold():
+    intents = [{"name": "ajouter_cube", "phrases": ["ajoute un cube"]}]
+    intent, score = match_intent("xyz", intents)
+    assert intent is None
+    assert score < 0.50
+
+
+def test_spacy_vectors_cached_and_utterance_parsed_once(monkeypatch):
+    np = pytest.importorskip("numpy")
+    from ares.tools import nlp_intent_matcher as m
+
+    class _Doc:
+        def __init__(self, text):
+            self.vector = np.array([text.count("r"), text.count("c"), 1.0])
+
+    class _FakeNlp:
+        def __init__(self):
+            self.calls = 0
+            self.piped = 0
+
+        def __call__(self, text):
+            self.calls += 1
+            return _Doc(text)
+
+        def pipe(self, texts):
+            self.piped += 1
+            return [_Doc(t) for t in texts]
+
+    fake = _FakeNlp()
+    monkeypatch.setattr(m, "nlp_fr", fake)
+    m.invalidate_engine()
+    intents = [
+        {"name": "changer_couleur_rouge", "phrases": ["change en rouge"]},
+        {"name": "ajouter_cube", "phrases": ["ajoute un cube"]},
+    ]
+    for _ in range(3):
+        intent, _score = m.match_intent("rouge rouge", intents)
+        assert intent["name"] == "changer_couleur_rouge"
+    assert fake.piped == 1
+    assert fake.calls == 3
+    m.invalidate_engine()
+
+
+def test_inverted_index_prunes_candidates():
+    from ares.tools import nlp_intent_matcher as m
+
+    intents = [
+        {"name": "changer_couleur_rouge", "phrases": ["change en rouge"]},
+        {"name": "ajouter_cube", "phrases": ["ajoute un cube"]},
+        {"name": "ajouter_sphere", "phrases": ["ajoute une sphère"]},
+    ]
+    engine = m._MatcherEngine(intents)
+    # "red" → classe couleur "rouge"; "cube" → token
+    assert engine.candidate_intents(m._norm("mets en red")) == [0]
+    assert engine.candidate_intents(m._norm("un cube")) == [1]
+    # aucun token commun → scan complet
+    assert engine.candidate_intents(m._norm("sfer")) is None
+
+    scores = list(engine.variant_scores(m._norm("ajoute un cube")))
+    assert scores[0] == 0.0
+    assert scores[1] > 0.99
+
+
+def test_full_scan_fallback_when_no_candidate():
+    intents = [
+        {"name": "ajouter_cube", "phrases": ["ajoute un cube"]},
+        {"name": "ajouter_sphere", "phrases": ["ajoute une sphère"]},
+    ]
+    intent, _score = match_intent("ajoutte une spheere", intents, threshold=0.3)
+    assert intent["name"] == "ajouter_sphere"
@@ -0,0 +1,78 @@
+"""
+Test NodeCache – rôles des nodes de matériau en cache (hors Blender)
+"""
+
+import pytest
+
+from ares.tools import node_cache
+
+
+class _Socket:
+    def __init__(self, linked=False):
+        self.is_linked = linked
+
+
+class _Node:
+    def __init__(self, name, bl_idname, linked=False):
+        self.name = name
+        self.bl_idname = bl_idname
+        self.inputs = {"Surface": _Socket(linked)}
+
+
+class _Nodes(dict):
+    pass
+
+
+class _Tree:
+    def __init__(self, *nodes):
+        self.nodes = _Nodes((n.name, n) for n in nodes)
+
+    def as_pointer(self):
+        return id(self)
+
+
+class _Material:
+    def __init__(self, tree):
+        self.node_tree = tree
+
+    def as_pointer(self):
+        return id(self)
+
+
+@pytest.fixture
+def mat():
+    node_cache.set_tracking(False)
+    p = _Node("Principled BSDF", node_cache.PRINCIPLED)
+    out = _Node("Material Output", node_cache.OUTPUT, linked=True)
+    m = _Material(_Tree(p, out))
+    node_cache.store(m, p, out)
+    yield m
+    node_cache.set_tracking(False)
+
+
+def test_lookup_hits_without_scan(mat):
+    roles = node_cache.lookup(mat)
+    assert roles.principled.name == "Principled BSDF"
+    assert roles.output.bl_idname == node_cache.OUTPUT
+
+
+def test_untracked_lookup_revalidates(mat):
+    del mat.node_tree.nodes["Principled BSDF"]
+    assert node_cache.lookup(mat) is None
+    assert node_cache.stats()["size"] == 0
+
+
+def test_tracking_trusts_entry_until_marked_dirty(mat):
+    node_cache.set_tracking(True)
+    mat.node_tree.nodes["Material Output"].inputs["Surface"].is_linked = False
+    assert node_cache.lookup(mat) is not None  # pas d'update depsgraph: confiance
+
+    node_cache.mark_dirty(mat.as_pointer())
+    assert node_cache.lookup(mat) is None  # lien Surface coupé → rescan
+
+
+def test_dirty_entry_still_valid_is_kept(mat):
+    node_cache.set_tracking(True)
+    node_cache.mark_dirty(mat.as_pointer())
+    assert node_cache.lookup(mat) is not None
+    assert node_cache.stats() == {"size": 1, "dirty": 0}
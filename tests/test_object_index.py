@@ -0,0 +1,108 @@
+"""
+Test ObjectIndex – index des objets éditables par type (hors Blender)
+"""
+
+import pytest
+
+from ares.tools import object_index
+
+
+class _Obj:
+    def __init__(self, name, type_, hidden=False):
+        self.name, self.type, self.hidden = name, type_, hidden
+
+    def hide_get(self):
+        return self.hidden
+
+    def as_pointer(self):
+        return id(self)
+
+
+class _Objects(dict):
+    def __iter__(self):
+        return iter(self.values())
+
+
+class _Scene:
+    def __init__(self, *objs):
+        self.objects = _Objects((o.name, o) for o in objs)
+
+    def as_pointer(self):
+        return id(self)
+
+
+@pytest.fixture
+def scene():
+    object_index.set_tracking(True)
+    sc = _Scene(_Obj("Cube", "MESH"), _Obj("Lampe", "LIGHT"), _Obj("Courbe", "CURVE", hidden=True))
+    yield sc
+    object_index.set_tracking(False)
+
+
+def test_last_visible_editable(scene):
+    assert object_index.find_editable(scene).name == "Cube"
+    assert object_index.stats()["hidden"] == 1
+    assert object_index.find_editable(scene, visible_only=False).name == "Courbe"
+
+
+def test_scene_order_kept_on_updates(scene):
+    object_index.find_editable(scene)
+    sphere = _Obj("Sphere", "MESH")
+    scene.objects["Sphere"] = sphere
+    object_index.note_object(sphere)
+    assert object_index.find_editable(scene).name == "Sphere"
+
+    object_index.note_object(scene.objects["Cube"])  # Cube modifié: garde sa position
+    assert object_index.find_editable(scene, ("MESH",)).name == "Sphere"
+    assert object_index.find_editable(scene, ("MESH",), last=False).name == "Cube"
+
+
+def test_matches_reversed_scene_scan(scene):
+    for name, kind in (("Texte", "FONT"), ("Meta", "META"), ("Plan", "MESH")):
+        scene.objects[name] = _Obj(name, kind)
+    object_index.find_editable(scene)
+    object_index.note_object(scene.objects["Meta"])
+    expected = next(
+        o
+        for o in reversed(list(scene.objects))
+        if o.type in object_index.EDITABLE_TYPES and not o.hide_get()
+    )
+    assert object_index.find_editable(scene) is expected
+
+
+def test_deleted_objects_dropped_lazily(scene):
+    object_index.find_editable(scene)
+    del scene.objects["Cube"]
+    assert object_index.find_editable(scene) is None
+    assert object_index.stats()["objects"] == 2
+
+
+def test_unhide_seen_after_scene_update(scene):
+    object_index.find_editable(scene, ("CURVE",))
+    scene.objects["Courbe"].hidden = False
+    assert object_index.find_editable(scene, ("CURVE",)) is None  # caché mémorisé
+    object_index.recheck_visibility()
+    assert object_index.find_editable(scene, ("CURVE",)).name == "Courbe"
+
+
+def test_deleted_then_readded_takes_new_position(scene):
+    object_index.find_editable(scene)
+    old = scene.objects.pop("Cube")
+    cube = scene.objects["Cube"] = _Obj("Cube", "MESH")  # recréé: en fin de scene.objects
+    scene.objects["Plan"] = _Obj("Plan", "MESH")
+    object_index.note_object(cube)
+    assert object_index.find_editable(scene, ("MESH",), last=False) is cube
+    assert object_index.find_editable(scene, ("MESH",)).name == "Plan"
+    assert old is not cube  # ancien objet encore référencé: adresses distinctes
+
+
+def test_membership_change_invalidates_reused_pointer(scene):
+    object_index.find_editable(scene)
+    old = scene.objects.pop("Cube")
+    object_index.note_membership(scene)  # update Scene après la suppression
+    readded = _Obj("Cube", "MESH")
+    readded.as_pointer = old.as_pointer  # même adresse mémoire réutilisée
+    scene.objects["Cube"] = readded
+    scene.objects["Plan"] = _Obj("Plan", "MESH")
+    object_index.note_object(readded)
+    assert object_index.find_editable(scene, ("MESH",)).name == "Plan"
@@ -0,0 +1,78 @@
+"""
+Test OperatorCatalog – introspection bpy.ops simulée, validation des params, snapshot JSON
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ares.tools import operator_catalog as oc
+from ares.tools.operator_classifier import classify_operator
+
+
+def _prop(identifier, kind, **kw):
+    base = dict(array_length=0, hard_min=-1e9, hard_max=1e9, enum_items=[], is_enum_flag=False)
+    base.update(kw)
+    return SimpleNamespace(identifier=identifier, type=kind, **base)
+
+
+def _op(*props):
+    rna = SimpleNamespace(properties=[_prop("rna_type", "POINTER"), *props])
+    return SimpleNamespace(get_rna_type=lambda: rna)
+
+
+FAKE_OPS = SimpleNamespace(
+    mesh=SimpleNamespace(
+        primitive_cube_add=_op(
+            _prop("size", "FLOAT", hard_min=0.0),
+            _prop("location", "FLOAT", array_length=3),
+        )
+    ),
+    object=SimpleNamespace(
+        modifier_add=_op(_prop("type", "ENUM", enum_items=[SimpleNamespace(identifier="SUBSURF")])),
+        shade_smooth=_op(_prop("keep_sharp_edges", "BOOLEAN")),
+    ),
+)
+
+
+@pytest.fixture
+def catalog():
+    cat = oc.OperatorCatalog("4.5.0", oc.introspect_operators(FAKE_OPS))
+    oc.set_operator_catalog(cat)
+    yield cat
+    oc.set_operator_catalog(None)
+
+
+def test_introspection_indexes_operators(catalog):
+    assert len(catalog) == 3
+    assert catalog.schema("mesh.primitive_cube_add")["location"] == {
+        "type": "FLOAT",
+        "array": 3,
+        "min": -1e9,
+        "max": 1e9,
+    }
+    assert "rna_type" not in catalog.schema("object.shade_smooth")
+
+
+def test_validate_params(catalog):
+    ok = {"size": 2.0, "location": [0.0, 0.0, 1.0]}
+    assert catalog.validate_params("mesh.primitive_cube_add", ok) == []
+    errors = catalog.validate_params("mesh.primitive_cube_add", {"sise": 2, "location": [0, 0]})
+    assert len(errors) == 2 and "sise" in errors[0]
+    assert catalog.validate_params("mesh.primitive_cube_add", {"size": -1.0})
+    assert catalog.validate_params("object.modifier_add", {"type": "SUBSURF"}) == []
+    assert catalog.validate_params("object.modifier_add", {"type": "SUBSURFACE"})
+
+
+def test_classifier_uses_catalog(catalog):
+    assert classify_operator("object.modifier_add") == "ops"
+    # "object" est une catégorie bpy.ops, mais pas "object.location[0]"
+    assert classify_operator("object.location[0]") == "unknown"
+
+
+def test_snapshot_roundtrip(catalog, tmp_path, monkeypatch):
+    monkeypatch.setattr(oc, "CACHE_DIR", str(tmp_path))
+    oc._write_snapshot(catalog)
+    loaded = oc._read_snapshot("4.5.0")
+    assert loaded is not None and loaded.operators == catalog.operators
+    assert oc._read_snapshot("4.4.0") is None
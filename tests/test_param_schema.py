@@ -0,0 +1,41 @@
+"""
+Test ParamSchema – coercition des params au chargement du catalogue
+"""
+
+import pytest
+
+from ares.core.param_schema import ParamSchemaError, coerce_params, to_color
+
+
+def test_colour_normalized_to_rgba_tuple():
+    it = {"params": {"value": [1, 0, 0], "normalize": "color"}}
+    assert coerce_params(it)["value"] == (1.0, 0.0, 0.0, 1.0)
+    assert to_color("Verte") == (0.0, 0.64, 0.0, 1.0)
+
+
+def test_vectors_become_tuples_and_placeholders_kept():
+    it = {"params": {"location": [0, 0, 1], "value": "{axis.vector}", "mode": "EDIT"}}
+    assert coerce_params(it) == {"location": (0, 0, 1), "value": "{axis.vector}", "mode": "EDIT"}
+
+
+def test_declared_schema():
+    it = {
+        "params": {"size": 2, "type": "SUBSURF", "frame": 10.0},
+        "schema": {"size": "float", "type": ["SUBSURF", "MIRROR"], "frame": "int"},
+    }
+    assert coerce_params(it) == {"size": 2.0, "type": "SUBSURF", "frame": 10}
+    with pytest.raises(ParamSchemaError):
+        coerce_params({"params": {"type": "BEVEL"}, "schema": {"type": ["SUBSURF"]}})
+
+
+def test_rna_schema_from_operator_catalog():
+    props = {
+        "location": {"type": "FLOAT", "array": 3},
+        "type": {"type": "ENUM", "enum": ["SUBSURF"]},
+    }
+    out = coerce_params({"params": {"location": [0, 1, 2], "type": "SUBSURF"}}, props)
+    assert out == {"location": (0.0, 1.0, 2.0), "type": "SUBSURF"}
+    with pytest.raises(ParamSchemaError, match="inconnu"):
+        coerce_params({"operator": "mesh.x", "params": {"sise": 1}}, props)
+    with pytest.raises(ParamSchemaError):
+        coerce_params({"params": {"location": [0, 1]}}, props)
@@ -0,0 +1,27 @@
+"""
+Test clé phonétique française (hors Blender).
+"""
+
+from ares.core.phonetic import phonetic_key
+
+
+def test_speech_variants_share_key():
+    ref = phonetic_key("ajoute une sphère")
+    assert phonetic_key("a joute une sfer") == ref
+    assert phonetic_key("Ajouter une sphere") == ref
+    assert phonetic_key("ajoutez la sphère") == ref
+
+
+def test_distinct_commands_keep_distinct_keys():
+    assert phonetic_key("ajoute un cube") != phonetic_key("ajoute une sphère")
+    assert phonetic_key("tourne de 45 degrés") != phonetic_key("tourne de 90 degrés")
+
+
+def test_articles_only_gives_empty_key():
+    assert phonetic_key("le la les") == ""
+
+
+def test_numeric_variants_keep_distinct_keys():
+    assert phonetic_key("rotation 100") != phonetic_key("rotation 10")
+    assert phonetic_key("échelle 1000") != phonetic_key("échelle 100")
+    assert phonetic_key("balle") == phonetic_key("bale")  # lettres doublées toujours fusionnées
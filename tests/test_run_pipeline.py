@@ -5,9 +5,16 @@ Test de la pipeline principale de Blade
 Vérifie que l'enchaînement phrase → intent → exécution fonctionne
 """
 
+import importlib
 import unittest
+from unittest import mock
 
+from ares.core import metrics
 from ares.core.run_pipeline import main as run_pipeline
+from ares.tools import exec_result
+from ares.tools.exec_result import ExecResult
+
+rp = importlib.import_module("ares.core.run_pipeline")  # le paquet expose main() sous ce nom
 
 
 class TestRunPipeline(unittest.TestCase):
@@ -22,6 +29,48 @@ class TestRunPipeline(unittest.TestCase):
 
         self.assertTrue(success, "L'exécution de la pipeline a échoué.")
 
+    def test_unknown_segment_aborts_whole_utterance(self):
+        cube = {"name": "ajouter_cube", "operator": "mesh.primitive_cube_add", "params": {}}
+        batch = mock.Mock(return_value={"success": 1, "failed": 0, "details": []})
+        with (
+            mock.patch.object(rp, "parse_utterance", return_value=[cube, None]),
+            mock.patch.object(rp, "execute_batch", batch),
+        ):
+            ok = run_pipeline("ajoute un cube et fais un truc", mode="text")
+
+        self.assertFalse(ok)
+        batch.assert_not_called()  # rien n'est exécuté: la scène reste intacte
+        last = exec_result.history(1)[0]
+        self.assertEqual(last.stage, "failed")
+        self.assertEqual(last.error, "fais un truc")
+
+    def test_deferred_retry_is_pending_then_reported(self):
+        cube = {"name": "ajouter_cube", "operator": "mesh.primitive_cube_add", "params": {}}
+        callbacks = []
+
+        def manager(intent, on_retry_done=None):
+            callbacks.append(on_retry_done)
+            return ExecResult("ajouter_cube", stage="retry_scheduled", failure="transient")
+
+        metrics.reset()
+        exec_result.clear_history()
+        with (
+            mock.patch.object(rp, "parse_utterance", return_value=[cube]),
+            mock.patch.object(rp, "run_with_manager", manager),
+        ):
+            self.assertFalse(run_pipeline("ajoute un cube", mode="text"))
+
+        # en attente: ni historique ni compteur d'échec
+        self.assertEqual(exec_result.history(), [])
+        self.assertEqual(metrics.snapshot()["counters"], {})
+
+        callbacks[0](ExecResult("ajouter_cube", ok=True, stage="resolver"))
+        last = exec_result.history(1)[0]
+        self.assertTrue(last.ok)
+        self.assertIn("parse", last.timings)  # timings du 1er passage conservés
+        self.assertEqual(metrics.snapshot()["counters"]["executions"], {"resolver": 1})
+        metrics.reset()
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,21 @@
+"""
+Test découpage d'énoncés multi-commandes (hors Blender).
+"""
+
+from ares.core.segmenter import split_utterance
+
+
+def test_split_on_sequencers():
+    assert split_utterance("ajoute un cube et mets-le en rouge puis rends l'image") == [
+        "ajoute un cube",
+        "mets-le en rouge",
+        "rends l'image",
+    ]
+    assert split_utterance("annule, ensuite ajoute un plan") == ["annule", "ajoute un plan"]
+    assert split_utterance("ajoute un cube; après ça annule") == ["ajoute un cube", "annule"]
+
+
+def test_decimals_and_single_command_untouched():
+    assert split_utterance("déplace de 2,5 en y") == ["déplace de 2,5 en y"]
+    assert split_utterance("ajoute un cube") == ["ajoute un cube"]
+    assert split_utterance("   ") == []
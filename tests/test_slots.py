@@ -0,0 +1,71 @@
+"""
+Test templates à slots typés (hors Blender).
+"""
+
+import math
+
+import pytest
+
+from ares.core.slots import COLOR_PALETTE, compile_slots
+
+INTENTS = [
+    {
+        "name": "changer_couleur",
+        "templates": ["change en {color}", "mets le en {color}", "couleur {color}"],
+        "operator": "context.object.active_material.diffuse_color",
+        "params": {"value": "{color}", "normalize": "color"},
+    },
+    {
+        "name": "rotation_axe",
+        "templates": ["tourne l’objet de {angle} degrés sur {axis}"],
+        "operator": "transform.rotate",
+        "params": {"value": "{angle}", "orient_axis": "{axis}"},
+    },
+    {
+        "name": "deplacer_axe",
+        "templates": ["déplace de {distance} en {axis}"],
+        "slots": {"distance": "number"},
+        "params": {"value": "{axis.vector}", "constraint_axis": "{axis.mask}", "d": "{distance}"},
+    },
+    {"name": "ajouter_cube", "phrase": "ajoute un cube"},
+]
+
+
+@pytest.fixture(scope="module")
+def matcher():
+    return compile_slots(INTENTS)
+
+
+def test_color_template_fills_rgba(matcher):
+    it = matcher.fill("Mets-le en ROUGE stp")
+    assert it["name"] == "changer_couleur"
+    assert it["params"] == {"value": COLOR_PALETTE["rouge"], "normalize": "color"}
+    assert it["slots"] == {"color": "rouge"}
+    assert matcher.fill("couleur verte")["params"]["value"] == COLOR_PALETTE["vert"]
+
+
+def test_angle_and_axis(matcher):
+    it = matcher.fill("tourne l'objet de 45 degrés sur z")
+    assert it["params"]["orient_axis"] == "Z"
+    assert math.isclose(it["params"]["value"], math.radians(45))
+
+
+def test_declared_number_and_axis_attributes(matcher):
+    it = matcher.fill("déplace de 2,5 en y")
+    assert it["params"] == {
+        "value": [0.0, 1.0, 0.0],
+        "constraint_axis": [False, True, False],
+        "d": 2.5,
+    }
+
+
+def test_no_match_and_plain_intents_ignored(matcher):
+    assert len(matcher) == 5
+    assert matcher.fill("change en fuchsia") is None
+    assert matcher.fill("ajoute un cube") is None
+    assert compile_slots([{"name": "x", "phrase": "x"}]) is None
+
+
+def test_unknown_slot_type_rejected():
+    with pytest.raises(ValueError):
+        compile_slots([{"name": "x", "templates": ["fais {truc}"]}])
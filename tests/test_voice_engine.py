@@ -0,0 +1,108 @@
+"""
+Test VoiceEngine – écoute par tranches et émission d'intent sur partiel (hors Blender).
+"""
+
+import types
+
+import pytest
+
+from ares.core import intent_parser
+from ares.core.incremental_matcher import IncrementalMatcher, PrefixTrie
+from ares.voice import voice_engine
+from ares.voice.voice_engine import VoiceEngine
+
+STD = [
+    {"name": "ajouter_cube", "phrase": "ajoute un cube", "params": {}},
+    {"name": "ajouter_subsurf", "phrase": "ajoute un modificateur subdivision", "params": {}},
+]
+
+
+class _WaitTimeout(Exception):
+    pass
+
+
+class _Audio:
+    def __init__(self, frame_data, sample_rate=16000, sample_width=2):
+        self.frame_data, self.sample_rate, self.sample_width = frame_data, sample_rate, sample_width
+
+
+class _Mic:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Recognizer:
+    """Micro scripté: une tranche audio par mot, puis silence."""
+
+    def __init__(self, engine, words, events):
+        self.engine, self.events = engine, events
+        self.script = [f"{w} ".encode() for w in words] + [None]
+
+    def adjust_for_ambient_noise(self, source, duration=0.5):
+        pass
+
+    def listen(self, source, timeout=None, phrase_time_limit=None):
+        self.events.append(("listen", phrase_time_limit))
+        if not self.script:
+            self.engine.listening = False  # fin du test: arrête la boucle
+            raise _WaitTimeout()
+        chunk = self.script.pop(0)
+        if chunk is None:
+            raise _WaitTimeout()  # silence: fin d'énoncé
+        return _Audio(chunk)
+
+    def recognize_google(self, audio, language=None):
+        return audio.frame_data.decode().strip()
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake_sr = types.SimpleNamespace(
+        WaitTimeoutError=_WaitTimeout,
+        AudioData=_Audio,
+        Recognizer=object,
+        Microphone=lambda device_index=None: _Mic(),
+    )
+    monkeypatch.setattr(voice_engine, "sr", fake_sr)
+    monkeypatch.setattr(VoiceEngine, "_init_whisper_backend", lambda self: None)
+    monkeypatch.setattr(intent_parser, "_language", intent_parser._language)  # restauré après
+    eng = VoiceEngine()
+    eng._incremental = IncrementalMatcher(PrefixTrie(STD))
+    eng.auto_execute = True
+    eng.listening = True
+    return eng
+
+
+def test_listen_loop_dispatches_before_end_of_utterance(engine, monkeypatch):
+    events = []
+    engine.recognizer = _Recognizer(engine, ["ajoute", "un", "modificateur", "subdivision"], events)
+    monkeypatch.setattr(
+        engine,
+        "_run_pipeline_on_main_thread",
+        lambda text, intent=None: events.append(("run", text, intent and intent["name"])),
+    )
+
+    engine._listen_loop()
+
+    runs = [e for e in events if e[0] == "run"]
+    assert runs == [("run", "ajoute un modificateur", "ajouter_subsurf")]  # pas de rejeu
+    # émis après la 3e tranche, avant la capture de "subdivision" et la fin d'énoncé
+    assert events.index(runs[0]) == 3
+    assert all(e[1] == engine.partial_chunk_s for e in events if e[0] == "listen")
+    assert engine.last_transcript == "ajoute un modificateur subdivision"
+    assert engine._early_intent is None and engine._incremental.emitted is None
+
+
+def test_final_phrase_runs_when_no_partial_matched(engine, monkeypatch):
+    runs = []
+    engine.recognizer = _Recognizer(engine, ["bonjour", "blender"], [])
+    monkeypatch.setattr(
+        engine, "_run_pipeline_on_main_thread", lambda text, intent=None: runs.append(text)
+    )
+
+    engine._listen_loop()
+
+    assert runs == ["bonjour blender"]